@@ -13,6 +13,8 @@ import uuid
 
 from crm.apps.contacts.models import Contact
 from crm.apps.deals.models import Deal
+from crm.shared.services.activity_statistics_service import invalidate_activity_statistics
+from crm.shared.services.export_cache_service import bump_export_generation
 
 User = get_user_model()
 
@@ -269,12 +271,14 @@ class Activity(models.Model):
         indexes = [
             models.Index(fields=['type']),
             models.Index(fields=['scheduled_at']),
+            models.Index(fields=['scheduled_at', 'id']),
             models.Index(fields=['owner']),
             models.Index(fields=['contact']),
             models.Index(fields=['deal']),
             models.Index(fields=['is_completed']),
             models.Index(fields=['priority']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['updated_at', 'id']),
         ]
 
     def __str__(self):
@@ -319,8 +323,25 @@ class Activity(models.Model):
             self.completed_at = None
             self.completion_notes = None
 
+        previous_owner_id = None
+        if not self._state.adding:
+            previous_owner_id = Activity.objects.all_objects().filter(
+                pk=self.pk
+            ).values_list('owner_id', flat=True).first()
+
         super().save(*args, **kwargs)
 
+        # Cached statistics of the old and new owner, and cached exports, are now stale
+        invalidate_activity_statistics(self.owner_id, previous_owner_id)
+        bump_export_generation('activities')
+
+    def delete(self, *args, **kwargs):
+        """Override delete to drop the owner's cached statistics and cached exports"""
+        result = super().delete(*args, **kwargs)
+        invalidate_activity_statistics(self.owner_id)
+        bump_export_generation('activities')
+        return result
+
     @property
     def is_overdue(self):
         """Check if activity is overdue"""
@@ -298,8 +298,10 @@ class ActivityDetailSerializer(BaseActivitySerializer):
         fields = BaseActivitySerializer.Meta.fields + ['comments']
 
     def get_comments(self, obj):
-        """Get activity comments"""
-        comments = obj.comments.order_by('created_at')
+        """Get activity comments (prefetched by ActivityViewSet.retrieve)"""
+        comments = getattr(obj, 'prefetched_comments', None)
+        if comments is None:
+            comments = obj.comments.select_related('author').order_by('created_at')
         return ActivityCommentSerializer(comments, many=True).data
 
 
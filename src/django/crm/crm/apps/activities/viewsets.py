@@ -5,7 +5,7 @@ Following SOLID principles and enterprise best practices
 
 from datetime import datetime, timedelta
 from django.contrib.auth import get_user_model
-from django.db.models import Q, Count, Sum, Avg
+from django.db.models import Q, Count, Sum, Avg, Prefetch
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, status, permissions
@@ -22,14 +22,17 @@ from .serializers import (
 )
 from ...shared.repositories.activity_repository import ActivityRepository
 from ...shared.services.activity_service import ActivityService
+from ...shared.services.activity_statistics_service import ALL_OWNERS, ActivityStatisticsService
 from crm.apps.contacts.models import Contact
 from crm.apps.deals.models import Deal
+from ...shared.pagination import KeysetOrPageNumberPagination
+from ...shared.query_profiles import QueryProfile, QueryProfileMixin
 from ...shared.authentication.permissions import ActivityPermission, IsAdminUser
 
 User = get_user_model()
 
 
-class ActivityViewSet(viewsets.ModelViewSet):
+class ActivityViewSet(QueryProfileMixin, viewsets.ModelViewSet):
     """
     Activity ViewSet for comprehensive activity management
     Following SOLID principles and clean architecture
@@ -38,6 +41,7 @@ class ActivityViewSet(viewsets.ModelViewSet):
     # Repository and Service layers
     repository = ActivityRepository()
     service = ActivityService(repository)
+    statistics_service = ActivityStatisticsService()
 
     # Permission and authentication
     permission_classes = [ActivityPermission]
@@ -49,6 +53,41 @@ class ActivityViewSet(viewsets.ModelViewSet):
     ordering_fields = ['title', 'type', 'priority', 'scheduled_at', 'created_at', 'updated_at']
     ordering = ['scheduled_at']
 
+    # Opt-in keyset pagination (?pagination=cursor) over an indexed keyset
+    pagination_class = KeysetOrPageNumberPagination
+    keyset_ordering = ('scheduled_at', 'id')
+
+    # Relations each action's serializer reads, loaded in O(1) queries
+    query_profiles = {
+        'list': QueryProfile(select_related=('contact',)),
+        'retrieve': QueryProfile(
+            select_related=('contact', 'deal__contact', 'owner'),
+            prefetch_related=(
+                Prefetch(
+                    'comments',
+                    queryset=ActivityComment.objects.select_related('author').order_by('created_at'),
+                    to_attr='prefetched_comments'
+                ),
+            ),
+        ),
+        'update': QueryProfile(select_related=('contact', 'deal__contact', 'owner')),
+        'partial_update': QueryProfile(select_related=('contact', 'deal__contact', 'owner')),
+        'calendar': QueryProfile(
+            select_related=('contact', 'deal'),
+            only=(
+                'id', 'title', 'scheduled_at', 'type', 'priority', 'is_completed',
+                'contact', 'contact__first_name', 'contact__last_name',
+                'deal', 'deal__title',
+            ),
+        ),
+        'by_contact': QueryProfile(select_related=('contact',)),
+        'by_deal': QueryProfile(select_related=('contact',)),
+        'upcoming': QueryProfile(select_related=('contact',)),
+        'overdue': QueryProfile(select_related=('contact',)),
+        'today': QueryProfile(select_related=('contact',)),
+        'this_week': QueryProfile(select_related=('contact',)),
+    }
+
     def get_queryset(self):
         """
         Get activities based on user permissions
@@ -58,15 +97,18 @@ class ActivityViewSet(viewsets.ModelViewSet):
 
         # Admin users can see all activities
         if user.is_admin():
-            return Activity.objects.all()
+            queryset = Activity.objects.all()
 
         # Managers can see activities of their team (implementation depends on requirements)
         # For now, managers see their own activities
-        if user.is_manager():
-            return Activity.objects.filter(owner=user)
+        elif user.is_manager():
+            queryset = Activity.objects.filter(owner=user)
 
         # Regular users only see their own activities
-        return Activity.objects.filter(owner=user)
+        else:
+            queryset = Activity.objects.filter(owner=user)
+
+        return self.apply_query_profile(queryset)
 
     def get_serializer_class(self):
         """
@@ -124,7 +166,7 @@ class ActivityViewSet(viewsets.ModelViewSet):
         """
         pk = self.kwargs.get('pk')
         try:
-            activity = Activity.objects.get(pk=pk)
+            activity = self.apply_query_profile(Activity.objects.all()).get(pk=pk)
         except Activity.DoesNotExist:
             raise NotFound('Activity not found.')
 
@@ -418,70 +460,32 @@ class ActivityViewSet(viewsets.ModelViewSet):
         Following Single Responsibility Principle
         """
         user = request.user
-        queryset = self.get_queryset()
-
-        # Basic statistics
-        total_activities = queryset.count()
-        completed_activities = queryset.filter(is_completed=True).count()
-        pending_activities = queryset.filter(is_completed=False, is_cancelled=False).count()
-        cancelled_activities = queryset.filter(is_cancelled=True).count()
-        overdue_activities = queryset.filter(
-            scheduled_at__lt=timezone.now(),
-            is_completed=False,
-            is_cancelled=False
-        ).count()
-
-        # Completion rate
-        completion_rate = (completed_activities / total_activities * 100) if total_activities > 0 else 0
-
-        # Activities by type
-        activities_by_type = {}
-        for activity_type in Activity.ACTIVITY_TYPES:
-            type_name = activity_type[0]
-            type_display = activity_type[1]
-            count = queryset.filter(type=type_name).count()
-            activities_by_type[type_name] = {
-                'display': type_display,
-                'count': count
-            }
-
-        # Activities by priority
-        activities_by_priority = {}
-        for priority_choice in Activity.PRIORITY_CHOICES:
-            priority_name = priority_choice[0]
-            priority_display = priority_choice[1]
-            count = queryset.filter(priority=priority_name).count()
-            activities_by_priority[priority_name] = {
-                'display': priority_display,
-                'count': count
-            }
-
-        # Activities this week and month
-        today = timezone.now().date()
-        week_start = today - timedelta(days=today.weekday())
-        month_start = today.replace(day=1)
+        scope = ALL_OWNERS if user.is_admin() else user.id
+        stats = self.statistics_service.get_statistics(self.get_queryset(), scope)
 
-        activities_this_week = queryset.filter(
-            scheduled_at__date__gte=week_start,
-            scheduled_at__date__lte=today
-        ).count()
+        by_type = self.statistics_service.by_type(stats)
+        activities_by_type = {
+            type_name: {'display': type_display, 'count': by_type.get(type_name, 0)}
+            for type_name, type_display in Activity.ACTIVITY_TYPES
+        }
 
-        activities_this_month = queryset.filter(
-            scheduled_at__date__gte=month_start,
-            scheduled_at__date__lte=today
-        ).count()
+        by_priority = self.statistics_service.by_priority(stats)
+        activities_by_priority = {
+            priority_name: {'display': priority_display, 'count': by_priority.get(priority_name, 0)}
+            for priority_name, priority_display in Activity.PRIORITY_CHOICES
+        }
 
         return Response({
-            'total_activities': total_activities,
-            'completed_activities': completed_activities,
-            'pending_activities': pending_activities,
-            'cancelled_activities': cancelled_activities,
-            'overdue_activities': overdue_activities,
-            'completion_rate': round(completion_rate, 2),
+            'total_activities': stats['total'],
+            'completed_activities': stats['completed'],
+            'pending_activities': stats['pending'],
+            'cancelled_activities': stats['cancelled'],
+            'overdue_activities': stats['overdue'],
+            'completion_rate': self.statistics_service.completion_rate(stats),
             'activities_by_type': activities_by_type,
             'activities_by_priority': activities_by_priority,
-            'activities_this_week': activities_this_week,
-            'activities_this_month': activities_this_month
+            'activities_this_week': stats['scheduled_this_week'],
+            'activities_this_month': stats['scheduled_this_month']
         })
 
     @action(detail=False, methods=['get'])
@@ -10,6 +10,8 @@ from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 import uuid
 
+from crm.shared.services.export_cache_service import bump_export_generation
+
 
 class UserManager(BaseUserManager):
     """Custom User Manager following Repository Pattern"""
@@ -179,6 +181,9 @@ class User(AbstractUser):
         self.full_clean()
         super().save(*args, **kwargs)
 
+        # Cached exports of users (and of the deals and activities naming them) are now stale
+        bump_export_generation('users')
+
     def has_role(self, role):
         """Check if user has specific role"""
         return self.role == role
@@ -16,6 +16,7 @@ import structlog
 from .models import UserProfile
 from .audit_logging import audit_logger, AuditEventType
 from shared.repositories.simple_cache import SimpleCache, CachedRepositoryMixin
+from shared.repositories.user_repository import UserRepository
 
 User = get_user_model()
 logger = structlog.get_logger(__name__)
@@ -770,6 +771,7 @@ class BulkUserOperationService:
     def __init__(self):
         self.audit_logger = audit_logger
         self.user_management_service = UserManagementService()
+        self.user_repository = UserRepository()
 
     def bulk_activate_users(self, user_ids, requesting_user, request=None):
         """
@@ -829,9 +831,15 @@ class BulkUserOperationService:
         updated_count = 0
         failed_users = []
 
+        # Load all target users with one query; instances are saved below,
+        # so they must come from the database rather than the cache
+        users = {user.id: user for user in self.user_repository.get_many_by_ids(user_ids, use_cache=False)}
+
         for user_id in user_ids:
             try:
-                user = User.objects.get(id=user_id)
+                user = users.get(user_id)
+                if user is None:
+                    raise User.DoesNotExist
 
                 # Check permissions
                 if not self.user_management_service.can_access_user(requesting_user, user):
@@ -847,12 +855,16 @@ class BulkUserOperationService:
                 if operation == 'activate':
                     user.is_active = True
                     user.save()
+                    self.user_repository.clear_user_cache(user)
                     updated_count += 1
                 elif operation == 'deactivate':
                     user.is_active = False
                     user.save()
+                    self.user_repository.clear_user_cache(user)
                     updated_count += 1
                 elif operation == 'delete':
+                    # Clear first: delete() resets the primary key
+                    self.user_repository.clear_user_cache(user)
                     user.delete()
                     updated_count += 1
 
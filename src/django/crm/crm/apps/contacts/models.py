@@ -12,15 +12,43 @@ from django.utils import timezone
 import uuid
 import re
 
+from crm.shared.services.export_cache_service import bump_export_generation
+
 User = get_user_model()
 
 
-class AllContactManager(models.Manager):
+# Columns of the latest activity carried by with_latest_activity()
+LATEST_ACTIVITY_FIELDS = ['id', 'type', 'title', 'scheduled_at', 'is_completed', 'is_cancelled']
+
+
+class ContactQuerySet(models.QuerySet):
+    """Contact QuerySet with annotations replacing per-row relation queries"""
+
+    def with_deal_stats(self):
+        """Annotate deal count and total deal value (read by get_deals_count/get_total_deal_value)"""
+        # Archived deals are hidden by the deals manager, so leave them out here too
+        live_deals = models.Q(deals__is_archived=False)
+        return self.annotate(
+            annotated_deals_count=models.Count('deals', filter=live_deals),
+            annotated_total_deal_value=models.Sum('deals__value', filter=live_deals),
+        )
+
+    def with_latest_activity(self):
+        """Annotate the latest activity's columns with correlated subqueries (read by get_latest_activity)"""
+        activity_model = self.model._meta.get_field('activities').related_model
+        latest = activity_model.objects.filter(contact=models.OuterRef('pk')).order_by('-created_at')
+        return self.annotate(**{
+            f'latest_activity_{field}': models.Subquery(latest.values(field)[:1])
+            for field in LATEST_ACTIVITY_FIELDS
+        })
+
+
+class AllContactManager(models.Manager.from_queryset(ContactQuerySet)):
     """Manager for all contacts including soft-deleted ones"""
     pass
 
 
-class ContactManager(models.Manager):
+class ContactManager(models.Manager.from_queryset(ContactQuerySet)):
     """Custom Contact Manager implementing Repository Pattern"""
 
     def get_queryset(self):
@@ -246,6 +274,8 @@ class Contact(models.Model):
             models.Index(fields=['company']),
             models.Index(fields=['owner']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['updated_at', 'id']),
             models.Index(fields=['is_active']),
             models.Index(fields=['tags']),
         ]
@@ -282,6 +312,9 @@ class Contact(models.Model):
         self.full_clean()
         super().save(*args, **kwargs)
 
+        # Cached exports of contacts (and of the deals and activities naming them) are now stale
+        bump_export_generation('contacts')
+
     def delete(self, using=None, keep_parents=False):
         """Soft delete implementation"""
         self.is_deleted = True
@@ -312,16 +345,32 @@ class Contact(models.Model):
 
     def get_deals_count(self):
         """Get number of deals associated with this contact"""
+        if hasattr(self, 'annotated_deals_count'):
+            return self.annotated_deals_count
         return self.deals.count()
 
     def get_total_deal_value(self):
         """Get total value of all deals for this contact"""
+        if hasattr(self, 'annotated_total_deal_value'):
+            return self.annotated_total_deal_value or 0
         return self.deals.aggregate(
             total=models.Sum('value')
         )['total'] or 0
 
     def get_latest_activity(self):
-        """Get the most recent activity for this contact"""
+        """
+        Get the most recent activity for this contact
+
+        On contacts loaded with with_latest_activity() this is an unsaved
+        Activity carrying only LATEST_ACTIVITY_FIELDS, built without a query.
+        """
+        if hasattr(self, 'latest_activity_id'):
+            if self.latest_activity_id is None:
+                return None
+            activity_model = self.activities.model
+            return activity_model(contact=self, **{
+                field: getattr(self, f'latest_activity_{field}') for field in LATEST_ACTIVITY_FIELDS
+            })
         return self.activities.order_by('-created_at').first()
 
 
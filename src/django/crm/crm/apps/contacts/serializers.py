@@ -7,7 +7,6 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.core.validators import validate_email, URLValidator, RegexValidator
-from django.db.models import Sum
 from django.utils.translation import gettext_lazy as _
 
 from .models import Contact, ContactInteraction
@@ -417,13 +416,11 @@ class ContactDetailSerializer(BaseContactSerializer):
 
     def get_deals_count(self, obj):
         """Get number of deals associated with this contact"""
-        return obj.deals.count()
+        return obj.get_deals_count()
 
     def get_total_deal_value(self, obj):
         """Get total value of all deals for this contact"""
-        total = obj.deals.aggregate(
-            total=Sum('value')
-        )['total'] or 0
+        total = obj.get_total_deal_value()
         return f"{total:.2f}"
 
     def get_latest_activity(self, obj):
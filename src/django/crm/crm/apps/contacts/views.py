@@ -22,8 +22,8 @@ class ContactListCreateView(generics.ListCreateAPIView):
     serializer_class = SimpleContactSerializer
 
     def get_queryset(self):
-        """Only return contacts for the authenticated user"""
-        return Contact.objects.filter(owner=self.request.user)
+        """Only return contacts for the authenticated user, with deal stats for the serializer"""
+        return Contact.objects.filter(owner=self.request.user).with_deal_stats()
 
     def list(self, request, *args, **kwargs):
         """Override list to add pagination metadata"""
@@ -50,8 +50,8 @@ class ContactDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = SimpleContactSerializer
 
     def get_queryset(self):
-        """Only return contacts for the authenticated user"""
-        return Contact.objects.filter(owner=self.request.user)
+        """Only return contacts for the authenticated user, with deal stats for the serializer"""
+        return Contact.objects.filter(owner=self.request.user).with_deal_stats()
 
     def perform_destroy(self, instance):
         """Override to implement soft delete with business logic validation"""
@@ -20,6 +20,7 @@ from .serializers import (
 )
 from ...shared.repositories.contact_repository import ContactRepository
 from ...shared.services.contact_service import ContactService
+from ...shared.pagination import KeysetOrPageNumberPagination
 from ...shared.authentication.permissions import ContactPermission, IsAdminUser
 
 User = get_user_model()
@@ -45,6 +46,10 @@ class ContactViewSet(viewsets.ModelViewSet):
     ordering_fields = ['first_name', 'last_name', 'company', 'created_at', 'updated_at']
     ordering = ['last_name', 'first_name']
 
+    # Opt-in keyset pagination (?pagination=cursor) over an indexed keyset
+    pagination_class = KeysetOrPageNumberPagination
+    keyset_ordering = ('-created_at', '-id')
+
     def get_queryset(self):
         """
         Get contacts based on user permissions
@@ -130,8 +135,12 @@ class ContactViewSet(viewsets.ModelViewSet):
         Following SOLID principles for proper access control
         """
         pk = self.kwargs.get('pk')
+        queryset = Contact.objects.all()
+        if self.action == 'retrieve':
+            # ContactDetailSerializer reads these instead of querying per field
+            queryset = queryset.with_deal_stats().with_latest_activity()
         try:
-            contact = Contact.objects.get(pk=pk)
+            contact = queryset.get(pk=pk)
         except Contact.DoesNotExist:
             raise NotFound('Contact not found.')
 
@@ -255,18 +264,21 @@ class ContactViewSet(viewsets.ModelViewSet):
         updated_count = 0
 
         try:
-            for contact_id in contact_ids:
-                contact = Contact.objects.get(id=contact_id)
+            contacts = self.repository.get_many_by_ids(contact_ids)
+            missing_ids = set(contact_ids) - {contact.id for contact in contacts}
+            if missing_ids:
+                raise Contact.DoesNotExist(f"Contacts not found: {sorted(missing_ids)}")
 
+            for contact in contacts:
                 # Check permissions
-                if not user.is_admin() and contact.owner != user:
+                if not user.is_admin() and contact.owner_id != user.id:
                     continue
 
                 if operation == 'delete':
-                    self.service.soft_delete_contact(contact_id, user.id)
+                    self.service.soft_delete_contact(contact.id, user.id)
                     updated_count += 1
                 elif operation == 'restore':
-                    self.service.restore_contact(contact_id, user.id)
+                    self.service.restore_contact(contact.id, user.id)
                     updated_count += 1
                 elif operation == 'activate':
                     contact.is_active = True
@@ -3,7 +3,7 @@ Deal Models - Sales Pipeline Management
 Following SOLID principles and enterprise best practices
 """
 
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -13,9 +13,31 @@ from decimal import Decimal
 import uuid
 
 from crm.apps.contacts.models import Contact
+from crm.shared.services.export_cache_service import bump_export_generation
 
 User = get_user_model()
 
+# Deal fields that decide which DealDailySnapshot row a deal counts towards
+SNAPSHOT_FIELDS = ('owner_id', 'stage', 'currency', 'value', 'probability', 'is_archived')
+
+
+def snapshot_contribution(fields):
+    """
+    Group and amounts a deal adds to the daily pipeline snapshot
+
+    Args:
+        fields: Mapping with the SNAPSHOT_FIELDS values of one deal
+
+    Returns:
+        Tuple of ((owner_id, stage, currency), value, weighted value),
+        or None for archived deals
+    """
+    if fields['is_archived']:
+        return None
+    value = Decimal(fields['value'])
+    weighted = (value * fields['probability'] / 100).quantize(Decimal('0.01'))
+    return (fields['owner_id'], fields['stage'], fields['currency']), value, weighted
+
 
 class DealManager(models.Manager):
     """Custom Deal Manager implementing Repository Pattern"""
@@ -79,6 +101,16 @@ class Deal(models.Model):
         ('closed_lost', _('Closed Lost')),
     ]
 
+    # Default probability a deal gets when it moves into a stage
+    STAGE_PROBABILITIES = {
+        'prospect': 10,
+        'qualified': 25,
+        'proposal': 50,
+        'negotiation': 75,
+        'closed_won': 100,
+        'closed_lost': 0,
+    }
+
     CURRENCY_CHOICES = [
         ('USD', _('US Dollar')),
         ('EUR', _('Euro')),
@@ -225,6 +257,8 @@ class Deal(models.Model):
             models.Index(fields=['contact']),
             models.Index(fields=['owner']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['updated_at', 'id']),
             models.Index(fields=['value']),
         ]
 
@@ -254,31 +288,66 @@ class Deal(models.Model):
         """Override save to ensure data integrity and track changes"""
         self.full_clean()
 
-        # Auto-set probability based on stage if not manually set
-        if not self._state.adding:  # Only for existing records
-            old_stage = Deal.objects.get(pk=self.pk).stage
-            if old_stage != self.stage:
-                self._update_probability_for_stage()
-                self._track_stage_change(old_stage)
-
-        # Set closed date when deal is won or lost
-        if self.stage in ['closed_won', 'closed_lost'] and not self.closed_date:
-            self.closed_date = timezone.now()
-
-        super().save(*args, **kwargs)
+        # The row, its stage history and today's snapshot change together or not at all
+        previous = None
+        with transaction.atomic():
+            # Auto-set probability based on stage if not manually set
+            if not self._state.adding:  # Only for existing records
+                # Archived deals are hidden by the default manager but can still be saved
+                previous = Deal.objects.all_objects().values(*SNAPSHOT_FIELDS).get(pk=self.pk)
+                old_stage = previous['stage']
+                if old_stage != self.stage:
+                    self._update_probability_for_stage()
+                    self._track_stage_change(old_stage)
+
+            # Set closed date when deal is won or lost
+            if self.stage in ['closed_won', 'closed_lost'] and not self.closed_date:
+                self.closed_date = timezone.now()
+
+            super().save(*args, **kwargs)
+
+            self._update_daily_snapshot(previous, self._snapshot_fields())
+
+        # Cached pipeline rollups of the old and new owner, and cached exports, are now stale
+        # (imported here so loading the model does not require numpy)
+        from crm.shared.services.pipeline_analytics_service import invalidate_pipeline_statistics
+        invalidate_pipeline_statistics(self.owner_id, previous and previous['owner_id'])
+        bump_export_generation('deals')
+
+    def delete(self, *args, **kwargs):
+        """Override delete to keep snapshots, cached rollups and column stores in sync"""
+        previous = self._snapshot_fields()
+        result = super().delete(*args, **kwargs)
+        self._update_daily_snapshot(previous, None)
+        from crm.shared.deal_column_store import bump_deal_column_generation
+        from crm.shared.services.pipeline_analytics_service import invalidate_pipeline_statistics
+        invalidate_pipeline_statistics(self.owner_id)
+        bump_deal_column_generation()
+        bump_export_generation('deals')
+        return result
+
+    def _snapshot_fields(self):
+        """Current values of the fields the daily snapshot is keyed and summed on"""
+        return {field: getattr(self, field) for field in SNAPSHOT_FIELDS}
+
+    @staticmethod
+    def _update_daily_snapshot(before, after):
+        """Move a deal's contribution between today's DealDailySnapshot rows"""
+        before = snapshot_contribution(before) if before else None
+        after = snapshot_contribution(after) if after else None
+        if before == after:
+            return
+        if before:
+            group, value, weighted = before
+            DealDailySnapshot.apply_delta(group, -1, -value, -weighted)
+        if after:
+            group, value, weighted = after
+            DealDailySnapshot.apply_delta(group, 1, value, weighted)
 
     def _update_probability_for_stage(self):
         """Update probability based on stage changes"""
-        stage_probabilities = {
-            'prospect': 10,
-            'qualified': 25,
-            'proposal': 50,
-            'negotiation': 75,
-            'closed_won': 100,
-            'closed_lost': 0,
-        }
-        if self.stage in stage_probabilities:
-            self.probability = stage_probabilities[self.stage]
+        if self.stage in self.STAGE_PROBABILITIES:
+            self.probability = self.STAGE_PROBABILITIES[self.stage]
 
     def _track_stage_change(self, old_stage):
         """Track stage changes for pipeline analytics"""
@@ -410,3 +479,125 @@ class DealStageHistory(models.Model):
         return f"{self.deal.title}: {self.old_stage} → {self.new_stage}"
 
 
+
+
+class DealDailySnapshotManager(models.Manager):
+    """Point-in-time queries over the daily pipeline rollup"""
+
+    def as_of(self, as_of_date, owner_id=None):
+        """
+        Latest row per (owner, stage, currency) on or before a date
+
+        Rows are only written on days a group changes, so the state on a
+        date is the most recent row of each group up to that date.
+        """
+        queryset = self.filter(date__lte=as_of_date)
+        if owner_id is not None:
+            queryset = queryset.filter(owner_id=owner_id)
+        latest = self.filter(
+            owner_id=models.OuterRef('owner_id'),
+            stage=models.OuterRef('stage'),
+            currency=models.OuterRef('currency'),
+            date__lte=as_of_date
+        ).order_by('-date').values('date')[:1]
+        return queryset.filter(date=models.Subquery(latest))
+
+
+class DealDailySnapshot(models.Model):
+    """
+    Daily pipeline rollup per owner, stage and currency
+
+    Each row holds the state of its group at the end of ``date``. Deal.save
+    and Deal.delete keep today's rows current; the backfill_deal_snapshots
+    command rebuilds history from DealStageHistory.
+    """
+
+    date = models.DateField(_('date'))
+
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='deal_snapshots',
+        verbose_name=_('owner')
+    )
+
+    stage = models.CharField(
+        _('stage'),
+        max_length=20,
+        choices=Deal.STAGE_CHOICES
+    )
+
+    currency = models.CharField(
+        _('currency'),
+        max_length=3,
+        choices=Deal.CURRENCY_CHOICES
+    )
+
+    deal_count = models.IntegerField(_('deal count'), default=0)
+
+    total_value = models.DecimalField(
+        _('total value'),
+        max_digits=18,
+        decimal_places=2,
+        default=Decimal('0')
+    )
+
+    weighted_value = models.DecimalField(
+        _('weighted value'),
+        max_digits=18,
+        decimal_places=2,
+        default=Decimal('0'),
+        help_text=_('Sum of value x probability / 100')
+    )
+
+    objects = DealDailySnapshotManager()
+
+    class Meta:
+        db_table = 'deal_daily_snapshots'
+        verbose_name = _('Deal Daily Snapshot')
+        verbose_name_plural = _('Deal Daily Snapshots')
+        ordering = ['-date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['owner', 'stage', 'currency', 'date'],
+                name='unique_deal_snapshot_group_date'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['date']),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.owner_id} {self.stage} {self.currency}: {self.deal_count}"
+
+    @classmethod
+    def apply_delta(cls, group, deal_count, total_value, weighted_value, on_date=None):
+        """
+        Add a deal's contribution to (or remove it from) a group's row
+
+        The row for ``on_date`` is created from the group's previous row
+        the first time the group changes that day.
+
+        Args:
+            group: Tuple of (owner_id, stage, currency)
+            deal_count: +1 to add a deal, -1 to remove it
+            total_value: Signed value change
+            weighted_value: Signed weighted value change
+            on_date: Day to update, today by default
+        """
+        on_date = on_date or timezone.localdate()
+        owner_id, stage, currency = group
+
+        with transaction.atomic():
+            previous = cls.objects.filter(
+                owner_id=owner_id, stage=stage, currency=currency, date__lt=on_date
+            ).order_by('-date').values('deal_count', 'total_value', 'weighted_value').first()
+            snapshot, _ = cls.objects.get_or_create(
+                owner_id=owner_id, stage=stage, currency=currency, date=on_date,
+                defaults=previous or {}
+            )
+            cls.objects.filter(pk=snapshot.pk).update(
+                deal_count=models.F('deal_count') + deal_count,
+                total_value=models.F('total_value') + total_value,
+                weighted_value=models.F('weighted_value') + weighted_value
+            )
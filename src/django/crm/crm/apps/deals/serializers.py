@@ -301,8 +301,10 @@ class DealDetailSerializer(BaseDealSerializer):
         fields = BaseDealSerializer.Meta.fields + ['stage_history']
 
     def get_stage_history(self, obj):
-        """Get stage change history"""
-        history = obj.stage_history.order_by('-changed_at')
+        """Get stage change history (prefetched by DealViewSet.retrieve)"""
+        history = getattr(obj, 'prefetched_stage_history', None)
+        if history is None:
+            history = obj.stage_history.select_related('changed_by').order_by('-changed_at')
         return DealStageHistorySerializer(history, many=True).data
 
 
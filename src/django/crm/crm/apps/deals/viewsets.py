@@ -6,7 +6,7 @@ Following SOLID principles and enterprise best practices
 from decimal import Decimal
 from datetime import date, datetime, timedelta
 from django.contrib.auth import get_user_model
-from django.db.models import Q, Count, Sum, Avg
+from django.db.models import Q, Count, Prefetch
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, status, permissions
@@ -23,13 +23,19 @@ from .serializers import (
 )
 from ...shared.repositories.deal_repository import DealRepository
 from ...shared.services.deal_service import DealService
+from ...shared.services.forecast_service import ForecastService
+from ...shared.services.funnel_analytics_service import FunnelAnalyticsService
+from ...shared.services.pipeline_analytics_service import ALL_OWNERS, PipelineAnalyticsService
 from crm.apps.contacts.models import Contact
+from ...shared.pagination import KeysetOrPageNumberPagination
+from ...shared.query_profiles import QueryProfile, QueryProfileMixin
+from ...shared.deal_column_store import get_deal_column_store
 from ...shared.authentication.permissions import DealPermission, IsAdminUser
 
 User = get_user_model()
 
 
-class DealViewSet(viewsets.ModelViewSet):
+class DealViewSet(QueryProfileMixin, viewsets.ModelViewSet):
     """
     Deal ViewSet for comprehensive deal management
     Following SOLID principles and clean architecture
@@ -38,6 +44,9 @@ class DealViewSet(viewsets.ModelViewSet):
     # Repository and Service layers
     repository = DealRepository()
     service = DealService(repository)
+    pipeline_analytics = PipelineAnalyticsService()
+    forecast_service = ForecastService()
+    funnel_analytics = FunnelAnalyticsService()
 
     # Permission and authentication
     permission_classes = [DealPermission]
@@ -49,6 +58,29 @@ class DealViewSet(viewsets.ModelViewSet):
     ordering_fields = ['title', 'value', 'stage', 'probability', 'expected_close_date', 'created_at', 'updated_at']
     ordering = ['-created_at']
 
+    # Opt-in keyset pagination (?pagination=cursor) over an indexed keyset
+    pagination_class = KeysetOrPageNumberPagination
+    keyset_ordering = ('-created_at', '-id')
+
+    # Relations each action's serializer reads, loaded in O(1) queries
+    query_profiles = {
+        'list': QueryProfile(select_related=('contact',)),
+        'retrieve': QueryProfile(
+            select_related=('contact', 'owner'),
+            prefetch_related=(
+                Prefetch(
+                    'stage_history',
+                    queryset=DealStageHistory.objects.select_related('changed_by'),
+                    to_attr='prefetched_stage_history'
+                ),
+            ),
+        ),
+        'update': QueryProfile(select_related=('contact', 'owner')),
+        'partial_update': QueryProfile(select_related=('contact', 'owner')),
+        'closing_soon': QueryProfile(select_related=('contact',)),
+        'stalled': QueryProfile(select_related=('contact',)),
+    }
+
     def get_queryset(self):
         """
         Get deals based on user permissions
@@ -58,15 +90,18 @@ class DealViewSet(viewsets.ModelViewSet):
 
         # Admin users can see all deals
         if user.is_admin():
-            return Deal.objects.all()
+            queryset = Deal.objects.all()
 
         # Managers can see deals of their team (implementation depends on requirements)
         # For now, managers see their own deals
-        if user.is_manager():
-            return Deal.objects.filter(owner=user)
+        elif user.is_manager():
+            queryset = Deal.objects.filter(owner=user)
 
         # Regular users only see their own deals
-        return Deal.objects.filter(owner=user)
+        else:
+            queryset = Deal.objects.filter(owner=user)
+
+        return self.apply_query_profile(queryset)
 
     def get_serializer_class(self):
         """
@@ -124,7 +159,7 @@ class DealViewSet(viewsets.ModelViewSet):
         """
         pk = self.kwargs.get('pk')
         try:
-            deal = Deal.objects.get(pk=pk)
+            deal = self.apply_query_profile(Deal.objects.all()).get(pk=pk)
         except Deal.DoesNotExist:
             raise NotFound('Deal not found.')
 
@@ -329,111 +364,35 @@ class DealViewSet(viewsets.ModelViewSet):
         Following Single Responsibility Principle
         """
         user = request.user
-        queryset = self.get_queryset()
+        scope = ALL_OWNERS if user.is_admin() else user.id
+        return Response(self.pipeline_analytics.get_pipeline_statistics(self.get_queryset(), scope))
 
-        # Basic statistics
-        total_deals = queryset.count()
-        total_value = queryset.aggregate(total=Sum('value'))['total'] or Decimal('0')
-        avg_deal_size = queryset.aggregate(avg=Avg('value'))['avg'] or Decimal('0')
-
-        # Win rate calculation
-        won_deals = queryset.filter(stage='closed_won').count()
-        lost_deals = queryset.filter(stage='closed_lost').count()
-        total_closed = won_deals + lost_deals
-        win_rate = (won_deals / total_closed * 100) if total_closed > 0 else 0
-
-        # Deals by stage
-        deals_by_stage = {}
-        for stage_choice in Deal.STAGE_CHOICES:
-            stage_name = stage_choice[0]
-            stage_display = stage_choice[1]
-            count = queryset.filter(stage=stage_name).count()
-            value = queryset.filter(stage=stage_name).aggregate(total=Sum('value'))['total'] or Decimal('0')
-            deals_by_stage[stage_name] = {
-                'display': stage_display,
-                'count': count,
-                'value': str(value)
-            }
-
-        # Average sales cycle (in days)
-        closed_deals_with_dates = queryset.filter(
-            stage__in=['closed_won', 'closed_lost'],
-            closed_date__isnull=False
-        )
-        avg_sales_cycle = 0
-        if closed_deals_with_dates.exists():
-            total_cycle_days = sum(
-                (deal.closed_date.date() - deal.created_at.date()).days
-                for deal in closed_deals_with_dates
+    @action(detail=False, methods=['get'])
+    def funnel(self, request):
+        """
+        Get stage-to-stage funnel analytics for a date window
+        Following Single Responsibility Principle
+        """
+        user = request.user
+        try:
+            end_date = date.fromisoformat(request.query_params.get('end_date') or timezone.localdate().isoformat())
+            start_date = date.fromisoformat(
+                request.query_params.get('start_date') or (end_date - timedelta(days=89)).isoformat()
             )
-            avg_sales_cycle = total_cycle_days // closed_deals_with_dates.count()
-
-        # Deals by month (last 6 months)
-        deals_by_month = {}
-        for i in range(6):
-            month_date = date.today().replace(day=1) - timedelta(days=i*30)
-            month_str = month_date.strftime('%Y-%m')
-            month_deals = queryset.filter(created_at__year=month_date.year, created_at__month=month_date.month)
-            deals_by_month[month_str] = {
-                'count': month_deals.count(),
-                'value': str(month_deals.aggregate(total=Sum('value'))['total'] or Decimal('0'))
-            }
-
-        # Top performing stages (by conversion rate)
-        top_performing_stages = []
-        for stage_name, stage_data in deals_by_stage.items():
-            if stage_name not in ['closed_won', 'closed_lost']:
-                conversion_data = self._calculate_stage_conversion_rate(queryset, stage_name)
-                top_performing_stages.append({
-                    'stage': stage_name,
-                    'display': stage_data['display'],
-                    'conversion_rate': conversion_data['conversion_rate'],
-                    'total_deals': conversion_data['total_deals'],
-                    'won_deals': conversion_data['won_deals']
-                })
-
-        # Sort by conversion rate
-        top_performing_stages.sort(key=lambda x: x['conversion_rate'], reverse=True)
-
-        return Response({
-            'total_deals': total_deals,
-            'total_value': str(total_value),
-            'average_deal_size': str(avg_deal_size),
-            'win_rate': round(win_rate, 2),
-            'average_sales_cycle': avg_sales_cycle,
-            'deals_by_stage': deals_by_stage,
-            'deals_by_month': deals_by_month,
-            'top_performing_stages': top_performing_stages[:5]  # Top 5
-        })
-
-    def _calculate_stage_conversion_rate(self, queryset, stage_name):
-        """Helper method to calculate conversion rate for a stage"""
-        stage_deals = queryset.filter(stage=stage_name)
-        total_stage_deals = stage_deals.count()
-
-        if total_stage_deals == 0:
-            return {'conversion_rate': 0, 'total_deals': 0, 'won_deals': 0}
-
-        # Find deals that moved from this stage to closed_won
-        stage_transitions = DealStageHistory.objects.filter(
-            old_stage=stage_name,
-            deal__in=stage_deals
-        )
-
-        # Get deals that eventually won
-        won_deal_ids = Deal.objects.filter(
-            stage='closed_won',
-            id__in=stage_transitions.values('deal_id')
-        ).values_list('id', flat=True)
+        except ValueError:
+            raise ValidationError('Invalid date format. Use YYYY-MM-DD.')
+        if start_date > end_date:
+            raise ValidationError('End date must be after start date.')
 
-        won_count = len(set(won_deal_ids))
-        conversion_rate = (won_count / total_stage_deals) * 100 if total_stage_deals > 0 else 0
+        owner_ids = [user.id]
+        if user.is_admin():
+            owner_param = request.query_params.get('owner_ids')
+            try:
+                owner_ids = [int(owner_id) for owner_id in owner_param.split(',')] if owner_param else None
+            except ValueError:
+                raise ValidationError('owner_ids must be a comma-separated list of user ids.')
 
-        return {
-            'conversion_rate': round(conversion_rate, 2),
-            'total_deals': total_stage_deals,
-            'won_deals': won_count
-        }
+        return Response(self.funnel_analytics.get_funnel(start_date, end_date, owner_ids))
 
     @action(detail=False, methods=['get'])
     def forecast(self, request):
@@ -443,6 +402,16 @@ class DealViewSet(viewsets.ModelViewSet):
         """
         user = request.user
         period = request.query_params.get('period', 'current_quarter')
+        mode = request.query_params.get('mode', 'standard')
+        if mode not in ('standard', 'simulation'):
+            raise ValidationError('mode must be "standard" or "simulation".')
+        try:
+            iterations = int(request.query_params['iterations']) if 'iterations' in request.query_params else None
+            seed = int(request.query_params['seed']) if 'seed' in request.query_params else None
+        except ValueError:
+            raise ValidationError('iterations and seed must be integers.')
+        if iterations is not None and iterations <= 0:
+            raise ValidationError('iterations must be positive.')
         queryset = self.get_queryset()
 
         # Calculate date range based on period
@@ -480,63 +449,26 @@ class DealViewSet(viewsets.ModelViewSet):
             end_date = date(today.year + 1, 12, 31)
 
         # Filter deals by expected close date in period
-        period_deals = queryset.filter(
-            expected_close_date__range=[start_date, end_date],
-            stage__in=['prospect', 'qualified', 'proposal', 'negotiation']
-        )
-
-        # Calculate forecast metrics
-        deals_count = period_deals.count()
-        forecast_value = period_deals.aggregate(total=Sum('value'))['total'] or Decimal('0')
+        period_deals = queryset.filter(expected_close_date__range=[start_date, end_date])
 
-        # Weighted value based on probability
-        weighted_value = sum(
-            deal.value * (deal.probability / 100)
-            for deal in period_deals
-        )
-
-        # Confidence level based on deal stages and probabilities
-        if deals_count == 0:
-            confidence_level = 0
+        # One query (or the column store) loads the open pipeline; metrics are computed in memory
+        store = get_deal_column_store()
+        if store is not None:
+            owner_id = None if user.is_admin() else user.id
+            pipeline = self.forecast_service.load_pipeline_from_store(store, owner_id, start_date, end_date)
         else:
-            avg_probability = period_deals.aggregate(avg=Avg('probability'))['avg'] or 0
-            # Adjust confidence based on stage distribution
-            high_confidence_deals = period_deals.filter(stage__in=['negotiation', 'proposal']).count()
-            stage_confidence = (high_confidence_deals / deals_count) * 20 if deals_count > 0 else 0
-            confidence_level = min(100, avg_probability + stage_confidence)
-
-        # Risk factors
-        risk_factors = []
-
-        # Check for high-value, low-probability deals
-        risky_deals = period_deals.filter(value__gt=forecast_value / deals_count * 2, probability__lt=30)
-        if risky_deals.exists():
-            risk_factors.append(f"{risky_deals.count()} high-value, low-probability deals")
-
-        # Check for deals closing soon
-        soon_closing = period_deals.filter(
-            expected_close_date__lte=today + timedelta(days=7),
-            stage__in=['prospect', 'qualified']
-        )
-        if soon_closing.exists():
-            risk_factors.append(f"{soon_closing.count()} deals closing soon with low stage")
-
-        # Check for stale deals
-        stale_threshold = today - timedelta(days=90)
-        stale_deals = period_deals.filter(created_at__date__lt=stale_threshold)
-        if stale_deals.exists():
-            risk_factors.append(f"{stale_deals.count()} deals in pipeline for over 90 days")
-
-        return Response({
+            pipeline = self.forecast_service.load_pipeline(period_deals)
+        response = {
             'period': period,
             'start_date': start_date.isoformat(),
             'end_date': end_date.isoformat(),
-            'deals_count': deals_count,
-            'forecast_value': str(forecast_value),
-            'weighted_value': str(round(weighted_value, 2)),
-            'confidence_level': round(confidence_level, 2),
-            'risk_factors': risk_factors
-        })
+            'mode': mode,
+            **self.forecast_service.summarize(pipeline, today)
+        }
+        if mode == 'simulation':
+            response['simulation'] = self.forecast_service.simulate(pipeline, iterations=iterations, seed=seed)
+
+        return Response(response)
 
     @action(detail=True, methods=['get'])
     def activities(self, request, pk=None):
@@ -552,7 +484,7 @@ class DealViewSet(viewsets.ModelViewSet):
             raise PermissionDenied("You don't have permission to view activities for this deal.")
 
         from crm.apps.activities.models import Activity
-        activities = Activity.objects.filter(deal=deal).order_by('-created_at')
+        activities = Activity.objects.filter(deal=deal).select_related('contact').order_by('-created_at')
 
         # Serialize activities
         from crm.apps.activities.serializers import ActivitySummarySerializer
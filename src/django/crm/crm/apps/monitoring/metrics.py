@@ -522,6 +522,13 @@ class MetricsCollector:
             registry=self.registry
         )
 
+        self.cache_evictions = Counter(
+            'crm_cache_evictions_total',
+            'Total cache evictions',
+            ['cache_alias'],
+            registry=self.registry
+        )
+
     def collect_all(self) -> str:
         """
         Collect all metrics and return Prometheus-formatted output.
@@ -625,8 +632,48 @@ class MetricsCollector:
         except Exception as e:
             logger.error(f"Failed to update active users: {e}")
 
+    def record_cache_hit(self, cache_alias: str):
+        """Record cache hit."""
+        try:
+            self.cache_hits.labels(cache_alias=cache_alias).inc()
+        except Exception as e:
+            logger.error(f"Failed to record cache hit: {e}")
+
+    def record_cache_miss(self, cache_alias: str):
+        """Record cache miss."""
+        try:
+            self.cache_misses.labels(cache_alias=cache_alias).inc()
+        except Exception as e:
+            logger.error(f"Failed to record cache miss: {e}")
+
+    def record_cache_eviction(self, cache_alias: str):
+        """Record cache eviction."""
+        try:
+            self.cache_evictions.labels(cache_alias=cache_alias).inc()
+        except Exception as e:
+            logger.error(f"Failed to record cache eviction: {e}")
+
     @classmethod
     def initialize_default_metrics(cls):
         """Initialize default metrics on application startup."""
         # This class method can be called from app configuration
-        pass
\ No newline at end of file
+        pass
+
+
+_metrics_collector = None
+
+
+def get_metrics_collector() -> MetricsCollector:
+    """
+    Get the process-wide metrics collector.
+
+    Code outside the request cycle (repositories, caches) records runtime
+    metrics here so they land in the same registry as request metrics.
+
+    Returns:
+        MetricsCollector: Shared collector instance
+    """
+    global _metrics_collector
+    if _metrics_collector is None:
+        _metrics_collector = MetricsCollector()
+    return _metrics_collector
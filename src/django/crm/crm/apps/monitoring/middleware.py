@@ -48,8 +48,8 @@ class PerformanceMonitoringMiddleware(MiddlewareMixin):
 
         # Initialize metrics collector if available
         try:
-            from .metrics import MetricsCollector
-            self.metrics_collector = MetricsCollector()
+            from .metrics import get_metrics_collector
+            self.metrics_collector = get_metrics_collector()
         except ImportError:
             self.metrics_collector = None
 
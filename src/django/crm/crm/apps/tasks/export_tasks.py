@@ -4,31 +4,39 @@ Following SOLID principles and comprehensive export management
 """
 
 import csv
+import gzip
+import io
 import json
 import os
+import shutil
+import uuid
 import zipfile
 import logging
 import time
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
 from io import StringIO, BytesIO
-from typing import Dict, Any, List, Optional, Union, BinaryIO
+from itertools import chain, islice
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, TextIO, Union, BinaryIO
 from pathlib import Path
 
-import pandas as pd
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
-from django.db.models import Q
+from django.db.models import Q, QuerySet
 from django.utils import timezone
 from django.utils.text import slugify
-from celery import shared_task
+from celery import chord, shared_task
 
+from crm.shared.services.export_cache_service import ExportCacheService
 from .base_tasks import BaseTask, TaskStatus
+from crm.apps.tasks.models import ExportWatermark
 from .exceptions import (
+    TaskConfigurationError,
     TaskValidationError,
     TaskExecutionError,
     TaskTimeoutError,
@@ -39,6 +47,9 @@ from .exceptions import (
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Rows per worksheet in .xlsx files, header row included
+EXCEL_MAX_ROWS = 1048576
+
 User = get_user_model()
 
 
@@ -53,6 +64,9 @@ class ExportFormat(Enum):
     CSV = 'CSV'
     EXCEL = 'EXCEL'
     JSON = 'JSON'
+    JSONL = 'JSONL'
+    PARQUET = 'PARQUET'
+    ARROW = 'ARROW'
     PDF = 'PDF'
 
     def get_extension(self) -> str:
@@ -61,6 +75,9 @@ class ExportFormat(Enum):
             ExportFormat.CSV: '.csv',
             ExportFormat.EXCEL: '.xlsx',
             ExportFormat.JSON: '.json',
+            ExportFormat.JSONL: '.jsonl',
+            ExportFormat.PARQUET: '.parquet',
+            ExportFormat.ARROW: '.arrow',
             ExportFormat.PDF: '.pdf',
         }
         return extensions[self]
@@ -71,6 +88,9 @@ class ExportFormat(Enum):
             ExportFormat.CSV: 'text/csv',
             ExportFormat.EXCEL: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             ExportFormat.JSON: 'application/json',
+            ExportFormat.JSONL: 'application/x-ndjson',
+            ExportFormat.PARQUET: 'application/vnd.apache.parquet',
+            ExportFormat.ARROW: 'application/vnd.apache.arrow.file',
             ExportFormat.PDF: 'application/pdf',
         }
         return mime_types[self]
@@ -81,7 +101,65 @@ class ExportFormat(Enum):
 
     def requires_pandas(self) -> bool:
         """Check if format requires pandas for processing"""
-        return self in {ExportFormat.EXCEL, ExportFormat.PDF}
+        return self == ExportFormat.PDF
+
+    def requires_openpyxl(self) -> bool:
+        """Check if format requires openpyxl for processing"""
+        return self == ExportFormat.EXCEL
+
+    def requires_pyarrow(self) -> bool:
+        """Check if format requires pyarrow for processing"""
+        return self.is_columnar()
+
+    def is_columnar(self) -> bool:
+        """Check if format stores typed columns instead of text"""
+        return self in {ExportFormat.PARQUET, ExportFormat.ARROW}
+
+    def is_streaming(self) -> bool:
+        """Check if format is written incrementally without holding the data"""
+        return self in {
+            ExportFormat.CSV, ExportFormat.JSON, ExportFormat.JSONL,
+            ExportFormat.PARQUET, ExportFormat.ARROW, ExportFormat.EXCEL,
+        }
+
+    def supports_parallel(self) -> bool:
+        """Check if format can be written in shards and merged afterwards"""
+        return self.is_streaming() and self != ExportFormat.EXCEL
+
+    def supports_compression(self) -> bool:
+        """Check if format is plain text that can be compressed as it is written"""
+        return self in {ExportFormat.CSV, ExportFormat.JSON, ExportFormat.JSONL}
+
+
+class ExportCompression(Enum):
+    """
+    Enumeration of compressions applied while an export is written.
+
+    This follows the Single Responsibility Principle by centralizing
+    compression codec management for export files.
+    """
+
+    GZIP = 'gzip'
+    ZSTD = 'zstd'
+    ZIP = 'zip'
+
+    def get_extension(self) -> str:
+        """Get file extension added by this compression"""
+        extensions = {
+            ExportCompression.GZIP: '.gz',
+            ExportCompression.ZSTD: '.zst',
+            ExportCompression.ZIP: '.zip',
+        }
+        return extensions[self]
+
+    def get_mime_type(self) -> str:
+        """Get MIME type of files with this compression"""
+        mime_types = {
+            ExportCompression.GZIP: 'application/gzip',
+            ExportCompression.ZSTD: 'application/zstd',
+            ExportCompression.ZIP: 'application/zip',
+        }
+        return mime_types[self]
 
 
 class ExportStatus(Enum):
@@ -124,10 +202,11 @@ class ExportProgress:
     Class for tracking export progress.
 
     This follows the Single Responsibility Principle by focusing
-    specifically on progress tracking functionality.
+    specifically on progress tracking functionality. total_items may be
+    None for streamed sources of unknown length.
     """
 
-    def __init__(self, total_items: int):
+    def __init__(self, total_items: Optional[int] = None):
         self.total_items = total_items
         self.processed_items = 0
         self.current_stage = ExportStatus.PENDING
@@ -137,6 +216,8 @@ class ExportProgress:
     @property
     def percentage(self) -> float:
         """Calculate progress percentage"""
+        if self.total_items is None:
+            return 100.0 if self.current_stage == ExportStatus.COMPLETED else 0.0
         if self.total_items == 0:
             return 100.0
         return min((self.processed_items / self.total_items) * 100, 100.0)
@@ -144,7 +225,9 @@ class ExportProgress:
     def update(self, processed_items: Optional[int] = None, stage: Optional[ExportStatus] = None) -> None:
         """Update progress"""
         if processed_items is not None:
-            self.processed_items = min(processed_items, self.total_items)
+            if self.total_items is not None:
+                processed_items = min(processed_items, self.total_items)
+            self.processed_items = processed_items
         if stage is not None:
             self.current_stage = stage
         self.updated_at = timezone.now()
@@ -155,11 +238,13 @@ class ExportProgress:
 
     def complete(self) -> None:
         """Mark export as completed"""
+        if self.total_items is None:
+            self.total_items = self.processed_items
         self.update(self.total_items, ExportStatus.COMPLETED)
 
     def get_eta(self) -> Optional[timedelta]:
         """Get estimated time remaining"""
-        if self.processed_items == 0:
+        if self.processed_items == 0 or self.total_items is None:
             return None
 
         elapsed = timezone.now() - self.start_time
@@ -173,6 +258,108 @@ class ExportProgress:
         return timedelta(seconds=eta_seconds)
 
 
+# Lookups export filters may use; anything else is rejected
+EXPORT_FILTER_LOOKUPS = frozenset({'exact', 'iexact', 'icontains', 'in', 'gt', 'gte', 'lt', 'lte'})
+
+
+class _CountingWriter(io.RawIOBase):
+    """Binary stream counting the uncompressed bytes handed to a compressor"""
+
+    def __init__(self, stream: BinaryIO):
+        super().__init__()
+        self.stream = stream
+        self.bytes_written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.stream.write(data)
+        self.bytes_written += len(data)
+        return len(data)
+
+
+class ExportColumn:
+    """
+    Export column read from one or more values() paths.
+
+    This follows the Single Responsibility Principle by keeping the
+    mapping from model fields to an exported value in one place.
+    """
+
+    def __init__(self, *sources: str, convert: Optional[Callable[..., Any]] = None):
+        self.sources = sources
+        self.convert = convert
+
+    def value(self, row: Dict[str, Any]) -> Any:
+        """Get the column value from a values() row"""
+        if self.convert is None:
+            return row[self.sources[0]]
+        return self.convert(*(row[source] for source in self.sources))
+
+
+def _json_text(value: Any) -> Optional[str]:
+    """Serialize a JSONField value as JSON text instead of its Python repr"""
+    if value is None:
+        return None
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _arrow_type(pa, field) -> Any:
+    """
+    Arrow type for a model field; converted columns (field None) are strings.
+
+    Decimals keep their precision and scale, timestamps stay UTC instants.
+    """
+    if field is None:
+        return pa.string()
+    internal_type = field.get_internal_type()
+    if internal_type == 'ForeignKey':
+        internal_type = field.target_field.get_internal_type()
+    if internal_type in {'AutoField', 'BigAutoField', 'SmallAutoField', 'IntegerField', 'BigIntegerField',
+                         'SmallIntegerField', 'PositiveIntegerField', 'PositiveSmallIntegerField',
+                         'PositiveBigIntegerField'}:
+        return pa.int64()
+    if internal_type == 'DecimalField':
+        return pa.decimal128(field.max_digits, field.decimal_places)
+    if internal_type == 'FloatField':
+        return pa.float64()
+    if internal_type == 'BooleanField':
+        return pa.bool_()
+    if internal_type == 'DateTimeField':
+        return pa.timestamp('us', tz='UTC')
+    if internal_type == 'DateField':
+        return pa.date32()
+    return pa.string()
+
+
+def _change_op(removed: bool) -> str:
+    """Change file operation for a row, from its removed_marker"""
+    return 'delete' if removed else 'upsert'
+
+
+def _full_name(first_name: Optional[str], last_name: Optional[str]) -> Optional[str]:
+    """Join a related row's first and last name, None when the relation is empty"""
+    if first_name is None and last_name is None:
+        return None
+    return f"{first_name or ''} {last_name or ''}".strip()
+
+
+def _activity_status(is_cancelled: bool, is_completed: bool, scheduled_at: datetime,
+                     due_soon_hours: int = 24) -> str:
+    """Activity.status computed from values() columns"""
+    now = timezone.now()
+    if is_cancelled:
+        return 'cancelled'
+    if is_completed:
+        return 'completed'
+    if scheduled_at < now:
+        return 'overdue'
+    if scheduled_at <= now + timedelta(hours=due_soon_hours):
+        return 'due_soon'
+    return 'scheduled'
+
+
 class DataExportTask(BaseTask):
     """
     Base class for data export tasks.
@@ -193,6 +380,25 @@ class DataExportTask(BaseTask):
     max_retries = 2
     default_retry_delay = 300  # 5 minutes
 
+    # Model exports: exported columns and the columns filters may use, by ORM path
+    export_type = None
+    export_columns: Dict[str, ExportColumn] = {}
+    filterable_fields: Dict[str, str] = {}
+
+    # Field marking rows that left the export (soft delete), for incremental exports
+    removed_marker: Optional[str] = None
+
+    # Data the export reads; a write to any of them expires cached exports
+    export_sources: tuple = ()
+
+    # Model export task classes by export_type, for parallel export shards
+    export_task_classes: Dict[str, type] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.export_type:
+            DataExportTask.export_task_classes[cls.export_type] = cls
+
     def __init__(self):
         super().__init__()
         self.max_file_size_mb = getattr(settings, 'MAX_EXPORT_SIZE_MB', 100)
@@ -205,6 +411,12 @@ class DataExportTask(BaseTask):
 
         This follows the Template Method pattern by defining the
         overall export process while allowing customization.
+
+        ``data`` may be a list, a queryset or any iterable of row dicts.
+        It is read in chunks of chunk_size rows and filtered, projected,
+        cleaned and written one chunk at a time, so memory stays flat for
+        streaming formats. Pass ``total_items`` when ``data`` has no length
+        to get percentage progress.
         """
         data = kwargs.get('data')
         format_type = ExportFormat(kwargs.get('format', 'CSV'))
@@ -212,38 +424,33 @@ class DataExportTask(BaseTask):
         requested_by = kwargs.get('requested_by')
         filters = kwargs.get('filters', {})
         fields = kwargs.get('fields', None)
-        compress = kwargs.get('compress', self.compression_enabled)
 
         # Validate inputs
         self._validate_export_input(data, format_type, requested_by)
 
         # Get user
-        try:
-            user = User.objects.get(id=requested_by)
-        except User.DoesNotExist:
-            raise TaskValidationError(
-                f"User with ID {requested_by} does not exist",
-                field_name="requested_by",
-                field_value=requested_by
-            )
+        user = self._get_requesting_user(requested_by)
 
         # Initialize progress tracking
-        progress = ExportProgress(len(data) if data else 0)
+        total_items = kwargs.get('total_items')
+        if total_items is None and hasattr(data, '__len__') and not isinstance(data, QuerySet):
+            total_items = len(data)
+        progress = ExportProgress(total_items)
+        compression = self._select_compression(kwargs, format_type, total_items)
         self.set_task_status(TaskStatus.RUNNING, progress=0)
 
         try:
-            # Prepare data
+            # Prepare data lazily, one chunk at a time
             self.set_task_status(TaskStatus.RUNNING, progress=10)
-            prepared_data = self._prepare_data(data, filters, fields)
+            prepared_chunks = self._prepare_chunks(
+                self._iter_chunks(data, progress), filters, fields, clean=not format_type.is_columnar()
+            )
 
             # Export data
             self.set_task_status(TaskStatus.RUNNING, progress=30)
-            export_result = self._export_data(prepared_data, format_type, filename, progress)
-
-            # Compress if requested
-            if compress and self._should_compress(export_result['file_size']):
-                self.set_task_status(TaskStatus.RUNNING, progress=80)
-                export_result = self._compress_export(export_result)
+            export_result = self._export_data(
+                prepared_chunks, format_type, filename, progress, kwargs.get('column_fields'), compression
+            )
 
             # Generate download URL
             self.set_task_status(TaskStatus.RUNNING, progress=90)
@@ -255,9 +462,10 @@ class DataExportTask(BaseTask):
             result = {
                 'success': True,
                 'format': format_type.value,
-                'total_records': len(prepared_data),
+                'total_records': export_result['total_records'],
                 'file_size': export_result['file_size'],
                 'file_path': export_result['file_path'],
+                'compression': export_result['compression'],
                 'download_url': download_url,
                 'requested_by': user.username,
                 'exported_at': timezone.now().isoformat(),
@@ -266,7 +474,7 @@ class DataExportTask(BaseTask):
 
             # Log successful export
             logger.info(
-                f"Export completed successfully: {len(prepared_data)} records in {result['format']}",
+                f"Export completed successfully: {result['total_records']} records in {result['format']}",
                 extra={
                     'task_id': self.task_id,
                     'user_id': requested_by,
@@ -298,6 +506,17 @@ class DataExportTask(BaseTask):
                 }
             )
 
+    def _get_requesting_user(self, requested_by: int):
+        """Get the user requesting the export"""
+        try:
+            return User.objects.get(id=requested_by)
+        except User.DoesNotExist:
+            raise TaskValidationError(
+                f"User with ID {requested_by} does not exist",
+                field_name="requested_by",
+                field_value=requested_by
+            )
+
     def _validate_export_input(
         self,
         data: Any,
@@ -331,7 +550,15 @@ class DataExportTask(BaseTask):
                 field_value=requested_by
             )
 
-        # Check if pandas is available for Excel/PDF exports
+        # Check if pyarrow is available for Parquet/Arrow exports
+        if format_type.requires_pyarrow():
+            self._import_pyarrow(format_type)
+
+        # Check if openpyxl is available for Excel exports
+        if format_type.requires_openpyxl():
+            self._import_openpyxl()
+
+        # Check if pandas is available for PDF exports
         if format_type.requires_pandas():
             try:
                 import pandas as pd
@@ -341,30 +568,576 @@ class DataExportTask(BaseTask):
                     config_key="PANDAS_AVAILABLE"
                 )
 
-    def _prepare_data(
+    def _prepare_queryset_export(
         self,
-        data: List[Dict[str, Any]],
+        queryset: QuerySet,
+        kwargs: Dict[str, Any],
+        change_marker: Optional[str] = None
+    ) -> None:
+        """
+        Turn the export filters and fields into the queryset feeding the export.
+
+        Filters become a WHERE clause and fields the values() projection,
+        so only matching rows and requested columns are read. Both are
+        removed from kwargs so execute() does not apply them again. With
+        a change_marker the rows lead with an ``op`` column and the id.
+        """
+        queryset = self._filter_queryset(queryset, kwargs.pop('filters', None))
+        columns = self._selected_columns(kwargs.pop('fields', None))
+        if change_marker is not None:
+            columns = {
+                'op': ExportColumn(change_marker, convert=_change_op),
+                'id': self.export_columns['id'],
+                **columns,
+            }
+        kwargs['data'] = self._export_rows(queryset, columns)
+        kwargs['column_fields'] = self._column_fields(queryset.model, columns)
+        kwargs.setdefault('total_items', queryset.count())
+
+    def _filter_queryset(self, queryset: QuerySet, filters: Optional[Dict[str, Any]]) -> QuerySet:
+        """
+        Apply export filters such as ``{'company__icontains': 'acme'}`` in the database.
+
+        Raises:
+            TaskValidationError: If a filter uses a column outside
+                filterable_fields or an unsupported lookup
+        """
+        conditions = {}
+        for key, value in (filters or {}).items():
+            column, _, lookup = key.partition('__')
+            lookup = lookup or 'exact'
+            path = self.filterable_fields.get(column)
+            if path is None or lookup not in EXPORT_FILTER_LOOKUPS:
+                raise TaskValidationError(
+                    f"Cannot filter {self.export_type} export on '{key}'",
+                    field_name="filters",
+                    field_value=key
+                )
+            conditions[f"{path}__{lookup}"] = value
+        return queryset.filter(**conditions)
+
+    def _selected_columns(self, fields: Optional[List[str]]) -> Dict[str, ExportColumn]:
+        """
+        Get the export_columns named by the fields kwarg, all of them by default.
+
+        Raises:
+            TaskValidationError: If a field is not one of export_columns
+        """
+        if not fields:
+            return self.export_columns
+        unknown = [field for field in fields if field not in self.export_columns]
+        if unknown:
+            raise TaskValidationError(
+                f"Unknown {self.export_type} export fields: {', '.join(unknown)}",
+                field_name="fields",
+                field_value=unknown
+            )
+        return {field: self.export_columns[field] for field in fields}
+
+    def _column_fields(self, model, columns: Dict[str, ExportColumn]) -> Dict[str, Any]:
+        """Model field behind each column, None for converted columns"""
+        column_fields = {}
+        for name, column in columns.items():
+            field = None
+            if column.convert is None:
+                field_model = model
+                for part in column.sources[0].split('__'):
+                    field = field_model._meta.get_field(part)
+                    field_model = field.related_model
+            column_fields[name] = field
+        return column_fields
+
+    def _export_rows(self, queryset: QuerySet, columns: Dict[str, ExportColumn]) -> Iterator[Dict[str, Any]]:
+        """Stream export rows holding only the given columns"""
+        paths = list(dict.fromkeys(path for column in columns.values() for path in column.sources))
+        return (
+            {name: column.value(row) for name, column in columns.items()}
+            for row in queryset.values(*paths).iterator(chunk_size=self.chunk_size)
+        )
+
+    def get_export_queryset(self, include_removed: bool = False) -> QuerySet:
+        """Queryset a model export reads; model export tasks override this"""
+        raise NotImplementedError(f"{self.__class__.__name__} is not a model export")
+
+    def _execute_shared_export(self, *args, **kwargs) -> Dict[str, Any]:
+        """
+        Run a model export, or share the file of an identical request.
+
+        Requests with the same filters, fields, format, compression and
+        visibility scope map to one content-addressed cache entry that
+        also covers the generation of every export_sources entry, so
+        any write to the exported data expires it. A finished file is
+        returned as is; while an identical export is running, this one
+        waits for its result instead of exporting the same rows again.
+
+        Returns:
+            Dict[str, Any]: Export result, with ``cached`` for shared files
+        """
+        export_cache = ExportCacheService()
+        format_type = ExportFormat(kwargs.get('format', 'CSV'))
+        cache_key = export_cache.request_key(
+            self.export_type,
+            self.export_sources,
+            self._normalize_filters(kwargs.get('filters')),
+            list(self._selected_columns(kwargs.get('fields'))),
+            format_type.value,
+            self._export_scope(kwargs.get('requested_by')),
+            options={
+                'compress': bool(kwargs.get('compress', self.compression_enabled)),
+                'compression': kwargs.get('compression'),
+            }
+        )
+
+        shared = export_cache.get_result(cache_key)
+        owner = self.task_id or uuid.uuid4().hex
+        claimed = shared is None and export_cache.claim(cache_key, owner)
+        if shared is None and not claimed:
+            shared = export_cache.wait_for_result(cache_key)
+        if shared is not None:
+            user = self._get_requesting_user(kwargs.get('requested_by'))
+            logger.info(
+                f"Export served from cache: {shared['total_records']} records in {shared['format']}",
+                extra={'task_id': self.task_id, 'user_id': user.id, 'file_path': shared['file_path']}
+            )
+            return {**shared, 'cached': True, 'requested_by': user.username}
+
+        try:
+            # Name the file after its content, so only identical requests can share a name
+            kwargs['filename'] = f"{kwargs.get('filename', 'export')}-{cache_key[-12:]}"
+            self._prepare_queryset_export(self.get_export_queryset(), kwargs)
+            result = DataExportTask.execute(self, *args, **kwargs)
+            result['export_type'] = self.export_type
+            export_cache.store_result(cache_key, result)
+            return result
+        finally:
+            if claimed:
+                export_cache.release(cache_key, owner)
+
+    def _normalize_filters(self, filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Export filters in one spelling, so equivalent requests share a cache key"""
+        normalized = {}
+        for key, value in (filters or {}).items():
+            column, _, lookup = key.partition('__')
+            if lookup == 'in' and isinstance(value, (list, tuple, set)):
+                value = sorted(value, key=str)
+            normalized[column if lookup in ('', 'exact') else key] = value
+        return normalized
+
+    def _export_scope(self, requested_by: Optional[int]) -> str:
+        """
+        Visibility scope the export's rows are read under.
+
+        Identical requests only share files within one scope. Model
+        exports read every row of their type whoever asks (the users
+        export checks for administrators first), so they share one.
+        """
+        return 'all'
+
+    def _execute_incremental_export(self, *args, **kwargs) -> Dict[str, Any]:
+        """
+        Export only the rows changed since the last incremental export.
+
+        A watermark is kept per requesting user, export type and filter
+        set. Rows updated after it are written as a change file whose
+        ``op`` column is ``delete`` for rows carrying removed_marker and
+        ``upsert`` otherwise; the first run exports every live row. The
+        watermark moves only once the export succeeds, and stays
+        EXPORT_WATERMARK_LAG_SECONDS behind now so rows saved by
+        transactions still open are picked up by the next run.
+
+        Returns:
+            Dict[str, Any]: Export result with the change window
+        """
+        if self.removed_marker is None:
+            raise TaskValidationError(
+                f"Incremental export is not supported for {self.export_type}",
+                field_name="incremental",
+                field_value=True
+            )
+
+        requested_by = kwargs.get('requested_by')
+        filters = kwargs.get('filters') or {}
+        watermark_key = {
+            'user_id': requested_by,
+            'export_type': self.export_type,
+            'filters_hash': ExportWatermark.hash_filters(filters),
+        }
+        previous = ExportWatermark.objects.filter(**watermark_key).first()
+        since = previous.watermark if previous else None
+        until = timezone.now() - timedelta(seconds=getattr(settings, 'EXPORT_WATERMARK_LAG_SECONDS', 60))
+
+        queryset = self.get_export_queryset(include_removed=True).filter(updated_at__lte=until)
+        if since is None:
+            queryset = queryset.filter(**{self.removed_marker: False})
+        else:
+            queryset = queryset.filter(updated_at__gt=since)
+        self._prepare_queryset_export(
+            queryset.order_by('updated_at', 'pk'), kwargs, change_marker=self.removed_marker
+        )
+
+        result = DataExportTask.execute(self, *args, **kwargs)
+
+        ExportWatermark.objects.update_or_create(
+            **watermark_key, defaults={'filters': filters, 'watermark': until}
+        )
+        result.update({
+            'export_type': self.export_type,
+            'incremental': True,
+            'changes_since': since.isoformat() if since else None,
+            'watermark': until.isoformat(),
+        })
+        return result
+
+    def _start_parallel_export(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Split a model export into primary key ranges and export them in parallel.
+
+        Each range is written to a part file by an export_shard task on
+        the exports queue; a chord runs merge_export_shards once all
+        parts exist, which joins them in key order into the final file.
+        The export's progress and result live under the returned
+        export_id, which is the merge task's id.
+
+        Args:
+            kwargs: The export task kwargs, plus optional ``shards``
+
+        Returns:
+            Dict[str, Any]: The export_id and how the export was split
+        """
+        format_type = ExportFormat(kwargs.get('format', 'CSV'))
+        requested_by = kwargs.get('requested_by')
+        queryset = self.get_export_queryset()
+        self._validate_export_input(queryset, format_type, requested_by)
+        if not format_type.supports_parallel():
+            raise TaskValidationError(
+                f"Parallel export does not support {format_type.value}",
+                field_name="format",
+                field_value=format_type.value
+            )
+
+        queryset = self._filter_queryset(queryset, kwargs.get('filters'))
+        columns = self._selected_columns(kwargs.get('fields'))
+        total_items = queryset.count()
+        bounds = self._shard_bounds(queryset, total_items, kwargs.get('shards'))
+        compression = self._select_compression(kwargs, format_type, total_items)
+
+        export_id = uuid.uuid4().hex
+        options = {
+            'export_id': export_id,
+            'export_type': self.export_type,
+            'format': format_type.value,
+            'filters': kwargs.get('filters') or {},
+            'fields': list(columns),
+            'filename': kwargs.get('filename', self.export_type),
+            'requested_by': requested_by,
+            'compression': compression.value if compression else None,
+            'total_items': total_items,
+        }
+
+        cache.set(f'export_progress_{export_id}', 0, timeout=3600)
+        shards = [
+            export_shard.s(index, low, high, options).set(queue=self.queue)
+            for index, (low, high) in enumerate(bounds)
+        ]
+        chord(shards)(merge_export_shards.s(options).set(queue=self.queue, task_id=export_id))
+
+        logger.info(
+            f"Parallel {self.export_type} export of {total_items} records split into {len(bounds)} shards",
+            extra={'task_id': self.task_id, 'export_id': export_id, 'user_id': requested_by}
+        )
+
+        return {
+            'success': True,
+            'parallel': True,
+            'export_id': export_id,
+            'export_type': self.export_type,
+            'format': format_type.value,
+            'shards': len(bounds),
+            'total_records': total_items,
+        }
+
+    def _shard_bounds(
+        self,
+        queryset: QuerySet,
+        total_items: int,
+        shards: Optional[int] = None
+    ) -> List[tuple]:
+        """
+        Split the rows into (low, high) primary key ranges of similar size.
+
+        A range holds keys from low (inclusive) to high (exclusive); None
+        leaves that end open. Shards hold at least EXPORT_SHARD_MIN_ROWS
+        rows, so small exports are not split more than they need to be.
+        """
+        shards = shards or getattr(settings, 'EXPORT_PARALLEL_SHARDS', 4)
+        min_rows = getattr(settings, 'EXPORT_SHARD_MIN_ROWS', 50000)
+        shards = max(1, min(shards, -(-total_items // min_rows)))
+
+        keys = queryset.order_by('pk').values_list('pk', flat=True)
+        starts = [keys[total_items * index // shards] for index in range(1, shards)]
+        return list(zip([None, *starts], [*starts, None]))
+
+    def _export_shard(
+        self,
+        index: int,
+        low: Optional[int],
+        high: Optional[int],
+        options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Export one primary key range of a parallel export to a part file.
+
+        Returns:
+            Dict[str, Any]: The shard index, part file path and row count
+        """
+        format_type = ExportFormat(options['format'])
+        source = self.export_task_classes[options['export_type']]()
+        queryset = source._filter_queryset(source.get_export_queryset(), options['filters'])
+        if low is not None:
+            queryset = queryset.filter(pk__gte=low)
+        if high is not None:
+            queryset = queryset.filter(pk__lt=high)
+        columns = source._selected_columns(options['fields'])
+
+        progress = ExportProgress()
+        rows = source._export_rows(queryset.order_by('pk'), columns)
+        chunks = self._prepare_chunks(
+            self._report_shard_progress(self._iter_chunks(rows, progress), options),
+            None, None, clean=not format_type.is_columnar()
+        )
+        part_path = self._get_temp_file_path(
+            f"{options['export_id']}.part{index:04d}{format_type.get_extension()}"
+        )
+
+        try:
+            total_records = self._write_part(
+                chunks, format_type, part_path, options['fields'],
+                source._column_fields(queryset.model, columns)
+            )
+        except Exception:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
+        return {'index': index, 'file_path': part_path, 'total_records': total_records}
+
+    def _report_shard_progress(
+        self,
+        chunks: Iterator[List[Dict[str, Any]]],
+        options: Dict[str, Any]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Add each chunk read by a shard to the progress of the whole export"""
+        counter_key = f"export_progress_{options['export_id']}"
+        for chunk in chunks:
+            try:
+                processed = cache.incr(counter_key, len(chunk))
+            except ValueError:
+                processed = None  # Counter expired; keep exporting without progress
+            if processed is not None and options['total_items']:
+                share = min(processed / options['total_items'], 1)
+                self.set_task_status(TaskStatus.RUNNING, progress=30 + int(share * 50))
+            yield chunk
+
+    def _merge_export_shards(
+        self,
+        shard_results: List[Dict[str, Any]],
+        options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Join the part files of a parallel export into the final export file.
+
+        Returns:
+            Dict[str, Any]: Export result with download information
+        """
+        format_type = ExportFormat(options['format'])
+        shard_results = sorted(shard_results, key=lambda shard: shard['index'])
+        parts = [shard['file_path'] for shard in shard_results if shard['total_records']]
+        total_records = sum(shard['total_records'] for shard in shard_results)
+        compression = ExportCompression(options['compression']) if options['compression'] else None
+        export_filename = self._generate_filename(options['filename'], format_type, options['requested_by'])
+        if compression is not None:
+            export_filename += compression.get_extension()
+        file_path = self._get_temp_file_path(export_filename)
+
+        try:
+            user = self._get_requesting_user(options['requested_by'])
+            self.set_task_status(TaskStatus.RUNNING, progress=80)
+            self._merge_parts(parts, format_type, file_path, options['fields'], compression)
+        except Exception:
+            self.set_task_status(TaskStatus.FAILURE)
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise
+        finally:
+            for shard in shard_results:
+                if os.path.exists(shard['file_path']):
+                    os.remove(shard['file_path'])
+            cache.delete(f"export_progress_{options['export_id']}")
+
+        result = {
+            'success': True,
+            'export_id': options['export_id'],
+            'export_type': options['export_type'],
+            'format': format_type.value,
+            'shards': len(shard_results),
+            'total_records': total_records,
+            'file_size': os.path.getsize(file_path),
+            'file_path': file_path,
+            'compression': options['compression'],
+            'download_url': self._generate_download_url(file_path),
+            'requested_by': user.username,
+            'exported_at': timezone.now().isoformat(),
+        }
+        self.set_task_status(TaskStatus.SUCCESS, progress=100, metadata={
+            'total_records': total_records,
+            'download_url': result['download_url'],
+        })
+
+        return result
+
+    def _write_part(
+        self,
+        chunks: Iterable[List[Dict[str, Any]]],
+        format_type: ExportFormat,
+        part_path: str,
+        fieldnames: List[str],
+        column_fields: Dict[str, Any]
+    ) -> int:
+        """
+        Write the rows of one shard to its part file.
+
+        CSV parts have no header and JSON parts hold one object per line,
+        so _merge_parts can join them without parsing.
+
+        Returns:
+            int: Number of rows written
+        """
+        if format_type.is_columnar():
+            return self._write_columnar(chunks, part_path, format_type, column_fields)
+
+        rows = chain.from_iterable(chunks)
+        with open(part_path, 'w', newline='', encoding='utf-8') as output:
+            if format_type == ExportFormat.CSV:
+                return self._write_csv(output, rows, fieldnames=fieldnames, header=False)
+            return self._write_jsonl(output, rows)
+
+    def _merge_parts(
+        self,
+        parts: List[str],
+        format_type: ExportFormat,
+        file_path: str,
+        fieldnames: List[str],
+        compression: Optional[ExportCompression] = None
+    ) -> None:
+        """
+        Join part files in order into one export file, streaming each part.
+
+        Text exports are compressed while the parts are copied in.
+
+        Raises:
+            TaskValidationError: If a columnar export has no rows
+        """
+        if format_type.is_columnar():
+            if not parts:
+                raise TaskValidationError("No data to export")
+            self._merge_columnar_parts(parts, format_type, file_path)
+            return
+
+        with self._open_export_stream(file_path, compression) as output:
+            if format_type == ExportFormat.CSV:
+                csv.writer(output).writerow(fieldnames)
+            elif format_type == ExportFormat.JSON:
+                output.write('[')
+
+            separator = '\n  '
+            for part in parts:
+                with open(part, 'r', newline='', encoding='utf-8') as part_file:
+                    if format_type != ExportFormat.JSON:
+                        shutil.copyfileobj(part_file, output)
+                        continue
+                    for line in part_file:
+                        output.write(separator)
+                        output.write(line.rstrip('\n'))
+                        separator = ',\n  '
+
+            if format_type == ExportFormat.JSON:
+                output.write('\n]\n' if parts else ']\n')
+
+    def _merge_columnar_parts(self, parts: List[str], format_type: ExportFormat, file_path: str) -> None:
+        """Copy the row groups or record batches of each part into one file"""
+        pa = self._import_pyarrow(format_type)
+        writer = None
+        try:
+            for part in parts:
+                if format_type == ExportFormat.PARQUET:
+                    import pyarrow.parquet as pq
+
+                    part_file = pq.ParquetFile(part)
+                    writer = writer or self._open_columnar_writer(pa, file_path, part_file.schema_arrow, format_type)
+                    for row_group in range(part_file.num_row_groups):
+                        writer.write_table(part_file.read_row_group(row_group))
+                else:
+                    with pa.memory_map(part) as source:
+                        reader = pa.ipc.open_file(source)
+                        writer = writer or self._open_columnar_writer(pa, file_path, reader.schema, format_type)
+                        for batch in range(reader.num_record_batches):
+                            writer.write_batch(reader.get_batch(batch))
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _iter_chunks(self, data: Iterable[Dict[str, Any]], progress: ExportProgress) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Read the export source in chunks of chunk_size rows.
+
+        Querysets are read through a server-side cursor. Progress is
+        reported once per chunk read.
+        """
+        if isinstance(data, QuerySet):
+            rows = data.iterator(chunk_size=self.chunk_size)
+        else:
+            rows = iter(data)
+
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                return
+            progress.update(progress.processed_items + len(chunk), ExportStatus.EXPORTING)
+            self.set_task_status(TaskStatus.RUNNING, progress=self._export_progress(progress))
+            yield chunk
+
+    def _export_progress(self, progress: ExportProgress) -> int:
+        """Map export progress onto the 30-80% task progress band"""
+        if progress.total_items is None:
+            return 30
+        return int(min(30 + progress.percentage / 2, 80))
+
+    def _prepare_chunks(
+        self,
+        chunks: Iterable[List[Dict[str, Any]]],
         filters: Dict[str, Any],
-        fields: Optional[List[str]]
-    ) -> List[Dict[str, Any]]:
+        fields: Optional[List[str]],
+        clean: bool = True
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
         Prepare data for export by applying filters and field selection.
 
         This follows the Single Responsibility Principle by handling
-        data preparation separately from export logic.
+        data preparation separately from export logic. Each stage runs
+        over one chunk at a time, so only a single chunk is ever copied.
+        Columnar formats skip cleaning to keep typed values.
         """
-        # Apply filters
-        if filters:
-            data = self._apply_filters(data, filters)
-
-        # Select fields
-        if fields:
-            data = self._select_fields(data, fields)
+        for chunk in chunks:
+            # Apply filters
+            if filters:
+                chunk = self._apply_filters(chunk, filters)
 
-        # Clean data (handle Decimal, datetime objects, etc.)
-        data = self._clean_data_for_export(data)
+            # Select fields
+            if fields:
+                chunk = self._select_fields(chunk, fields)
 
-        return data
+            # Clean data (handle Decimal, datetime objects, etc.)
+            yield self._clean_data_for_export(chunk) if clean else chunk
 
     def _apply_filters(self, data: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -446,6 +1219,8 @@ class DataExportTask(BaseTask):
                     cleaned_item[key] = float(value)
                 elif isinstance(value, datetime):
                     cleaned_item[key] = value.isoformat()
+                elif isinstance(value, (dict, list)):
+                    cleaned_item[key] = json.dumps(value, ensure_ascii=False)
                 elif value is None:
                     cleaned_item[key] = ''
                 else:
@@ -456,30 +1231,46 @@ class DataExportTask(BaseTask):
 
     def _export_data(
         self,
-        data: List[Dict[str, Any]],
+        chunks: Iterable[List[Dict[str, Any]]],
         format_type: ExportFormat,
         filename: str,
-        progress: ExportProgress
+        progress: ExportProgress,
+        column_fields: Optional[Dict[str, Any]] = None,
+        compression: Optional[ExportCompression] = None
     ) -> Dict[str, Any]:
         """
         Export data in specified format.
 
         This follows the Strategy pattern by delegating to specific
-        export methods based on format type.
+        export methods based on format type. Streaming formats consume
+        the chunks as they are produced; the others collect them first.
+        Text formats are compressed as they are written, so only the
+        compressed file ever reaches the disk.
         """
         # Generate filename
         export_filename = self._generate_filename(filename, format_type)
+        if compression is not None:
+            export_filename += compression.get_extension()
         file_path = self._get_temp_file_path(export_filename)
+        rows = chain.from_iterable(chunks)
 
         try:
             if format_type == ExportFormat.CSV:
-                result = self._export_to_csv(data, file_path, progress)
+                result = self._export_to_csv(
+                    rows, file_path, progress, compression, list(column_fields) if column_fields else None
+                )
             elif format_type == ExportFormat.JSON:
-                result = self._export_to_json(data, file_path)
+                result = self._export_to_json(rows, file_path, compression)
+            elif format_type == ExportFormat.JSONL:
+                result = self._export_to_jsonl(rows, file_path, compression)
+            elif format_type.is_columnar():
+                result = self._export_to_columnar(chunks, file_path, format_type, column_fields)
             elif format_type == ExportFormat.EXCEL:
-                result = self._export_to_excel(data, file_path, progress)
+                result = self._export_to_excel(
+                    rows, file_path, progress, list(column_fields) if column_fields else None
+                )
             elif format_type == ExportFormat.PDF:
-                result = self._export_to_pdf(data, file_path, progress)
+                result = self._export_to_pdf(list(rows), file_path, progress)
             else:
                 raise TaskValidationError(
                     f"Unsupported export format: {format_type.value}",
@@ -487,13 +1278,23 @@ class DataExportTask(BaseTask):
                     field_value=format_type.value
                 )
 
-            return {
+            progress.complete()
+
+            export_result = {
                 'file_path': file_path,
                 'file_size': os.path.getsize(file_path),
-                'format': format_type.value
+                'format': format_type.value,
+                'total_records': result['total_records'],
+                'compressed': compression is not None,
+                'compression': compression.value if compression else None,
             }
+            if compression is not None and result.get('uncompressed_size'):
+                export_result['compression_ratio'] = (
+                    (1 - export_result['file_size'] / result['uncompressed_size']) * 100
+                )
+            return export_result
 
-        except Exception as e:
+        except Exception:
             # Clean up file on error
             if os.path.exists(file_path):
                 os.remove(file_path)
@@ -501,84 +1302,348 @@ class DataExportTask(BaseTask):
 
     def _export_to_csv(
         self,
-        data: List[Dict[str, Any]],
+        rows: Iterable[Dict[str, Any]],
         file_path: str,
-        progress: ExportProgress
+        progress: ExportProgress,
+        compression: Optional[ExportCompression] = None,
+        fieldnames: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Export data to CSV format.
 
         This follows the Single Responsibility Principle by focusing
-        specifically on CSV export functionality.
+        specifically on CSV export functionality. Model exports know
+        their columns, so no rows gives a file with just the header.
         """
-        if not data:
-            raise TaskValidationError("No data to export")
-
-        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = data[0].keys()
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            # Write header
-            writer.writeheader()
-            progress.current_stage = ExportStatus.EXPORTING
-
-            # Write data rows
-            for i, row in enumerate(data):
-                writer.writerow(row)
-                progress.add_items(1)
+        progress.current_stage = ExportStatus.EXPORTING
+        with self._open_export_stream(file_path, compression) as csvfile:
+            total_records = self._write_csv(csvfile, rows, fieldnames=fieldnames)
 
-                # Update task progress periodically
-                if i % self.chunk_size == 0:
-                    progress_percentage = min((i / len(data)) * 50 + 30, 80)  # 30-80%
-                    self.set_task_status(TaskStatus.RUNNING, progress=int(progress_percentage))
+        if not total_records and not fieldnames:
+            raise TaskValidationError("No data to export")
 
-        return {'file_path': file_path, 'total_records': len(data)}
+        return {
+            'file_path': file_path,
+            'total_records': total_records,
+            'uncompressed_size': getattr(csvfile, 'uncompressed_size', None),
+        }
 
-    def _export_to_json(self, data: List[Dict[str, Any]], file_path: str) -> Dict[str, Any]:
+    def _export_to_json(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        file_path: str,
+        compression: Optional[ExportCompression] = None
+    ) -> Dict[str, Any]:
         """
         Export data to JSON format.
 
         This follows the Single Responsibility Principle by focusing
         specifically on JSON export functionality.
         """
-        with open(file_path, 'w', encoding='utf-8') as jsonfile:
-            json.dump(data, jsonfile, indent=2, ensure_ascii=False)
+        with self._open_export_stream(file_path, compression) as jsonfile:
+            total_records = self._write_json(jsonfile, rows)
 
-        return {'file_path': file_path, 'total_records': len(data)}
+        return {
+            'file_path': file_path,
+            'total_records': total_records,
+            'uncompressed_size': getattr(jsonfile, 'uncompressed_size', None),
+        }
 
-    def _export_to_excel(
+    def _export_to_jsonl(
         self,
-        data: List[Dict[str, Any]],
+        rows: Iterable[Dict[str, Any]],
         file_path: str,
-        progress: ExportProgress
+        compression: Optional[ExportCompression] = None
     ) -> Dict[str, Any]:
         """
-        Export data to Excel format.
+        Export data to JSON Lines format.
 
         This follows the Single Responsibility Principle by focusing
-        specifically on Excel export functionality.
+        specifically on JSON Lines export functionality.
         """
+        with self._open_export_stream(file_path, compression) as jsonlfile:
+            total_records = self._write_jsonl(jsonlfile, rows)
+
+        return {
+            'file_path': file_path,
+            'total_records': total_records,
+            'uncompressed_size': getattr(jsonlfile, 'uncompressed_size', None),
+        }
+
+    @contextmanager
+    def _open_export_stream(
+        self,
+        file_path: str,
+        compression: Optional[ExportCompression] = None
+    ) -> Iterator[TextIO]:
+        """
+        Open a text stream writing an export file, compressing as it writes.
+
+        Only compressed bytes reach the disk. Once closed, a compressed
+        stream's ``uncompressed_size`` holds the size of the text written.
+        """
+        if compression is None:
+            with open(file_path, 'w', newline='', encoding='utf-8') as output:
+                yield output
+            return
+
+        level = getattr(settings, 'EXPORT_COMPRESSION_LEVEL', None)
+        with ExitStack() as stack:
+            if compression == ExportCompression.GZIP:
+                compressed = stack.enter_context(gzip.open(file_path, 'wb', compresslevel=level or 6))
+            elif compression == ExportCompression.ZSTD:
+                zstd = self._import_zstandard()
+                compressed = stack.enter_context(
+                    zstd.open(file_path, 'wb', cctx=zstd.ZstdCompressor(level=level or 3))
+                )
+            else:
+                archive = stack.enter_context(zipfile.ZipFile(
+                    file_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=level
+                ))
+                member = os.path.basename(file_path)[:-len(compression.get_extension())]
+                compressed = stack.enter_context(archive.open(member, 'w', force_zip64=True))
+
+            counter = _CountingWriter(compressed)
+            output = io.TextIOWrapper(io.BufferedWriter(counter), encoding='utf-8', newline='')
+            try:
+                yield output
+            finally:
+                output.close()
+            output.uncompressed_size = counter.bytes_written
+
+    def _import_zstandard(self):
+        """Import zstandard, which zstd compression needs"""
         try:
-            import pandas as pd
+            import zstandard
         except ImportError:
             raise TaskConfigurationError(
-                "Excel export requires pandas but it's not installed",
-                config_key="PANDAS_AVAILABLE"
+                "zstd export compression requires zstandard but it's not installed",
+                config_key="ZSTANDARD_AVAILABLE"
             )
+        return zstandard
 
-        if not data:
+    def _export_to_columnar(
+        self,
+        chunks: Iterable[List[Dict[str, Any]]],
+        file_path: str,
+        format_type: ExportFormat,
+        column_fields: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Export data to Parquet or Arrow IPC format.
+
+        This follows the Single Responsibility Principle by focusing
+        specifically on columnar export functionality. Chunks are
+        converted to Arrow tables and written in row groups of
+        EXPORT_ROW_GROUP_SIZE rows. Model exports take the schema from
+        the model fields; raw data infers it from the first chunk.
+        Model exports without rows still get a file with their schema.
+        """
+        total_records = self._write_columnar(chunks, file_path, format_type, column_fields)
+        if not total_records and not column_fields:
             raise TaskValidationError("No data to export")
 
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
+        return {'file_path': file_path, 'total_records': total_records}
+
+    def _write_columnar(
+        self,
+        chunks: Iterable[List[Dict[str, Any]]],
+        file_path: str,
+        format_type: ExportFormat,
+        column_fields: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Write chunks as Parquet or Arrow IPC.
+
+        Without rows, only model exports (which know their schema) create a file.
+
+        Returns:
+            int: Number of rows written
+        """
+        pa = self._import_pyarrow(format_type)
+        row_group_size = getattr(settings, 'EXPORT_ROW_GROUP_SIZE', 65536)
+        schema = None
+        if column_fields:
+            schema = pa.schema([(name, _arrow_type(pa, field)) for name, field in column_fields.items()])
+
+        writer = None
+        pending, pending_rows, total_records = [], 0, 0
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                table = pa.Table.from_pylist(chunk, schema=schema)
+                if schema is None:
+                    # Columns that were all null in the first chunk fall back to strings
+                    schema = pa.schema([
+                        (field.name, pa.string() if pa.types.is_null(field.type) else field.type)
+                        for field in table.schema
+                    ])
+                    table = table.cast(schema)
+                pending.append(table)
+                pending_rows += table.num_rows
+
+                if pending_rows >= row_group_size:
+                    writer = writer or self._open_columnar_writer(pa, file_path, schema, format_type)
+                    writer.write_table(pa.concat_tables(pending))
+                    total_records += pending_rows
+                    pending, pending_rows = [], 0
+
+            if pending:
+                writer = writer or self._open_columnar_writer(pa, file_path, schema, format_type)
+                writer.write_table(pa.concat_tables(pending))
+                total_records += pending_rows
+            elif writer is None and column_fields:
+                # No rows: an empty file that still carries the model's schema
+                writer = self._open_columnar_writer(pa, file_path, schema, format_type)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return total_records
+
+    def _open_columnar_writer(self, pa, file_path: str, schema, format_type: ExportFormat):
+        """Open a Parquet or Arrow IPC file writer for a schema"""
+        if format_type == ExportFormat.PARQUET:
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(
+                file_path, schema, compression=getattr(settings, 'EXPORT_PARQUET_COMPRESSION', 'zstd')
+            )
+        return pa.ipc.new_file(file_path, schema)
+
+    def _import_pyarrow(self, format_type: ExportFormat):
+        """Import pyarrow, which columnar formats need"""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise TaskConfigurationError(
+                f"Export format {format_type.value} requires pyarrow but it's not installed",
+                config_key="PYARROW_AVAILABLE"
+            )
+        return pa
+
+    def _write_csv(
+        self,
+        output: TextIO,
+        rows: Iterable[Dict[str, Any]],
+        fieldnames: Optional[List[str]] = None,
+        header: bool = True
+    ) -> int:
+        """
+        Write rows as CSV, taking the header from the first row by default.
+
+        With fieldnames, a header is written even when there are no rows.
+
+        Returns:
+            int: Number of rows written
+        """
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is None:
+            if fieldnames and header:
+                csv.DictWriter(output, fieldnames=fieldnames).writeheader()
+            return 0
+
+        writer = csv.DictWriter(output, fieldnames=fieldnames or list(first_row.keys()))
+        if header:
+            writer.writeheader()
+        writer.writerow(first_row)
+
+        total_records = 1
+        for row in rows:
+            writer.writerow(row)
+            total_records += 1
+        return total_records
+
+    def _write_json(self, output: TextIO, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write rows as a JSON array, one element at a time.
+
+        Returns:
+            int: Number of rows written
+        """
+        total_records = 0
+        output.write('[')
+        for row in rows:
+            output.write(',\n  ' if total_records else '\n  ')
+            output.write(json.dumps(row, ensure_ascii=False))
+            total_records += 1
+        output.write('\n]\n' if total_records else ']\n')
+        return total_records
+
+    def _write_jsonl(self, output: TextIO, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write rows as JSON Lines, one object per line.
+
+        Returns:
+            int: Number of rows written
+        """
+        total_records = 0
+        for row in rows:
+            output.write(json.dumps(row, ensure_ascii=False))
+            output.write('\n')
+            total_records += 1
+        return total_records
 
-        # Create Excel writer
-        with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Export Data', index=False)
+    def _export_to_excel(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        file_path: str,
+        progress: ExportProgress,
+        fieldnames: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Export data to Excel format.
 
-        progress.complete()
+        This follows the Single Responsibility Principle by focusing
+        specifically on Excel export functionality. Rows are appended to
+        a write-only workbook as they arrive, so memory stays flat, and
+        a new sheet is started whenever one reaches Excel's row limit.
+        """
+        openpyxl = self._import_openpyxl()
+        max_rows = getattr(settings, 'EXPORT_EXCEL_MAX_ROWS', EXCEL_MAX_ROWS) - 1  # Less the header row
+        progress.current_stage = ExportStatus.EXPORTING
 
-        return {'file_path': file_path, 'total_records': len(data)}
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is None and not fieldnames:
+            raise TaskValidationError("No data to export")
+        fieldnames = fieldnames or list(first_row.keys())
+
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet, sheet_rows, total_records = None, 0, 0
+        for row in chain([first_row], rows) if first_row is not None else ():
+            if sheet is None or sheet_rows >= max_rows:
+                sheet = self._add_excel_sheet(workbook, fieldnames)
+                sheet_rows = 0
+            sheet.append([row.get(name) for name in fieldnames])
+            sheet_rows += 1
+            total_records += 1
+
+        if sheet is None:
+            # No rows: a model export still gets its header
+            self._add_excel_sheet(workbook, fieldnames)
+        workbook.save(file_path)
+
+        return {'file_path': file_path, 'total_records': total_records, 'sheets': len(workbook.worksheets)}
+
+    def _add_excel_sheet(self, workbook, fieldnames: List[str]):
+        """Start the next 'Export Data' sheet of a write-only workbook with the header row"""
+        number = len(workbook.worksheets) + 1
+        sheet = workbook.create_sheet(title='Export Data' if number == 1 else f'Export Data {number}')
+        sheet.append(fieldnames)
+        return sheet
+
+    def _import_openpyxl(self):
+        """Import openpyxl, which Excel exports need"""
+        try:
+            import openpyxl
+        except ImportError:
+            raise TaskConfigurationError(
+                "Export format EXCEL requires openpyxl but it's not installed",
+                config_key="OPENPYXL_AVAILABLE"
+            )
+        return openpyxl
 
     def _export_to_pdf(
         self,
@@ -627,51 +1692,56 @@ class DataExportTask(BaseTask):
         os.makedirs(temp_dir, exist_ok=True)
         return os.path.join(temp_dir, filename)
 
-    def _should_compress(self, file_size: int) -> bool:
+    def _select_compression(
+        self,
+        kwargs: Dict[str, Any],
+        format_type: ExportFormat,
+        total_items: Optional[int]
+    ) -> Optional[ExportCompression]:
         """
-        Determine if file should be compressed.
+        Choose the compression an export is written with, before writing it.
 
-        This checks if file size exceeds compression threshold.
-        """
-        compression_threshold = getattr(settings, 'EXPORT_COMPRESSION_THRESHOLD_MB', 10) * 1024 * 1024
-        return self.compression_enabled and file_size > compression_threshold
+        A ``compression`` kwarg (gzip, zstd or zip) picks the codec and
+        always compresses; otherwise the estimated size decides and
+        EXPORT_COMPRESSION_FORMAT is used. ``compress=False`` turns
+        compression off. Parquet, Arrow and Excel compress internally.
 
-    def _compress_export(self, export_result: Dict[str, Any]) -> Dict[str, Any]:
+        Raises:
+            TaskValidationError: If the requested compression is unknown
         """
-        Compress exported file.
-
-        This follows the Single Responsibility Principle by handling
-        file compression separately from export logic.
-        """
-        original_path = export_result['file_path']
-        compressed_path = original_path + '.zip'
-
+        requested = kwargs.get('compression')
         try:
-            with zipfile.ZipFile(compressed_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                zipf.write(original_path, os.path.basename(original_path))
+            compression = ExportCompression(
+                requested or getattr(settings, 'EXPORT_COMPRESSION_FORMAT', 'zip')
+            )
+        except ValueError:
+            raise TaskValidationError(
+                f"Invalid export compression: {requested}",
+                field_name="compression",
+                field_value=requested
+            )
 
-            # Remove original file
-            os.remove(original_path)
+        if not kwargs.get('compress', self.compression_enabled) or not format_type.supports_compression():
+            return None
+        if requested is None and not self._should_compress(self._estimate_export_size(total_items)):
+            return None
+        return compression
 
-            # Update result
-            compressed_size = os.path.getsize(compressed_path)
-            export_result.update({
-                'file_path': compressed_path,
-                'file_size': compressed_size,
-                'compressed': True,
-                'compression_ratio': (1 - compressed_size / export_result['file_size']) * 100
-            })
+    def _estimate_export_size(self, total_items: Optional[int]) -> Optional[int]:
+        """Estimate the uncompressed export size in bytes, None if the row count is unknown"""
+        if total_items is None:
+            return None
+        return total_items * getattr(settings, 'EXPORT_ESTIMATED_ROW_BYTES', 200)
 
-            return export_result
+    def _should_compress(self, estimated_size: Optional[int]) -> bool:
+        """
+        Determine if an export should be compressed.
 
-        except Exception as e:
-            # Remove compressed file if it exists
-            if os.path.exists(compressed_path):
-                os.remove(compressed_path)
-            raise TaskExecutionError(
-                f"Failed to compress export file: {str(e)}",
-                error_code="COMPRESSION_ERROR"
-            )
+        This checks if the estimated export size exceeds compression
+        threshold; exports of unknown size are compressed.
+        """
+        compression_threshold = getattr(settings, 'EXPORT_COMPRESSION_THRESHOLD_MB', 10) * 1024 * 1024
+        return self.compression_enabled and (estimated_size is None or estimated_size > compression_threshold)
 
     def _generate_download_url(self, file_path: str) -> str:
         """
@@ -698,52 +1768,63 @@ class ContactsExportTask(DataExportTask):
     specifically on contact export functionality.
     """
 
+    export_type = 'contacts'
+    export_sources = ('contacts',)
+    export_columns = {
+        'id': ExportColumn('id'),
+        'first_name': ExportColumn('first_name'),
+        'last_name': ExportColumn('last_name'),
+        'email': ExportColumn('email'),
+        'phone': ExportColumn('phone'),
+        'company': ExportColumn('company'),
+        'job_title': ExportColumn('title'),
+        'address': ExportColumn('address'),
+        'city': ExportColumn('city'),
+        'country': ExportColumn('country'),
+        'tags': ExportColumn('tags', convert=_json_text),
+        'created_at': ExportColumn('created_at'),
+        'updated_at': ExportColumn('updated_at'),
+    }
+    filterable_fields = {
+        'id': 'id',
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'email': 'email',
+        'company': 'company',
+        'job_title': 'title',
+        'city': 'city',
+        'country': 'country',
+        'owner_id': 'owner_id',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
+    removed_marker = 'is_deleted'
+
     def execute(self, *args, **kwargs) -> Dict[str, Any]:
         """
         Export contacts data.
 
         Args:
-            format: Export format (CSV, EXCEL, JSON, PDF)
+            format: Export format (CSV, JSON, JSONL, PARQUET, ARROW, EXCEL, PDF)
             requested_by: User ID requesting the export
-            filters: Optional filters to apply
-            fields: Optional fields to include
+            filters: Optional filters on filterable_fields, applied in the database
+            fields: Optional export_columns to include
+            parallel: Export primary key ranges in parallel (streaming formats only)
+            shards: Optional number of ranges, EXPORT_PARALLEL_SHARDS by default
+            incremental: Export only rows changed since the last incremental export
 
         Returns:
             Dict[str, Any]: Export result with download information
         """
         try:
-            from ..repositories.contact_repository import ContactRepository
-
-            # Get contacts data
-            repo = ContactRepository()
-            contacts = repo.get_all()
-
-            # Convert to list of dicts
-            contacts_data = []
-            for contact in contacts:
-                contacts_data.append({
-                    'id': contact.id,
-                    'first_name': contact.first_name,
-                    'last_name': contact.last_name,
-                    'email': contact.email,
-                    'phone': contact.phone,
-                    'company': contact.company,
-                    'job_title': contact.job_title,
-                    'address': contact.address,
-                    'city': contact.city,
-                    'country': contact.country,
-                    'created_at': contact.created_at,
-                    'updated_at': contact.updated_at,
-                })
-
-            # Add contact-specific data to kwargs
-            kwargs['data'] = contacts_data
-
-            # Call parent export method
-            result = super().execute(*args, **kwargs)
-            result['export_type'] = 'contacts'
+            if kwargs.pop('parallel', False):
+                return self._start_parallel_export(kwargs)
+            if kwargs.pop('incremental', False):
+                return self._execute_incremental_export(*args, **kwargs)
 
-            return result
+            # Filter and project in the database, then stream the rows
+            # Identical requests share the file of a cached or running export
+            return self._execute_shared_export(*args, **kwargs)
 
         except Exception as e:
             raise TaskExecutionError(
@@ -752,6 +1833,13 @@ class ContactsExportTask(DataExportTask):
                 details={'original_error': str(e)}
             )
 
+    def get_export_queryset(self, include_removed: bool = False) -> QuerySet:
+        """Contacts read by this export"""
+        from crm.shared.repositories.contact_repository import ContactRepository
+
+        repository = ContactRepository()
+        return repository.get_all_with_removed() if include_removed else repository.get_all()
+
     def export_contacts(self, **kwargs) -> Dict[str, Any]:
         """Public method for contacts export"""
         return self.execute(**kwargs)
@@ -766,6 +1854,39 @@ class DealsExportTask(DataExportTask):
     specifically on deal export functionality.
     """
 
+    export_type = 'deals'
+    export_sources = ('deals', 'contacts', 'users')
+    export_columns = {
+        'id': ExportColumn('id'),
+        'title': ExportColumn('title'),
+        'description': ExportColumn('description'),
+        'value': ExportColumn('value'),
+        'stage': ExportColumn('stage'),
+        'probability': ExportColumn('probability'),
+        'expected_close_date': ExportColumn('expected_close_date'),
+        'actual_close_date': ExportColumn('closed_date'),
+        'assigned_to_id': ExportColumn('owner_id'),
+        'assigned_to_name': ExportColumn('owner__first_name', 'owner__last_name', convert=_full_name),
+        'contact_id': ExportColumn('contact_id'),
+        'contact_name': ExportColumn('contact__first_name', 'contact__last_name', convert=_full_name),
+        'created_at': ExportColumn('created_at'),
+        'updated_at': ExportColumn('updated_at'),
+    }
+    filterable_fields = {
+        'id': 'id',
+        'title': 'title',
+        'value': 'value',
+        'stage': 'stage',
+        'probability': 'probability',
+        'expected_close_date': 'expected_close_date',
+        'actual_close_date': 'closed_date',
+        'assigned_to_id': 'owner_id',
+        'contact_id': 'contact_id',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
+    removed_marker = 'is_archived'
+
     def execute(self, *args, **kwargs) -> Dict[str, Any]:
         """
         Export deals data.
@@ -774,40 +1895,14 @@ class DealsExportTask(DataExportTask):
             Dict[str, Any]: Export result with download information
         """
         try:
-            from ..repositories.deal_repository import DealRepository
-
-            # Get deals data
-            repo = DealRepository()
-            deals = repo.get_all()
-
-            # Convert to list of dicts
-            deals_data = []
-            for deal in deals:
-                deals_data.append({
-                    'id': deal.id,
-                    'title': deal.title,
-                    'description': deal.description,
-                    'value': float(deal.value) if deal.value else 0,
-                    'stage': deal.stage,
-                    'probability': deal.probability,
-                    'expected_close_date': deal.expected_close_date.isoformat() if deal.expected_close_date else None,
-                    'actual_close_date': deal.actual_close_date.isoformat() if deal.actual_close_date else None,
-                    'assigned_to_id': deal.assigned_to.id if deal.assigned_to else None,
-                    'assigned_to_name': deal.assigned_to.get_full_name() if deal.assigned_to else None,
-                    'contact_id': deal.contact.id if deal.contact else None,
-                    'contact_name': f"{deal.contact.first_name} {deal.contact.last_name}" if deal.contact else None,
-                    'created_at': deal.created_at,
-                    'updated_at': deal.updated_at,
-                })
-
-            # Add deal-specific data to kwargs
-            kwargs['data'] = deals_data
-
-            # Call parent export method
-            result = super().execute(*args, **kwargs)
-            result['export_type'] = 'deals'
+            if kwargs.pop('parallel', False):
+                return self._start_parallel_export(kwargs)
+            if kwargs.pop('incremental', False):
+                return self._execute_incremental_export(*args, **kwargs)
 
-            return result
+            # Filter and project in the database; owner and contact names come from joins
+            # Identical requests share the file of a cached or running export
+            return self._execute_shared_export(*args, **kwargs)
 
         except Exception as e:
             raise TaskExecutionError(
@@ -816,6 +1911,13 @@ class DealsExportTask(DataExportTask):
                 details={'original_error': str(e)}
             )
 
+    def get_export_queryset(self, include_removed: bool = False) -> QuerySet:
+        """Deals read by this export"""
+        from crm.shared.repositories.deal_repository import DealRepository
+
+        repository = DealRepository()
+        return repository.get_all_with_removed() if include_removed else repository.get_all()
+
     def export_deals(self, **kwargs) -> Dict[str, Any]:
         """Public method for deals export"""
         return self.execute(**kwargs)
@@ -830,6 +1932,42 @@ class ActivitiesExportTask(DataExportTask):
     specifically on activity export functionality.
     """
 
+    export_type = 'activities'
+    export_sources = ('activities', 'contacts', 'deals', 'users')
+    export_columns = {
+        'id': ExportColumn('id'),
+        'title': ExportColumn('title'),
+        'description': ExportColumn('description'),
+        'type': ExportColumn('type'),
+        'priority': ExportColumn('priority'),
+        'status': ExportColumn('is_cancelled', 'is_completed', 'scheduled_at', convert=_activity_status),
+        'due_date': ExportColumn('scheduled_at'),
+        'completed_date': ExportColumn('completed_at'),
+        'assigned_to_id': ExportColumn('owner_id'),
+        'assigned_to_name': ExportColumn('owner__first_name', 'owner__last_name', convert=_full_name),
+        'contact_id': ExportColumn('contact_id'),
+        'contact_name': ExportColumn('contact__first_name', 'contact__last_name', convert=_full_name),
+        'deal_id': ExportColumn('deal_id'),
+        'deal_title': ExportColumn('deal__title'),
+        'created_at': ExportColumn('created_at'),
+        'updated_at': ExportColumn('updated_at'),
+    }
+    filterable_fields = {
+        'id': 'id',
+        'title': 'title',
+        'type': 'type',
+        'priority': 'priority',
+        'is_completed': 'is_completed',
+        'due_date': 'scheduled_at',
+        'completed_date': 'completed_at',
+        'assigned_to_id': 'owner_id',
+        'contact_id': 'contact_id',
+        'deal_id': 'deal_id',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
+    removed_marker = 'is_cancelled'
+
     def execute(self, *args, **kwargs) -> Dict[str, Any]:
         """
         Export activities data.
@@ -838,42 +1976,14 @@ class ActivitiesExportTask(DataExportTask):
             Dict[str, Any]: Export result with download information
         """
         try:
-            from ..repositories.activity_repository import ActivityRepository
-
-            # Get activities data
-            repo = ActivityRepository()
-            activities = repo.get_all()
-
-            # Convert to list of dicts
-            activities_data = []
-            for activity in activities:
-                activities_data.append({
-                    'id': activity.id,
-                    'title': activity.title,
-                    'description': activity.description,
-                    'type': activity.type,
-                    'priority': activity.priority,
-                    'status': activity.status,
-                    'due_date': activity.due_date.isoformat() if activity.due_date else None,
-                    'completed_date': activity.completed_date.isoformat() if activity.completed_date else None,
-                    'assigned_to_id': activity.assigned_to.id if activity.assigned_to else None,
-                    'assigned_to_name': activity.assigned_to.get_full_name() if activity.assigned_to else None,
-                    'contact_id': activity.contact.id if activity.contact else None,
-                    'contact_name': f"{activity.contact.first_name} {activity.contact.last_name}" if activity.contact else None,
-                    'deal_id': activity.deal.id if activity.deal else None,
-                    'deal_title': activity.deal.title if activity.deal else None,
-                    'created_at': activity.created_at,
-                    'updated_at': activity.updated_at,
-                })
-
-            # Add activity-specific data to kwargs
-            kwargs['data'] = activities_data
-
-            # Call parent export method
-            result = super().execute(*args, **kwargs)
-            result['export_type'] = 'activities'
+            if kwargs.pop('parallel', False):
+                return self._start_parallel_export(kwargs)
+            if kwargs.pop('incremental', False):
+                return self._execute_incremental_export(*args, **kwargs)
 
-            return result
+            # Filter and project in the database; owner, contact and deal come from joins
+            # Identical requests share the file of a cached or running export
+            return self._execute_shared_export(*args, **kwargs)
 
         except Exception as e:
             raise TaskExecutionError(
@@ -882,6 +1992,13 @@ class ActivitiesExportTask(DataExportTask):
                 details={'original_error': str(e)}
             )
 
+    def get_export_queryset(self, include_removed: bool = False) -> QuerySet:
+        """Activities read by this export"""
+        from crm.shared.repositories.activity_repository import ActivityRepository
+
+        repository = ActivityRepository()
+        return repository.get_all_with_removed() if include_removed else repository.get_all()
+
     def export_activities(self, **kwargs) -> Dict[str, Any]:
         """Public method for activities export"""
         return self.execute(**kwargs)
@@ -896,6 +2013,32 @@ class UsersExportTask(DataExportTask):
     specifically on user export functionality with permission checks.
     """
 
+    export_type = 'users'
+    export_sources = ('users',)
+    export_columns = {
+        'id': ExportColumn('id'),
+        'username': ExportColumn(User.USERNAME_FIELD),
+        'email': ExportColumn('email'),
+        'first_name': ExportColumn('first_name'),
+        'last_name': ExportColumn('last_name'),
+        'role': ExportColumn('role'),
+        'is_active': ExportColumn('is_active'),
+        'is_staff': ExportColumn('is_staff'),
+        'date_joined': ExportColumn('date_joined'),
+        'last_login': ExportColumn('last_login'),
+    }
+    filterable_fields = {
+        'id': 'id',
+        'email': 'email',
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'role': 'role',
+        'is_active': 'is_active',
+        'is_staff': 'is_staff',
+        'date_joined': 'date_joined',
+        'last_login': 'last_login',
+    }
+
     def execute(self, *args, **kwargs) -> Dict[str, Any]:
         """
         Export users data (admin only).
@@ -928,36 +2071,14 @@ class UsersExportTask(DataExportTask):
                     field_value=requested_by
                 )
 
-            from ..repositories.user_repository import UserRepository
-
-            # Get users data
-            repo = UserRepository()
-            users = repo.get_all()
-
-            # Convert to list of dicts (exclude sensitive data)
-            users_data = []
-            for user_obj in users:
-                users_data.append({
-                    'id': user_obj.id,
-                    'username': user_obj.username,
-                    'email': user_obj.email,
-                    'first_name': user_obj.first_name,
-                    'last_name': user_obj.last_name,
-                    'role': getattr(user_obj, 'role', 'User'),
-                    'is_active': user_obj.is_active,
-                    'is_staff': user_obj.is_staff,
-                    'date_joined': user_obj.date_joined,
-                    'last_login': user_obj.last_login,
-                })
-
-            # Add user-specific data to kwargs
-            kwargs['data'] = users_data
-
-            # Call parent export method
-            result = super().execute(*args, **kwargs)
-            result['export_type'] = 'users'
+            if kwargs.pop('parallel', False):
+                return self._start_parallel_export(kwargs)
+            if kwargs.pop('incremental', False):
+                return self._execute_incremental_export(*args, **kwargs)
 
-            return result
+            # Filter and project the non-sensitive columns in the database
+            # Identical requests share the file of a cached or running export
+            return self._execute_shared_export(*args, **kwargs)
 
         except TaskValidationError:
             raise
@@ -968,6 +2089,27 @@ class UsersExportTask(DataExportTask):
                 details={'original_error': str(e)}
             )
 
+    def get_export_queryset(self, include_removed: bool = False) -> QuerySet:
+        """Users read by this export"""
+        from crm.shared.repositories.user_repository import UserRepository
+
+        repository = UserRepository()
+        return repository.get_all_with_removed() if include_removed else repository.get_all()
+
     def export_users(self, **kwargs) -> Dict[str, Any]:
         """Public method for users export"""
-        return self.execute(**kwargs)
\ No newline at end of file
+        return self.execute(**kwargs)
+
+
+@shared_task(bind=True, base=DataExportTask, name='export_shard')
+def export_shard(self, index: int, low: Optional[int], high: Optional[int], options: Dict[str, Any]) -> Dict[str, Any]:
+    """Export one primary key range of a parallel export, reporting progress to the export"""
+    self.task_id = options['export_id']
+    return self._export_shard(index, low, high, options)
+
+
+@shared_task(bind=True, base=DataExportTask, name='merge_export_shards')
+def merge_export_shards(self, shard_results: List[Dict[str, Any]], options: Dict[str, Any]) -> Dict[str, Any]:
+    """Chord callback joining the parts of a parallel export"""
+    self.task_id = options['export_id']
+    return self._merge_export_shards(shard_results, options)
@@ -0,0 +1,81 @@
+"""
+Background Task Models
+Following SOLID principles and enterprise best practices
+"""
+
+import hashlib
+import json
+
+from django.db import models
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
+
+User = get_user_model()
+
+
+class ExportWatermark(models.Model):
+    """
+    High-water mark of an incremental export
+
+    One row per user, export type and filter set. The next incremental
+    export with the same key exports rows updated after ``watermark``.
+    """
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='export_watermarks',
+        verbose_name=_('user')
+    )
+
+    export_type = models.CharField(
+        _('export type'),
+        max_length=50
+    )
+
+    filters_hash = models.CharField(
+        _('filters hash'),
+        max_length=64,
+        help_text=_('SHA-256 of the canonical filter set')
+    )
+
+    filters = models.JSONField(
+        _('filters'),
+        default=dict,
+        blank=True
+    )
+
+    watermark = models.DateTimeField(
+        _('watermark'),
+        help_text=_('Rows updated up to this time have been exported')
+    )
+
+    created_at = models.DateTimeField(
+        _('created at'),
+        auto_now_add=True
+    )
+
+    updated_at = models.DateTimeField(
+        _('updated at'),
+        auto_now=True
+    )
+
+    class Meta:
+        db_table = 'export_watermarks'
+        verbose_name = _('Export Watermark')
+        verbose_name_plural = _('Export Watermarks')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'export_type', 'filters_hash'],
+                name='unique_export_watermark'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.export_type} {self.filters_hash[:8]}: {self.watermark.isoformat()}"
+
+    @staticmethod
+    def hash_filters(filters):
+        """Stable hash of a filter set, independent of key order"""
+        canonical = json.dumps(filters or {}, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
@@ -360,17 +360,21 @@ class ReportGenerationTask(BaseTask):
     def _collect_pipeline_data(self, start_date: Optional[date], end_date: Optional[date]) -> Dict[str, Any]:
         """Collect deal pipeline data"""
         try:
-            from ..repositories.deal_repository import DealRepository
+            from ...shared.repositories.deal_repository import DealRepository
 
             repo = DealRepository()
             deals_by_stage = repo.get_deals_by_stage()
-            pipeline_summary = repo.get_pipeline_summary()
+            # Point-in-time figures come from the daily snapshot rollup
+            pipeline_summary = repo.get_pipeline_summary(as_of=end_date)
 
-            return {
+            data = {
                 'deals_by_stage': deals_by_stage,
                 'pipeline_summary': pipeline_summary,
                 'conversion_metrics': self._calculate_conversion_metrics(deals_by_stage)
             }
+            if start_date and end_date:
+                data['pipeline_trend'] = repo.get_pipeline_trend(start_date, end_date)
+            return data
         except Exception as e:
             raise TaskExecutionError(
                 f"Failed to collect pipeline data: {str(e)}",
@@ -17,6 +17,7 @@ from django.contrib.auth import get_user_model
 from django.core.files.base import ContentFile
 from django.utils import timezone
 from django.core.management import call_command
+from celery import current_app
 
 from ..base_tasks import TaskStatus
 from ..export_tasks import (
@@ -39,6 +40,22 @@ from ..exceptions import (
 User = get_user_model()
 
 
+def push_task_request(task, request):
+    """Give a directly instantiated task the request context a worker would push"""
+    if task.request_stack is None:
+        task.bind(current_app)
+    task.push_request(id=request.id, retries=request.retries, hostname=request.hostname)
+
+
+def mock_export_queryset(model, rows):
+    """Stand-in for get_export_queryset whose values() rows are the given dicts"""
+    queryset = MagicMock(model=model)
+    queryset.filter.return_value = queryset
+    queryset.count.return_value = len(rows)
+    queryset.values.return_value.iterator.return_value = iter(rows)
+    return queryset
+
+
 class TestExportFormat:
     """Test the ExportFormat enum for export type management"""
 
@@ -221,23 +238,35 @@ class TestDataExportTask(TestCase):
 
     def test_export_excel_format_success(self):
         """Test successful Excel export"""
+        import os
+
         task = DataExportTask()
-        task.request = self.mock_task.request
+        push_task_request(task, self.mock_task.request)
 
-        with patch.object(task, 'set_task_status') as mock_set_status:
-            with patch('pandas.DataFrame.to_excel') as mock_to_excel:
-                mock_to_excel.return_value = None
+        openpyxl = pytest.importorskip('openpyxl')
 
+        with patch.object(task, 'set_task_status') as mock_set_status:
+            with override_settings(EXPORT_EXCEL_MAX_ROWS=3):
                 result = task.export_data(
-                    data=self.sample_data,
+                    data=iter(self.sample_data),
                     format=ExportFormat.EXCEL,
                     filename='test_contacts',
                     requested_by=self.user.id
                 )
 
-                self.assertTrue(result['success'])
-                self.assertEqual(result['format'], ExportFormat.EXCEL.value)
-                mock_to_excel.assert_called_once()
+        # The workbook is really written to EXPORT_TEMP_DIR
+        self.addCleanup(os.remove, result['file_path'])
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['format'], ExportFormat.EXCEL.value)
+        self.assertEqual(result['total_records'], len(self.sample_data))
+
+        # Sheets hold two rows under their header before the next one starts
+        workbook = openpyxl.load_workbook(result['file_path'], read_only=True)
+        self.addCleanup(workbook.close)
+        self.assertEqual(workbook.sheetnames, ['Export Data', 'Export Data 2'])
+        second_sheet = list(workbook['Export Data 2'].iter_rows(values_only=True))
+        self.assertEqual(second_sheet, [('id', 'name', 'email'), ('3', 'Bob Johnson', 'bob@example.com')])
 
     def test_export_with_progress_tracking(self):
         """Test export with progress tracking"""
@@ -420,6 +449,74 @@ class TestDataExportTask(TestCase):
 
         self.assertEqual(parsed_data, self.sample_data)
 
+    def test_jsonl_writer_functionality(self):
+        """Test JSON Lines writer functionality"""
+        task = DataExportTask()
+
+        output = StringIO()
+        written = task._write_jsonl(output, iter(self.sample_data))
+
+        lines = output.getvalue().strip().split('\n')
+        self.assertEqual(written, len(self.sample_data))
+        self.assertEqual([json.loads(line) for line in lines], self.sample_data)
+
+    @override_settings(EXPORT_CHUNK_SIZE=100)
+    def test_export_streams_generator_in_chunks(self):
+        """Test a generator source is filtered and written chunk by chunk"""
+        task = DataExportTask()
+        push_task_request(task, self.mock_task.request)
+        rows = ({'id': i, 'name': f'User {i}', 'email': f'user{i}@example.com'} for i in range(1000))
+
+        with patch.object(task, 'set_task_status') as mock_set_status:
+            with patch.object(task, '_clean_data_for_export', wraps=task._clean_data_for_export) as mock_clean:
+                result = task.export_data(
+                    data=rows,
+                    total_items=1000,
+                    format=ExportFormat.JSONL,
+                    filename='streamed_export',
+                    requested_by=self.user.id,
+                    filters={'name__icontains': 'User 1'},
+                    fields=['id', 'name'],
+                    compress=False
+                )
+
+        # One cleaning pass per chunk, never over the whole export
+        self.assertEqual(mock_clean.call_count, 10)
+        self.assertEqual(result['total_records'], 111)
+        with open(result['file_path'], encoding='utf-8') as exported:
+            first_row = json.loads(exported.readline())
+        self.assertEqual(first_row, {'id': '1', 'name': 'User 1'})
+
+        chunk_progress = [call[1]['progress'] for call in mock_set_status.call_args_list
+                          if 30 < call[1].get('progress', 0) <= 80]
+        self.assertEqual(chunk_progress[-1], 80)
+
+    def test_export_parquet_keeps_typed_columns(self):
+        """Test Parquet export writes typed columns instead of cleaned strings"""
+        pq = pytest.importorskip('pyarrow.parquet')
+        task = DataExportTask()
+        push_task_request(task, self.mock_task.request)
+        exported_at = timezone.now()
+        rows = [
+            {'id': i, 'value': Decimal('10.50'), 'is_active': i % 2 == 0, 'exported_at': exported_at}
+            for i in range(5)
+        ]
+
+        with patch.object(task, 'set_task_status'):
+            result = task.export_data(
+                data=rows,
+                format=ExportFormat.PARQUET,
+                filename='typed_export',
+                requested_by=self.user.id,
+                compress=False
+            )
+
+        table = pq.read_table(result['file_path'])
+        self.assertEqual(result['total_records'], 5)
+        self.assertEqual(table.column('value').to_pylist()[0], Decimal('10.50'))
+        self.assertEqual(table.column('is_active').to_pylist()[:2], [True, False])
+        self.assertEqual(table.column('exported_at').to_pylist()[0], exported_at)
+
     def test_field_filtering_functionality(self):
         """Test field selection functionality"""
         task = DataExportTask()
@@ -482,6 +579,33 @@ class TestDataExportTask(TestCase):
             self.assertEqual(compressed_file, '/tmp/test.csv.zip')
             mock_zipfile.assert_called_once()
 
+    def test_export_compresses_while_writing(self):
+        """Test the requested compression is applied as the export is written"""
+        import gzip
+        import os
+
+        task = DataExportTask()
+        push_task_request(task, self.mock_task.request)
+
+        with patch.object(task, 'set_task_status'):
+            result = task.export_data(
+                data=self.sample_data,
+                format=ExportFormat.CSV,
+                requested_by=self.user.id,
+                compression='gzip'
+            )
+
+        self.assertTrue(result['file_path'].endswith('.csv.gz'))
+        self.assertEqual(result['compression'], 'gzip')
+        self.assertFalse(os.path.exists(result['file_path'][:-len('.gz')]))
+        with gzip.open(result['file_path'], 'rt', newline='') as exported:
+            rows = list(csv.DictReader(exported))
+        self.assertEqual([row['email'] for row in rows], [row['email'] for row in self.sample_data])
+
+        # Small exports without a requested compression stay uncompressed
+        self.assertFalse(task._should_compress(task._estimate_export_size(len(self.sample_data))))
+        self.assertTrue(task._should_compress(None))
+
 
 class TestContactsExportTask(TestCase):
     """Test the ContactsExportTask class"""
@@ -499,11 +623,12 @@ class TestContactsExportTask(TestCase):
             password='testpass123'
         )
 
-    @patch('crm.shared.repositories.contact_repository.ContactRepository.get_all')
-    def test_export_contacts_success(self, mock_get_all):
+    def test_export_contacts_success(self):
         """Test successful contacts export"""
+        from crm.apps.contacts.models import Contact
+
         task = ContactsExportTask()
-        task.request = self.mock_task.request
+        push_task_request(task, self.mock_task.request)
 
         # Mock contact data
         mock_contacts = [
@@ -526,10 +651,11 @@ class TestContactsExportTask(TestCase):
                 'created_at': timezone.now(),
             },
         ]
-        mock_get_all.return_value = mock_contacts
+        queryset = mock_export_queryset(Contact, mock_contacts)
 
-        with patch.object(task, 'export_data') as mock_export:
-            mock_export.return_value = {
+        with patch.object(task, 'get_export_queryset', return_value=queryset), \
+                patch.object(DataExportTask, 'execute') as mock_execute:
+            mock_execute.return_value = {
                 'success': True,
                 'total_records': len(mock_contacts),
                 'file_path': '/tmp/contacts_export.csv'
@@ -546,20 +672,24 @@ class TestContactsExportTask(TestCase):
             self.assertEqual(result['export_type'], 'contacts')
             self.assertEqual(result['total_records'], len(mock_contacts))
 
-            # Verify export_data was called with correct parameters
-            mock_export.assert_called_once()
-            call_args = mock_export.call_args[1]
-            self.assertEqual(call_args['data'], mock_contacts)
+            # Filters run in the database and only the selected fields are streamed
+            queryset.filter.assert_called_once_with(company__exact='ACME Corp')
+            mock_execute.assert_called_once()
+            call_args = mock_execute.call_args[1]
+            self.assertEqual(list(call_args['data']), [
+                {field: contact[field] for field in ('first_name', 'last_name', 'email')}
+                for contact in mock_contacts
+            ])
             self.assertEqual(call_args['format'], ExportFormat.CSV)
             self.assertEqual(call_args['requested_by'], self.user.id)
 
     def test_export_contacts_with_repository_error(self):
         """Test contacts export with repository error"""
         task = ContactsExportTask()
-        task.request = self.mock_task.request
+        push_task_request(task, self.mock_task.request)
 
-        with patch('crm.shared.repositories.contact_repository.ContactRepository.get_all') as mock_get_all:
-            mock_get_all.side_effect = Exception("Database connection failed")
+        with patch.object(task, 'get_export_queryset') as mock_get_queryset:
+            mock_get_queryset.side_effect = Exception("Database connection failed")
 
             with self.assertRaises(TaskExecutionError):
                 task.export_contacts(
@@ -567,6 +697,181 @@ class TestContactsExportTask(TestCase):
                     requested_by=self.user.id
                 )
 
+    def test_export_contacts_filters_and_fields_run_in_database(self):
+        """Test export filters become a WHERE clause and fields the selected columns"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from crm.apps.contacts.models import Contact
+
+        for i, company in enumerate(['ACME Corp', 'XYZ Inc', 'XYZ Inc']):
+            Contact.objects.create(
+                first_name=f'Contact{i}', last_name='Doe', email=f'contact{i}@example.com',
+                company=company, title='CEO', owner=self.user
+            )
+
+        task = ContactsExportTask()
+        push_task_request(task, self.mock_task.request)
+        with patch.object(task, 'set_task_status'):
+            with CaptureQueriesContext(connection) as queries:
+                result = task.export_contacts(
+                    format=ExportFormat.JSONL,
+                    requested_by=self.user.id,
+                    filters={'company': 'ACME Corp'},
+                    fields=['email', 'job_title'],
+                    compress=False
+                )
+
+        self.assertEqual(result['total_records'], 1)
+        with open(result['file_path'], encoding='utf-8') as exported:
+            self.assertEqual(
+                json.loads(exported.readline()),
+                {'email': 'contact0@example.com', 'job_title': 'CEO'}
+            )
+
+        select = next(query['sql'] for query in queries if 'SELECT' in query['sql'] and '"title"' in query['sql'])
+        self.assertIn('"company" = ', select)
+        self.assertNotIn('"phone"', select)
+
+        with self.assertRaises(TaskExecutionError):
+            task.export_contacts(
+                format=ExportFormat.CSV,
+                requested_by=self.user.id,
+                filters={'owner__password__startswith': 'pbkdf2'}
+            )
+
+    @override_settings(
+        EXPORT_SHARD_MIN_ROWS=3,
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    )
+    def test_export_contacts_parallel_merges_shards_in_key_order(self):
+        """Test a parallel export writes key ranges as shards and merges them into one file"""
+        import os
+        from django.conf import settings
+        from django.core.cache import cache
+        from crm.apps.contacts.models import Contact
+        from .. import export_tasks
+
+        merged = []
+
+        def run_chord(shards):
+            """Run the shards and then the merge callback in process, as a worker would"""
+            def run(callback):
+                merged.append(callback.apply(args=([shard.apply().get() for shard in shards],)).get())
+            return run
+
+        contacts = [
+            Contact.objects.create(
+                first_name=f'Contact{i}', last_name='Doe', email=f'contact{i}@example.com', owner=self.user
+            )
+            for i in range(5)
+        ]
+
+        task = ContactsExportTask()
+        with patch.object(export_tasks, 'chord', side_effect=run_chord):
+            result = task.export_contacts(
+                format=ExportFormat.CSV,
+                requested_by=self.user.id,
+                fields=['id', 'email'],
+                parallel=True,
+                shards=3,
+                compress=False
+            )
+
+        self.assertTrue(result['parallel'])
+        self.assertEqual(result['shards'], 2)
+        self.assertEqual(result['total_records'], 5)
+
+        status = cache.get(f"task_status_{result['export_id']}")
+        self.assertEqual(status['status'], TaskStatus.SUCCESS.value)
+        self.assertEqual(status['metadata']['total_records'], 5)
+
+        filename = status['metadata']['download_url'].rstrip('/').rsplit('/', 1)[-1]
+        with open(os.path.join(getattr(settings, 'EXPORT_TEMP_DIR', '/tmp'), filename), encoding='utf-8') as exported:
+            rows = list(csv.DictReader(exported))
+        self.assertEqual([row['id'] for row in rows], [str(contact.id) for contact in contacts])
+        self.assertEqual(merged[0]['requested_by'], self.user.username)
+
+        with self.assertRaises(TaskExecutionError):
+            task.export_contacts(format=ExportFormat.EXCEL, requested_by=self.user.id, parallel=True)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_export_contacts_identical_requests_share_file_until_data_changes(self):
+        """Test identical export requests reuse one file and a contact write expires it"""
+        from crm.apps.contacts.models import Contact
+
+        contact = Contact.objects.create(
+            first_name='Contact', last_name='Doe', email='contact@example.com', company='ACME Corp', owner=self.user
+        )
+
+        def export(**kwargs):
+            with patch.object(ContactsExportTask, 'set_task_status'):
+                return ContactsExportTask().export_contacts(
+                    format=ExportFormat.CSV, requested_by=self.user.id, fields=['email'], **kwargs
+                )
+
+        first = export(filters={'company': 'ACME Corp'})
+        repeated = export(filters={'company__exact': 'ACME Corp'})
+        self.assertNotIn('cached', first)
+        self.assertTrue(repeated['cached'])
+        self.assertEqual(repeated['file_path'], first['file_path'])
+
+        # Other columns are a different request
+        other_fields = ContactsExportTask().export_contacts(
+            format=ExportFormat.CSV, requested_by=self.user.id, fields=['company'],
+            filters={'company': 'ACME Corp'}
+        )
+        self.assertNotEqual(other_fields['file_path'], first['file_path'])
+
+        contact.email = 'renamed@example.com'
+        contact.save()
+
+        refreshed = export(filters={'company': 'ACME Corp'})
+        self.assertNotIn('cached', refreshed)
+        with open(refreshed['file_path'], encoding='utf-8') as exported:
+            self.assertIn('renamed@example.com', exported.read())
+
+    @override_settings(EXPORT_WATERMARK_LAG_SECONDS=0)
+    def test_export_contacts_incremental_exports_changes_since_watermark(self):
+        """Test incremental exports only write rows changed since the last run, with soft deletes"""
+        from crm.apps.contacts.models import Contact
+        from crm.apps.tasks.models import ExportWatermark
+
+        contacts = [
+            Contact.objects.create(
+                first_name=f'Contact{i}', last_name='Doe', email=f'contact{i}@example.com', owner=self.user
+            )
+            for i in range(3)
+        ]
+
+        def export_changes():
+            with patch.object(ContactsExportTask, 'set_task_status'):
+                result = ContactsExportTask().export_contacts(
+                    format=ExportFormat.CSV,
+                    requested_by=self.user.id,
+                    fields=['email'],
+                    incremental=True,
+                    compress=False
+                )
+            with open(result['file_path'], encoding='utf-8') as exported:
+                return result, [(row['op'], row['email']) for row in csv.DictReader(exported)]
+
+        result, changes = export_changes()
+        self.assertIsNone(result['changes_since'])
+        self.assertEqual(changes, [('upsert', contact.email) for contact in contacts])
+
+        contacts[0].first_name = 'Renamed'
+        contacts[0].save()
+        contacts[1].delete()
+
+        result, changes = export_changes()
+        self.assertIsNotNone(result['changes_since'])
+        self.assertEqual(changes, [('upsert', contacts[0].email), ('delete', contacts[1].email)])
+
+        result, changes = export_changes()
+        self.assertEqual(result['total_records'], 0)
+        self.assertEqual(changes, [])
+        self.assertEqual(ExportWatermark.objects.filter(user=self.user, export_type='contacts').count(), 1)
+
 
 class TestDealsExportTask(TestCase):
     """Test the DealsExportTask class"""
@@ -584,11 +889,12 @@ class TestDealsExportTask(TestCase):
             password='testpass123'
         )
 
-    @patch('crm.shared.repositories.deal_repository.DealRepository.get_all')
-    def test_export_deals_success(self, mock_get_all):
+    def test_export_deals_success(self):
         """Test successful deals export"""
+        from crm.apps.deals.models import Deal
+
         task = DealsExportTask()
-        task.request = self.mock_task.request
+        push_task_request(task, self.mock_task.request)
 
         # Mock deal data
         mock_deals = [
@@ -613,10 +919,11 @@ class TestDealsExportTask(TestCase):
                 'created_at': timezone.now(),
             },
         ]
-        mock_get_all.return_value = mock_deals
+        queryset = mock_export_queryset(Deal, mock_deals)
 
-        with patch.object(task, 'export_data') as mock_export:
-            mock_export.return_value = {
+        with patch.object(task, 'get_export_queryset', return_value=queryset), \
+                patch.object(DataExportTask, 'execute') as mock_execute:
+            mock_execute.return_value = {
                 'success': True,
                 'total_records': len(mock_deals),
                 'file_path': '/tmp/deals_export.csv'
@@ -650,11 +957,12 @@ class TestActivitiesExportTask(TestCase):
             password='testpass123'
         )
 
-    @patch('crm.shared.repositories.activity_repository.ActivityRepository.get_all')
-    def test_export_activities_success(self, mock_get_all):
+    def test_export_activities_success(self):
         """Test successful activities export"""
+        from crm.apps.activities.models import Activity
+
         task = ActivitiesExportTask()
-        task.request = self.mock_task.request
+        push_task_request(task, self.mock_task.request)
 
         # Mock activity data
         mock_activities = [
@@ -664,7 +972,7 @@ class TestActivitiesExportTask(TestCase):
                 'description': 'Discuss proposal details',
                 'type': 'Call',
                 'priority': 'High',
-                'due_date': timezone.now() + timedelta(hours=2),
+                'scheduled_at': timezone.now() + timedelta(hours=2),
                 'assigned_to': self.user,
                 'status': 'Pending',
                 'created_at': timezone.now(),
@@ -675,16 +983,17 @@ class TestActivitiesExportTask(TestCase):
                 'description': 'Email revised proposal',
                 'type': 'Email',
                 'priority': 'Normal',
-                'due_date': timezone.now() + timedelta(days=1),
+                'scheduled_at': timezone.now() + timedelta(days=1),
                 'assigned_to': self.user,
                 'status': 'Pending',
                 'created_at': timezone.now(),
             },
         ]
-        mock_get_all.return_value = mock_activities
+        queryset = mock_export_queryset(Activity, mock_activities)
 
-        with patch.object(task, 'export_data') as mock_export:
-            mock_export.return_value = {
+        with patch.object(task, 'get_export_queryset', return_value=queryset), \
+                patch.object(DataExportTask, 'execute') as mock_execute:
+            mock_execute.return_value = {
                 'success': True,
                 'total_records': len(mock_activities),
                 'file_path': '/tmp/activities_export.csv'
@@ -693,7 +1002,7 @@ class TestActivitiesExportTask(TestCase):
             result = task.export_activities(
                 format=ExportFormat.CSV,
                 requested_by=self.user.id,
-                filters={'status': 'Pending'},
+                filters={'is_completed': False},
                 fields=['title', 'type', 'due_date']
             )
 
@@ -720,11 +1029,10 @@ class TestUsersExportTask(TestCase):
             is_staff=True
         )
 
-    @patch('crm.shared.repositories.user_repository.UserRepository.get_all')
-    def test_export_users_success(self, mock_get_all):
+    def test_export_users_success(self):
         """Test successful users export"""
         task = UsersExportTask()
-        task.request = self.mock_task.request
+        push_task_request(task, self.mock_task.request)
 
         # Mock user data
         mock_users = [
@@ -749,10 +1057,11 @@ class TestUsersExportTask(TestCase):
                 'date_joined': timezone.now(),
             },
         ]
-        mock_get_all.return_value = mock_users
+        queryset = mock_export_queryset(User, mock_users)
 
-        with patch.object(task, 'export_data') as mock_export:
-            mock_export.return_value = {
+        with patch.object(task, 'get_export_queryset', return_value=queryset), \
+                patch.object(DataExportTask, 'execute') as mock_execute:
+            mock_execute.return_value = {
                 'success': True,
                 'total_records': len(mock_users),
                 'file_path': '/tmp/users_export.csv'
@@ -55,6 +55,12 @@ CACHES = {
     }
 }
 
+# In-process L1 cache for repository point lookups (per worker, short TTL)
+REPOSITORY_L1_CACHE_ENABLED = True
+REPOSITORY_L1_CACHE_TIMEOUT = 5
+REPOSITORY_L1_CACHE_MAX_ENTRIES = 2000
+REPOSITORY_L1_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
@@ -0,0 +1,275 @@
+"""
+Deal Column Store - KISS principle for in-process dashboard aggregations
+Per-process NumPy copy of the deal table, refreshed by updated_at watermark
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timedelta, timezone as dt_timezone
+from typing import Dict, Optional
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = 'deal_column_store:generation'
+CLOSED_STAGES = ('closed_won', 'closed_lost')
+
+_store = None
+_store_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class DealColumns:
+    """
+    Immutable column arrays, one entry per non-archived deal, sorted by id
+
+    Dates are NaT when the column is null. ``created_date`` is in the
+    current timezone; the ``*_utc_date`` columns match the UTC dates the
+    database aggregates use for sales-cycle lengths.
+    """
+    ids: np.ndarray
+    value: np.ndarray
+    probability: np.ndarray
+    stage: np.ndarray
+    currency: np.ndarray
+    owner: np.ndarray
+    created_ts: np.ndarray
+    created_date: np.ndarray
+    created_utc_date: np.ndarray
+    closed_utc_date: np.ndarray
+    expected_close: np.ndarray
+
+    def __len__(self):
+        return len(self.ids)
+
+    def take(self, index):
+        """Columns restricted to an index or boolean mask"""
+        return DealColumns(**{name: column[index] for name, column in self.__dict__.items()})
+
+
+def bump_deal_column_generation():
+    """
+    Tell every process to reload its store on the next refresh
+
+    The updated_at watermark cannot see deleted rows, so Deal.delete calls
+    this instead.
+    """
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, 1, None)
+
+
+def get_deal_column_store():
+    """
+    Get the per-process store, or None when DEAL_COLUMN_STORE_ENABLED is off
+
+    Callers fall back to database aggregates when this returns None.
+    """
+    global _store
+    if not getattr(settings, 'DEAL_COLUMN_STORE_ENABLED', False):
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = DealColumnStore()
+    return _store
+
+
+class DealColumnStore:
+    """
+    Columnar snapshot of the deal table for group-by style aggregations
+
+    The database stays the source of truth: at most every refresh_interval
+    seconds one indexed query fetches rows with updated_at at or after the
+    watermark and upserts them. Deletes (signalled through the cache
+    generation) and full_refresh_interval force a full reload, which also
+    picks up queryset.update() writes that skip auto_now. The generation
+    only reaches other processes through a shared cache; with a per-process
+    or dummy cache, deletes show up at the next full refresh.
+    """
+
+    def __init__(self, refresh_interval=None, full_refresh_interval=None, overlap_seconds=5):
+        """Initialize with refresh intervals in seconds"""
+        self.refresh_interval = (
+            refresh_interval if refresh_interval is not None
+            else getattr(settings, 'DEAL_COLUMN_STORE_REFRESH_SECONDS', 5)
+        )
+        self.full_refresh_interval = (
+            full_refresh_interval if full_refresh_interval is not None
+            else getattr(settings, 'DEAL_COLUMN_STORE_FULL_REFRESH_SECONDS', 600)
+        )
+        # Re-read a few seconds before the watermark for rows committed late
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self._lock = threading.Lock()
+        self._columns = None
+        self._watermark = None
+        self._generation = None
+        self._checked_at = 0.0
+        self._loaded_at = 0.0
+
+        from crm.apps.deals.models import Deal
+        self.model = Deal
+        self.stage_codes = {stage: code for code, (stage, _) in enumerate(Deal.STAGE_CHOICES)}
+        self.currency_codes = {currency: code for code, (currency, _) in enumerate(Deal.CURRENCY_CHOICES)}
+        self.stage_names = list(self.stage_codes)
+
+    def columns(self) -> DealColumns:
+        """Current columns, refreshed first if the refresh interval has passed"""
+        if time.monotonic() - self._checked_at >= self.refresh_interval:
+            self.refresh()
+        return self._columns
+
+    def refresh(self, full=False):
+        """
+        Bring the columns up to date with the database
+
+        Args:
+            full: Reload every row instead of applying the changes since the watermark
+        """
+        with self._lock:
+            now = time.monotonic()
+            generation = cache.get(GENERATION_KEY)
+            full = (
+                full or self._columns is None or self._watermark is None
+                or generation != self._generation
+                or now - self._loaded_at >= self.full_refresh_interval
+            )
+
+            if full:
+                rows = self._fetch(self.model.objects.all())
+                self._columns = self._build(rows)
+                self._loaded_at = now
+                logger.info(f"Loaded {len(self._columns)} deals into the column store")
+            else:
+                since = self._watermark - self.overlap
+                rows = self._fetch(self.model.objects.all_objects().filter(updated_at__gte=since))
+                if rows:
+                    self._columns = self._upsert(self._columns, rows)
+
+            latest = max((row[-1] for row in rows), default=None)
+            if latest is not None and (self._watermark is None or latest > self._watermark):
+                self._watermark = latest
+            self._generation = generation
+            self._checked_at = now
+
+    def _fetch(self, queryset):
+        """Rows in column order, followed by is_archived and updated_at"""
+        return list(
+            queryset.annotate(
+                created_local=TruncDate('created_at'),
+                created_utc=TruncDate('created_at', tzinfo=dt_timezone.utc),
+                closed_utc=TruncDate('closed_date', tzinfo=dt_timezone.utc),
+            ).order_by('id').values_list(
+                'id', 'value', 'probability', 'stage', 'currency', 'owner_id', 'created_at',
+                'created_local', 'created_utc', 'closed_utc', 'expected_close_date',
+                'is_archived', 'updated_at'
+            )
+        )
+
+    def _build(self, rows) -> DealColumns:
+        """Convert fetched rows of non-archived deals to sorted columns"""
+        rows = [row for row in rows if not row[11]]
+        (ids, values, probabilities, stages, currencies, owners, created_at,
+         created_local, created_utc, closed_utc, expected_close) = (
+            zip(*(row[:11] for row in rows)) if rows else ([],) * 11
+        )
+        return DealColumns(
+            ids=np.array(ids, dtype=np.int64),
+            value=np.array(values, dtype=np.float64),
+            probability=np.array(probabilities, dtype=np.float64),
+            stage=np.array([self.stage_codes.get(stage, -1) for stage in stages], dtype=np.int8),
+            currency=np.array([self.currency_codes.get(code, -1) for code in currencies], dtype=np.int8),
+            owner=np.array(owners, dtype=np.int64),
+            created_ts=np.array([value.timestamp() for value in created_at], dtype=np.float64),
+            created_date=np.array(created_local, dtype='datetime64[D]'),
+            created_utc_date=np.array(created_utc, dtype='datetime64[D]'),
+            closed_utc_date=np.array(closed_utc, dtype='datetime64[D]'),
+            expected_close=np.array(expected_close, dtype='datetime64[D]'),
+        )
+
+    def _upsert(self, columns: DealColumns, rows) -> DealColumns:
+        """New columns with changed rows replaced, archived rows dropped and new rows added"""
+        changed_ids = np.array([row[0] for row in rows], dtype=np.int64)
+        keep = ~np.isin(columns.ids, changed_ids)
+        merged = {
+            name: np.concatenate([getattr(columns, name)[keep], column])
+            for name, column in self._build(rows).__dict__.items()
+        }
+        order = np.argsort(merged['ids'], kind='stable')
+        return DealColumns(**{name: column[order] for name, column in merged.items()})
+
+    def select(self, owner_id: Optional[int] = None) -> DealColumns:
+        """Columns of one owner's deals, or of all deals"""
+        columns = self.columns()
+        if owner_id is None:
+            return columns
+        return columns.take(columns.owner == owner_id)
+
+    def stage_totals(self, columns: DealColumns) -> Dict[str, Dict[str, float]]:
+        """Count and value per stage present in the columns"""
+        counts = np.bincount(columns.stage[columns.stage >= 0], minlength=len(self.stage_names))
+        values = np.bincount(
+            columns.stage[columns.stage >= 0], weights=columns.value[columns.stage >= 0],
+            minlength=len(self.stage_names)
+        )
+        return {
+            stage: {'count': int(counts[code]), 'total_value': float(values[code])}
+            for code, stage in enumerate(self.stage_names)
+            if counts[code]
+        }
+
+    def stage_mask(self, columns: DealColumns, stages) -> np.ndarray:
+        """Boolean mask of rows in any of the given stages"""
+        return np.isin(columns.stage, [self.stage_codes[stage] for stage in stages])
+
+    def deal_statistics(self, owner_id: Optional[int] = None) -> Dict[str, float]:
+        """
+        Counters behind DealRepository.get_deal_statistics
+
+        Returns:
+            Dictionary with the totals, values and average time to close
+        """
+        columns = self.select(owner_id)
+        won = self.stage_mask(columns, ('closed_won',))
+        lost = self.stage_mask(columns, ('closed_lost',))
+        closed = (won | lost) & ~np.isnat(columns.closed_utc_date)
+        thirty_days_ago = (timezone.now() - timedelta(days=30)).timestamp()
+
+        days_to_close = (columns.closed_utc_date[closed] - columns.created_utc_date[closed]).astype(np.float64)
+        return {
+            'total_deals': len(columns),
+            'open_deals': int((~(won | lost)).sum()),
+            'won_deals': int(won.sum()),
+            'lost_deals': int(lost.sum()),
+            'total_pipeline_value': float(columns.value.sum()),
+            'won_deals_value': float(columns.value[won].sum()),
+            'average_deal_size': float(columns.value.mean()) if len(columns) else 0.0,
+            'recent_deals': int((columns.created_ts >= thirty_days_ago).sum()),
+            'average_time_to_close_days': float(days_to_close.mean()) if len(days_to_close) else 0.0,
+        }
+
+    def monthly_totals(self, columns: DealColumns, since) -> Dict[str, Dict[str, float]]:
+        """Count and value per 'YYYY-MM' of creation for deals created on or after a date"""
+        recent = columns.take(columns.created_date >= np.datetime64(since, 'D'))
+        months, index = np.unique(recent.created_date.astype('datetime64[M]'), return_inverse=True)
+        counts = np.bincount(index, minlength=len(months))
+        values = np.bincount(index, weights=recent.value, minlength=len(months))
+        return {
+            str(month): {'count': int(counts[i]), 'value': float(values[i])}
+            for i, month in enumerate(months)
+        }
+
+
+def reset_deal_column_store():
+    """Drop the per-process store (used when settings change, e.g. in tests)"""
+    global _store
+    with _store_lock:
+        _store = None
@@ -3,8 +3,200 @@ Dynamic Pagination - KISS principle for flexible pagination
 Following Single Responsibility Principle for pagination logic
 """
 
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import datetime
+import json
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+DEFAULT_KEYSET_ORDERING = ('-created_at', '-id')
+
+
+@dataclass
+class KeysetPage:
+    """One page of a keyset-paginated queryset"""
+    results: List[Any]
+    next_cursor: Optional[str]
+    previous_cursor: Optional[str]
+    count: Optional[int] = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+
+def _cursor_value(value: Any) -> Any:
+    """Convert a keyset value to something JSON can carry without losing precision"""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)  # Decimal, UUID
+
+
+def encode_cursor(values: Sequence[Any], reverse: bool = False) -> str:
+    """
+    Encode the keyset position of a row as an opaque cursor
+
+    Args:
+        values: Values of the ordering fields for the boundary row
+        reverse: Whether the cursor points backwards (previous page)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {'v': [_cursor_value(value) for value in values]}
+    if reverse:
+        payload['r'] = 1
+    data = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[List[Any], bool]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Returns:
+        Tuple of boundary values and the reverse flag
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(data)
+        values = payload['v']
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor: values must be a list")
+    return values, bool(payload.get('r'))
+
+
+def _keyset_condition(ordering: Sequence[str], values: Sequence[Any], reverse: bool) -> Q:
+    """
+    Build the row-value comparison "after this position" for an ordering
+
+    For ('-created_at', '-id') this is
+    created_at < v0 OR (created_at = v0 AND id < v1).
+    """
+    condition = Q()
+    for index, field in enumerate(ordering):
+        name = field.lstrip('-')
+        descending = field.startswith('-') != reverse
+        lookups = {ordered.lstrip('-'): value for ordered, value in zip(ordering[:index], values[:index])}
+        lookups[f"{name}__{'lt' if descending else 'gt'}"] = values[index]
+        condition |= Q(**lookups)
+    return condition
+
+
+def _reverse_ordering(ordering: Sequence[str]) -> List[str]:
+    return [field[1:] if field.startswith('-') else f"-{field}" for field in ordering]
+
+
+def paginate_keyset(queryset: QuerySet, ordering: Sequence[str], page_size: int,
+                    cursor: Optional[str] = None, include_count: bool = False) -> KeysetPage:
+    """
+    Fetch one page using keyset (seek) pagination
+
+    The page is selected with a WHERE clause on the ordering columns instead
+    of OFFSET, so with an index on them page N costs the same as page 1.
+    The ordering must end with a unique column (normally ``id``).
+
+    Args:
+        queryset: Filtered queryset to paginate
+        ordering: Ordering fields, e.g. ('-created_at', '-id')
+        page_size: Items per page
+        cursor: Cursor from a previous page, None for the first page
+        include_count: Whether to run COUNT(*) for the total
+
+    Returns:
+        KeysetPage with results and next/previous cursors
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the ordering
+    """
+    ordering = list(ordering)
+    values, reverse = decode_cursor(cursor) if cursor else (None, False)
+    if values is not None and len(values) != len(ordering):
+        raise ValueError("Invalid cursor: does not match the ordering")
+
+    count = queryset.count() if include_count else None
+
+    page_queryset = queryset.order_by(*(_reverse_ordering(ordering) if reverse else ordering))
+    if values is not None:
+        page_queryset = page_queryset.filter(_keyset_condition(ordering, values, reverse))
+
+    # One extra row tells us whether there is another page in this direction
+    rows = list(page_queryset[:page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if reverse:
+        rows.reverse()
+
+    def position(row):
+        return [getattr(row, field.lstrip('-')) for field in ordering]
+
+    next_cursor = previous_cursor = None
+    if rows:
+        if has_more or reverse:
+            next_cursor = encode_cursor(position(rows[-1]))
+        if values is not None and (has_more or not reverse):
+            previous_cursor = encode_cursor(position(rows[0]), reverse=True)
+
+    return KeysetPage(rows, next_cursor, previous_cursor, count)
+
+
+def iter_keyset_chunks(queryset: QuerySet, chunk_size: int,
+                       ordering: Sequence[str] = ('id',)) -> Iterator[List[Any]]:
+    """
+    Walk a queryset in chunks, seeking past the last row of each chunk
+
+    Unlike a server-side cursor this holds no transaction or cursor open
+    between chunks, so it also works behind transaction-pooling proxies and
+    for consumers that take a long time per chunk. Works with model
+    instances and with values() rows, which must include the ordering fields.
+
+    Args:
+        queryset: Queryset to walk
+        chunk_size: Rows per query
+        ordering: Indexed ordering ending with a unique column
+
+    Yields:
+        Lists of at most chunk_size rows
+    """
+    ordering = list(ordering)
+    names = [field.lstrip('-') for field in ordering]
+    queryset = queryset.order_by(*ordering)
+    values = None
+
+    while True:
+        chunk_queryset = queryset
+        if values is not None:
+            chunk_queryset = chunk_queryset.filter(_keyset_condition(ordering, values, False))
+        rows = list(chunk_queryset[:chunk_size])
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_size:
+            return
+
+        last = rows[-1]
+        if isinstance(last, dict):
+            values = [last[name] for name in names]
+        else:
+            values = [getattr(last, name) for name in names]
 
 
 class DynamicPageNumberPagination(PageNumberPagination):
@@ -40,4 +232,115 @@ class DynamicPageNumberPagination(PageNumberPagination):
                 },
                 'results': schema
             }
-        }
\ No newline at end of file
+        }
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over an indexed keyset such as (created_at, id)
+
+    Views choose the keyset with a ``keyset_ordering`` attribute. The exact
+    count is skipped unless the client asks for it with ``?count=true``.
+    """
+
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    ordering = DEFAULT_KEYSET_ORDERING
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return one page of the queryset, positioned by the cursor parameter"""
+        self.request = request
+        ordering = getattr(view, 'keyset_ordering', self.ordering)
+        include_count = request.query_params.get(self.count_query_param, '').lower() == 'true'
+
+        try:
+            self.page = paginate_keyset(
+                queryset, ordering, self.get_page_size(request),
+                cursor=request.query_params.get(self.cursor_query_param) or None,
+                include_count=include_count
+            )
+        except ValueError:
+            raise NotFound('Invalid cursor.')
+        return self.page.results
+
+    def get_page_size(self, request) -> int:
+        """Read the page size from the query string, clamped to max_page_size"""
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(page_size, self.max_page_size) if page_size > 0 else self.page_size
+
+    def _get_link(self, cursor: Optional[str]) -> Optional[str]:
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(remove_query_param(url, 'page'), self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        response = {
+            'next': self._get_link(self.page.next_cursor),
+            'previous': self._get_link(self.page.previous_cursor),
+            'results': data,
+        }
+        if self.page.count is not None:
+            response['count'] = self.page.count
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'count': {
+                    'type': 'integer',
+                    'description': 'Only present with ?count=true',
+                    'example': 123
+                },
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                    'example': 'http://api.example.org/accounts/?cursor=eyJ2IjpbXX0'
+                },
+                'previous': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                    'example': 'http://api.example.org/accounts/?cursor=eyJ2IjpbXSwiciI6MX0'
+                },
+                'results': schema
+            }
+        }
+
+
+class KeysetOrPageNumberPagination(DynamicPageNumberPagination):
+    """
+    Page-number pagination that switches to keyset pagination on request
+
+    Clients opt in with ``?pagination=cursor`` (or by following a ``cursor``
+    link); existing ``?page=`` clients keep the page-number responses.
+    """
+
+    mode_query_param = 'pagination'
+
+    def _use_keyset(self, request) -> bool:
+        return (
+            request.query_params.get(self.mode_query_param) == 'cursor'
+            or KeysetPagination.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = KeysetPagination() if self._use_keyset(request) else None
+        if self.keyset is not None:
+            self.keyset.page_size = self.page_size
+            self.keyset.max_page_size = self.max_page_size
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,56 @@
+"""
+Query Profiles - KISS principle for N+1-free viewsets
+Each action declares the relations and columns its serializer reads
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple, Union
+
+from django.db.models import Prefetch, QuerySet
+
+
+@dataclass(frozen=True)
+class QueryProfile:
+    """
+    Relations and columns one viewset action needs
+
+    Attributes:
+        select_related: Forward relations joined into the main query
+        prefetch_related: Reverse/many relations loaded with one query each
+        only: Columns to load; relations in select_related must be listed too
+    """
+    select_related: Tuple[str, ...] = ()
+    prefetch_related: Tuple[Union[str, Prefetch], ...] = field(default=())
+    only: Tuple[str, ...] = ()
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """Apply the profile to a queryset"""
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.only:
+            queryset = queryset.only(*self.only)
+        return queryset
+
+
+class QueryProfileMixin:
+    """
+    Viewset mixin applying the query profile of the current action
+
+    Set ``query_profiles`` to a mapping of action name to QueryProfile and
+    pass querysets through apply_query_profile (get_queryset/get_object).
+    Actions without a profile get the queryset unchanged, so aggregate
+    endpoints do not pay for joins they never read.
+    """
+
+    query_profiles: Dict[str, QueryProfile] = {}
+
+    def get_query_profile(self, action: Optional[str] = None) -> Optional[QueryProfile]:
+        """Get the profile for an action (defaults to the current one)"""
+        return self.query_profiles.get(action or getattr(self, 'action', None))
+
+    def apply_query_profile(self, queryset: QuerySet, action: Optional[str] = None) -> QuerySet:
+        """Apply the profile for an action, if one is declared"""
+        profile = self.get_query_profile(action)
+        return profile.apply(queryset) if profile else queryset
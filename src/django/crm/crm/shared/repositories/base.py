@@ -5,6 +5,10 @@ Simple foundation following SOLID Single Responsibility Principle
 
 from django.db import models
 
+from ..pagination import iter_keyset_chunks
+
+ITER_CHUNK_SIZE = 2000
+
 
 class BaseRepository:
     """
@@ -23,10 +27,42 @@ class BaseRepository:
         except self.model.DoesNotExist:
             return None
 
+    def get_many_by_ids(self, ids):
+        """Get several records with one query, in the requested order"""
+        records = self.model.objects.in_bulk(list(ids))
+        return [records[id] for id in dict.fromkeys(ids) if id in records]
+
     def get_all(self):
         """Get all records"""
         return self.model.objects.all()
 
+    def get_all_with_removed(self):
+        """Get all records, including soft-deleted, archived or cancelled ones"""
+        return self.model._base_manager.all()
+
+    def iter_all(self, chunk_size=ITER_CHUNK_SIZE, fields=None, keyset=False):
+        """Stream all records in constant memory"""
+        return self.iter_filtered(chunk_size=chunk_size, fields=fields, keyset=keyset)
+
+    def iter_filtered(self, chunk_size=ITER_CHUNK_SIZE, fields=None, keyset=False, **kwargs):
+        """
+        Stream filtered records in constant memory
+
+        Uses a server-side cursor, or keyset chunks on id when keyset=True.
+        With fields, yields values() dicts instead of model instances.
+        """
+        queryset = self.model.objects.filter(**kwargs)
+        if fields:
+            if keyset and 'id' not in fields:
+                fields = ['id', *fields]
+            queryset = queryset.values(*fields)
+
+        if keyset:
+            for chunk in iter_keyset_chunks(queryset, chunk_size):
+                yield from chunk
+        else:
+            yield from queryset.iterator(chunk_size=chunk_size)
+
     def create(self, **kwargs):
         """Create new record"""
         return self.model.objects.create(**kwargs)
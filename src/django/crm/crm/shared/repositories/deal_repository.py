@@ -3,8 +3,13 @@ Deal Repository - KISS Implementation
 Simple, focused data access following SOLID principles
 """
 
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
 from django.contrib.auth import get_user_model
 from django.db.models import Q, Sum, Count, Avg
+from django.utils import timezone
 from .base import BaseRepository
 
 User = get_user_model()
@@ -98,4 +103,102 @@ class DealRepository(BaseRepository):
                 Q(contact__last_name__icontains=query) |
                 Q(contact__company__icontains=query)
             )
-        )
\ No newline at end of file
+        )
+
+    def get_deals_by_stage(self, user_id=None):
+        """Get open and closed deals grouped by stage display name"""
+        queryset = self.model.objects.all()
+        if user_id:
+            queryset = queryset.filter(owner_id=user_id)
+
+        stage_names = dict(self.model.STAGE_CHOICES)
+        deals_by_stage = defaultdict(list)
+        for deal in queryset.values('id', 'title', 'value', 'stage').order_by('stage', '-value'):
+            deals_by_stage[str(stage_names.get(deal['stage'], deal['stage']))].append(deal)
+        return dict(deals_by_stage)
+
+    def get_pipeline_snapshot(self, as_of=None, user_id=None):
+        """
+        Get pipeline totals per stage and currency as of a date
+
+        Reads DealDailySnapshot (index lookups per group) instead of
+        replaying deals and stage history.
+        """
+        from crm.apps.deals.models import DealDailySnapshot
+
+        rows = DealDailySnapshot.objects.as_of(as_of or timezone.localdate(), user_id)
+        return list(
+            rows.order_by().values('stage', 'currency').annotate(
+                deal_count=Sum('deal_count'),
+                total_value=Sum('total_value'),
+                weighted_value=Sum('weighted_value')
+            ).order_by('stage', 'currency')
+        )
+
+    def get_pipeline_summary(self, as_of=None, user_id=None):
+        """Get pipeline summary as of a date from the daily snapshots"""
+        stage_names = dict(self.model.STAGE_CHOICES)
+        snapshot = self.get_pipeline_snapshot(as_of, user_id)
+
+        total_deals = sum(row['deal_count'] for row in snapshot)
+        total_value = sum((row['total_value'] for row in snapshot), Decimal('0'))
+        stage_distribution = defaultdict(int)
+        for row in snapshot:
+            stage_distribution[str(stage_names.get(row['stage'], row['stage']))] += row['deal_count']
+
+        return {
+            'total_deals': total_deals,
+            'total_pipeline_value': total_value,
+            'weighted_pipeline_value': sum((row['weighted_value'] for row in snapshot), Decimal('0')),
+            'average_deal_size': total_value / total_deals if total_deals else Decimal('0'),
+            'stage_distribution': dict(stage_distribution),
+        }
+
+    def get_pipeline_trend(self, start_date, end_date, user_id=None):
+        """
+        Get daily pipeline totals per stage and currency for a date range
+
+        Snapshot rows exist only for days a group changed, so each group's
+        state is carried forward to the days in between.
+
+        Returns:
+            List of dicts with date, stage, currency, deal_count, total_value
+            and weighted_value, one per day and (stage, currency)
+        """
+        from crm.apps.deals.models import DealDailySnapshot
+
+        fields = ('owner_id', 'stage', 'currency', 'deal_count', 'total_value', 'weighted_value')
+        state = {
+            row[:3]: row[3:]
+            for row in DealDailySnapshot.objects.as_of(start_date, user_id).values_list(*fields)
+        }
+        changes = DealDailySnapshot.objects.filter(date__gt=start_date, date__lte=end_date)
+        if user_id is not None:
+            changes = changes.filter(owner_id=user_id)
+        changes_by_day = defaultdict(list)
+        for row in changes.order_by('date').values_list('date', *fields):
+            changes_by_day[row[0]].append(row[1:])
+
+        trend = []
+        day = start_date
+        while day <= end_date:
+            for row in changes_by_day.get(day, ()):
+                state[row[:3]] = row[3:]
+
+            totals = defaultdict(lambda: [0, Decimal('0'), Decimal('0')])
+            for (_, stage, currency), (deal_count, total_value, weighted_value) in state.items():
+                total = totals[(stage, currency)]
+                total[0] += deal_count
+                total[1] += total_value
+                total[2] += weighted_value
+            for (stage, currency), (deal_count, total_value, weighted_value) in sorted(totals.items()):
+                trend.append({
+                    'date': day,
+                    'stage': stage,
+                    'currency': currency,
+                    'deal_count': deal_count,
+                    'total_value': total_value,
+                    'weighted_value': weighted_value,
+                })
+            day += timedelta(days=1)
+        return trend
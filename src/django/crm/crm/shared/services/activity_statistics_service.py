@@ -0,0 +1,121 @@
+"""
+Activity Statistics Service - KISS Implementation
+Shared activity aggregation engine cached per owner
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+CACHE_PREFIX = 'activity_stats'
+ALL_OWNERS = 'all'
+
+
+def activity_statistics_cache_key(scope):
+    """Cache key for one owner's aggregates, or ALL_OWNERS for the unscoped ones"""
+    return f"{CACHE_PREFIX}:{scope}"
+
+
+def invalidate_activity_statistics(*owner_ids):
+    """
+    Drop cached aggregates affected by an activity write
+
+    Args:
+        owner_ids: Owners whose activities changed; the unscoped aggregates are always dropped
+    """
+    keys = [activity_statistics_cache_key(owner_id) for owner_id in owner_ids if owner_id is not None]
+    keys.append(activity_statistics_cache_key(ALL_OWNERS))
+    cache.delete_many(keys)
+
+
+class ActivityStatisticsService:
+    """
+    Simple Activity Statistics Service - Following KISS principle
+    One conditional aggregate plus one type/priority roll-up per owner
+
+    Overdue, upcoming and this-week counters move with the clock as well
+    as with writes, so the cache timeout bounds how stale they can get.
+    """
+
+    def __init__(self, cache_timeout=None):
+        """Initialize with the aggregate cache timeout in seconds"""
+        self.cache_timeout = (
+            cache_timeout if cache_timeout is not None
+            else getattr(settings, 'ACTIVITY_STATISTICS_CACHE_TIMEOUT', 60)
+        )
+
+    def get_statistics(self, queryset, scope):
+        """
+        Get the aggregates for a permission-scoped activity queryset
+
+        Args:
+            queryset: Activities visible to the caller
+            scope: Owner id the queryset is limited to, or ALL_OWNERS
+
+        Returns:
+            Dictionary of counters and the type/priority breakdown
+        """
+        cache_key = activity_statistics_cache_key(scope)
+        statistics = cache.get(cache_key)
+        if statistics is None:
+            statistics = self.compute_statistics(queryset)
+            cache.set(cache_key, statistics, self.cache_timeout)
+        return statistics
+
+    def compute_statistics(self, queryset):
+        """Compute the aggregates without the cache, in two queries"""
+        now = timezone.now()
+        today = now.date()
+        week_start = today - timedelta(days=today.weekday())
+        month_start = today.replace(day=1)
+        is_open = Q(is_completed=False, is_cancelled=False)
+
+        counters = queryset.order_by().aggregate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(is_completed=True)),
+            pending=Count('id', filter=is_open),
+            cancelled=Count('id', filter=Q(is_cancelled=True)),
+            overdue=Count('id', filter=is_open & Q(scheduled_at__lt=now)),
+            upcoming=Count('id', filter=is_open & Q(scheduled_at__gte=now)),
+            scheduled_this_week=Count(
+                'id', filter=Q(scheduled_at__date__gte=week_start, scheduled_at__date__lte=today)
+            ),
+            scheduled_this_month=Count(
+                'id', filter=Q(scheduled_at__date__gte=month_start, scheduled_at__date__lte=today)
+            ),
+            created_last_7_days=Count('id', filter=Q(created_at__gte=now - timedelta(days=7))),
+            completed_this_week=Count(
+                'id', filter=Q(is_completed=True, completed_at__gte=now - timedelta(days=now.weekday()))
+            ),
+        )
+
+        counters['breakdown'] = list(
+            queryset.order_by('type', 'priority')
+            .values('type', 'priority')
+            .annotate(count=Count('id'), open=Count('id', filter=is_open))
+        )
+        counters['computed_at'] = now
+        return counters
+
+    def by_type(self, statistics, open_only=False):
+        """Activity counts per type from the breakdown"""
+        return self._roll_up(statistics, 'type', open_only)
+
+    def by_priority(self, statistics, open_only=False):
+        """Activity counts per priority from the breakdown"""
+        return self._roll_up(statistics, 'priority', open_only)
+
+    def completion_rate(self, statistics):
+        """Completed share of all activities, as a percentage"""
+        total = statistics['total']
+        return round(statistics['completed'] / total * 100, 2) if total else 0
+
+    def _roll_up(self, statistics, field, open_only):
+        """Sum the type/priority breakdown over the other field"""
+        counts = {}
+        for row in statistics['breakdown']:
+            counts[row[field]] = counts.get(row[field], 0) + row['open' if open_only else 'count']
+        return counts
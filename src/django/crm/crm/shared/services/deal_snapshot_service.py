@@ -0,0 +1,138 @@
+"""
+Deal Snapshot Service - KISS Implementation
+Rebuilds the DealDailySnapshot rollup by replaying DealStageHistory
+"""
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+
+from ..pagination import iter_keyset_chunks
+
+logger = logging.getLogger(__name__)
+
+DEAL_FIELDS = ('id', 'owner_id', 'stage', 'currency', 'value', 'probability', 'is_archived', 'created_at')
+
+
+class DealSnapshotService:
+    """
+    Simple Deal Snapshot Service - Following KISS principle
+    Backfills daily pipeline snapshots; Deal.save keeps them current afterwards
+    """
+
+    def __init__(self, chunk_size=1000):
+        """Initialize with the number of deals replayed per query"""
+        self.chunk_size = chunk_size
+
+    def rebuild(self, start_date=None, end_date=None, owner_id=None):
+        """
+        Rebuild snapshot rows for a date range
+
+        Deal value, currency, owner and probability are not versioned, so
+        past days use today's values with the stage taken from the stage
+        history (and that stage's default probability when it differs
+        from the current one).
+
+        Args:
+            start_date: First day to rebuild, the oldest deal's creation date by default
+            end_date: Last day to rebuild, today by default
+            owner_id: Limit the rebuild to one owner's deals
+
+        Returns:
+            Number of snapshot rows written
+        """
+        from crm.apps.deals.models import Deal, DealDailySnapshot
+
+        deals = Deal.objects.all()
+        if owner_id is not None:
+            deals = deals.filter(owner_id=owner_id)
+
+        end_date = end_date or timezone.localdate()
+        if start_date is None:
+            first = deals.order_by('created_at').values_list('created_at', flat=True).first()
+            if first is None:
+                return 0
+            start_date = timezone.localtime(first).date()
+        if start_date > end_date:
+            raise ValueError('start_date must not be after end_date.')
+
+        deltas = self._collect_deltas(deals, start_date, end_date, Deal.STAGE_PROBABILITIES)
+
+        # Groups that had rows before the range must restart from the rebuilt state
+        previous = DealDailySnapshot.objects.as_of(start_date - timedelta(days=1), owner_id)
+        for group in previous.values_list('owner_id', 'stage', 'currency'):
+            deltas[group].setdefault(start_date, [0, Decimal('0'), Decimal('0')])
+
+        rows = list(self._build_rows(DealDailySnapshot, deltas, start_date))
+
+        with transaction.atomic():
+            existing = DealDailySnapshot.objects.filter(date__gte=start_date, date__lte=end_date)
+            if owner_id is not None:
+                existing = existing.filter(owner_id=owner_id)
+            existing.delete()
+            DealDailySnapshot.objects.bulk_create(rows, batch_size=self.chunk_size)
+
+        logger.info(f"Rebuilt {len(rows)} deal snapshot rows from {start_date} to {end_date}")
+        return len(rows)
+
+    def _collect_deltas(self, deals, start_date, end_date, stage_probabilities):
+        """Per-group, per-day changes of count/value/weighted value, clamped to the range"""
+        from crm.apps.deals.models import DealStageHistory, snapshot_contribution
+
+        deltas = defaultdict(dict)
+
+        def add(day, fields, sign):
+            if day > end_date:
+                return
+            contribution = snapshot_contribution(fields)
+            if contribution is None:
+                return
+            group, value, weighted = contribution
+            delta = deltas[group].setdefault(max(day, start_date), [0, Decimal('0'), Decimal('0')])
+            delta[0] += sign
+            delta[1] += sign * value
+            delta[2] += sign * weighted
+
+        def at_stage(deal, stage):
+            if stage == deal['stage']:
+                return deal
+            probability = stage_probabilities.get(stage, deal['probability'])
+            return {**deal, 'stage': stage, 'probability': probability}
+
+        for chunk in iter_keyset_chunks(deals.values(*DEAL_FIELDS), self.chunk_size):
+            history = defaultdict(list)
+            changes = DealStageHistory.objects.filter(
+                deal_id__in=[deal['id'] for deal in chunk]
+            ).order_by('changed_at', 'id').values_list('deal_id', 'old_stage', 'new_stage', 'changed_at')
+            for deal_id, old_stage, new_stage, changed_at in changes:
+                history[deal_id].append((old_stage, new_stage, timezone.localtime(changed_at).date()))
+
+            for deal in chunk:
+                changes = history[deal['id']]
+                stage = changes[0][0] if changes else deal['stage']
+                add(timezone.localtime(deal['created_at']).date(), at_stage(deal, stage), 1)
+                for old_stage, new_stage, day in changes:
+                    add(day, at_stage(deal, old_stage), -1)
+                    add(day, at_stage(deal, new_stage), 1)
+
+        return deltas
+
+    def _build_rows(self, model, deltas, start_date):
+        """Running totals per group, one row per day the group changed"""
+        for (owner_id, stage, currency), days in deltas.items():
+            deal_count, total_value, weighted_value = 0, Decimal('0'), Decimal('0')
+            for day in sorted(days):
+                count_delta, value_delta, weighted_delta = days[day]
+                if day != start_date and not (count_delta or value_delta or weighted_delta):
+                    continue
+                deal_count += count_delta
+                total_value += value_delta
+                weighted_value += weighted_delta
+                yield model(
+                    date=day, owner_id=owner_id, stage=stage, currency=currency,
+                    deal_count=deal_count, total_value=total_value, weighted_value=weighted_value
+                )
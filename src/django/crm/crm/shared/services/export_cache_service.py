@@ -0,0 +1,132 @@
+"""
+Export Cache Service - KISS Implementation
+Content-addressed cache of finished exports, shared by identical requests
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+CACHE_PREFIX = 'export_result'
+GENERATION_PREFIX = 'export_generation'
+
+
+def export_generation_key(source):
+    """Cache key of the generation counter for one data source"""
+    return f"{GENERATION_PREFIX}:{source}"
+
+
+def get_export_generation(source):
+    """
+    Current generation of a data source
+
+    A counter lost from the cache restarts from the clock, so it never
+    comes back to a generation that cached exports were keyed with.
+    """
+    return cache.get_or_set(export_generation_key(source), time.time_ns, None)
+
+
+def bump_export_generation(*sources):
+    """
+    Expire the cached exports that read changed data
+
+    Args:
+        sources: Changed data sources, e.g. 'contacts' or 'deals'
+    """
+    for source in sources:
+        try:
+            cache.incr(export_generation_key(source))
+        except ValueError:
+            cache.set(export_generation_key(source), time.time_ns(), None)
+
+
+class ExportCacheService:
+    """
+    Simple Export Cache Service - Following KISS principle
+    Identical export requests share one file while its data is unchanged
+
+    A request's key hashes everything that shapes the file, including the
+    generation of each data source it reads, so a write to any of them
+    gives later requests a new key. Writes that skip Model.save (bulk or
+    queryset updates) are only picked up when entries time out.
+    """
+
+    def __init__(self, timeout=None, join_timeout=None, poll_interval=1):
+        """Initialize with the result cache timeout and how long to wait for in-flight exports"""
+        self.timeout = (
+            timeout if timeout is not None
+            else getattr(settings, 'EXPORT_RESULT_CACHE_TIMEOUT', 3600)
+        )
+        self.join_timeout = (
+            join_timeout if join_timeout is not None
+            else getattr(settings, 'EXPORT_CACHE_JOIN_TIMEOUT', 600)
+        )
+        self.poll_interval = poll_interval
+
+    def request_key(self, export_type, sources, filters, fields, export_format, scope, options=None):
+        """
+        Content address of an export request
+
+        Args:
+            export_type: Export type, e.g. 'contacts'
+            sources: Data sources the export reads
+            filters: Normalized export filters
+            fields: Exported column names, in order
+            export_format: Export format value
+            scope: Visibility scope the rows were read under
+            options: Other request options that change the file
+
+        Returns:
+            Cache key of the request at the sources' current generations
+        """
+        request = {
+            'export_type': export_type,
+            'filters': filters,
+            'fields': list(fields),
+            'format': export_format,
+            'scope': scope,
+            'options': options or {},
+            'generations': {source: get_export_generation(source) for source in sources},
+        }
+        digest = hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode('utf-8'))
+        return f"{CACHE_PREFIX}:{digest.hexdigest()}"
+
+    def get_result(self, key):
+        """Cached export result, or None when missing or its file was cleaned up"""
+        result = cache.get(key)
+        if result is not None and not os.path.exists(result['file_path']):
+            cache.delete(key)
+            return None
+        return result
+
+    def store_result(self, key, result):
+        """Cache a finished export for identical requests"""
+        cache.set(key, result, self.timeout)
+
+    def claim(self, key, owner):
+        """Mark a request in flight; False if an identical export is already running"""
+        return cache.add(f"{key}:inflight", owner, self.join_timeout)
+
+    def release(self, key, owner):
+        """Clear the in-flight mark of a request, if this owner still holds it"""
+        if cache.get(f"{key}:inflight") == owner:
+            cache.delete(f"{key}:inflight")
+
+    def wait_for_result(self, key):
+        """
+        Wait for the in-flight export of an identical request
+
+        Returns:
+            Its result, or None if it ended without one or took too long
+        """
+        deadline = time.monotonic() + self.join_timeout
+        while time.monotonic() < deadline:
+            # Results are stored before the in-flight mark is cleared
+            if cache.get(f"{key}:inflight") is None:
+                return self.get_result(key)
+            time.sleep(self.poll_interval)
+        return None
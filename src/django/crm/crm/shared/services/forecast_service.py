@@ -0,0 +1,216 @@
+"""
+Forecast Service - KISS Implementation
+Vectorized pipeline forecast with Monte Carlo confidence intervals
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+import numpy as np
+from django.conf import settings
+from django.db.models.functions import TruncDate
+
+OPEN_STAGES = ('prospect', 'qualified', 'proposal', 'negotiation')
+HIGH_CONFIDENCE_STAGES = ('proposal', 'negotiation')
+LOW_STAGES = ('prospect', 'qualified')
+STALE_DAYS = 90
+CLOSING_SOON_DAYS = 7
+
+# Deals sharing a probability are simulated in value bins of similar size;
+# pipelines smaller than this are simulated deal by deal
+MAX_BINS_PER_PROBABILITY = 64
+# Upper bound on simulated (iteration x bin) cells held in memory at once
+SIMULATION_BATCH_CELLS = 1_000_000
+
+
+@dataclass
+class PipelineArrays:
+    """Open pipeline loaded column-wise into NumPy arrays"""
+    values: np.ndarray
+    probabilities: np.ndarray
+    stages: np.ndarray
+    expected_close: np.ndarray
+    created: np.ndarray
+    total_value: Decimal
+
+    def __len__(self):
+        return len(self.values)
+
+
+class ForecastService:
+    """
+    Simple Forecast Service - Following KISS principle
+    One query loads the pipeline; every metric is computed in memory
+    """
+
+    def __init__(self, iterations=None, max_iterations=None):
+        """Initialize with the default and maximum number of simulation runs"""
+        self.iterations = iterations or getattr(settings, 'FORECAST_SIMULATION_ITERATIONS', 10000)
+        self.max_iterations = max_iterations or getattr(settings, 'FORECAST_SIMULATION_MAX_ITERATIONS', 100000)
+
+    def load_pipeline(self, queryset):
+        """
+        Load value, probability, stage and dates of open deals in one query
+
+        Args:
+            queryset: Deals to forecast, already limited to the period
+
+        Returns:
+            PipelineArrays with one entry per deal
+        """
+        rows = list(
+            queryset.filter(stage__in=OPEN_STAGES)
+            .annotate(created_date=TruncDate('created_at'))
+            .values_list('value', 'probability', 'stage', 'expected_close_date', 'created_date')
+        )
+        values, probabilities, stages, expected_close, created = zip(*rows) if rows else ([], [], [], [], [])
+
+        return PipelineArrays(
+            values=np.array(values, dtype=np.float64),
+            probabilities=np.array(probabilities, dtype=np.float64) / 100,
+            stages=np.array(stages, dtype=object),
+            expected_close=np.array(expected_close, dtype='datetime64[D]'),
+            created=np.array(created, dtype='datetime64[D]'),
+            total_value=sum(values, Decimal('0')),
+        )
+
+    def load_pipeline_from_store(self, store, owner_id, start_date, end_date):
+        """
+        Build the same PipelineArrays from the deal column store
+
+        Args:
+            store: DealColumnStore
+            owner_id: Owner to forecast, None for all deals
+            start_date: First expected close date of the period
+            end_date: Last expected close date of the period
+
+        Returns:
+            PipelineArrays with one entry per open deal closing in the period
+        """
+        columns = store.select(owner_id)
+        columns = columns.take(
+            store.stage_mask(columns, OPEN_STAGES)
+            & (columns.expected_close >= np.datetime64(start_date, 'D'))
+            & (columns.expected_close <= np.datetime64(end_date, 'D'))
+        )
+        return PipelineArrays(
+            values=columns.value,
+            probabilities=columns.probability / 100,
+            stages=np.array(store.stage_names, dtype=object)[columns.stage],
+            expected_close=columns.expected_close,
+            created=columns.created_date,
+            total_value=Decimal(f"{columns.value.sum():.2f}"),
+        )
+
+    def summarize(self, pipeline, today):
+        """
+        Forecast totals, confidence level and risk factors for a pipeline
+
+        Args:
+            pipeline: PipelineArrays from load_pipeline
+            today: Reference date for the closing-soon and stale buckets
+
+        Returns:
+            Dictionary with deals_count, forecast_value, weighted_value,
+            confidence_level and risk_factors
+        """
+        deals_count = len(pipeline)
+        if deals_count == 0:
+            return {
+                'deals_count': 0,
+                'forecast_value': str(pipeline.total_value),
+                'weighted_value': '0.00',
+                'confidence_level': 0,
+                'risk_factors': [],
+            }
+
+        weighted_value = float(pipeline.values @ pipeline.probabilities)
+
+        # Adjust confidence based on stage distribution
+        high_confidence_share = np.isin(pipeline.stages, HIGH_CONFIDENCE_STAGES).mean()
+        confidence_level = min(100, pipeline.probabilities.mean() * 100 + high_confidence_share * 20)
+
+        today = np.datetime64(today, 'D')
+        risk_buckets = (
+            (
+                (pipeline.values > pipeline.values.mean() * 2) & (pipeline.probabilities < 0.3),
+                'high-value, low-probability deals'
+            ),
+            (
+                (pipeline.expected_close <= today + np.timedelta64(CLOSING_SOON_DAYS, 'D'))
+                & np.isin(pipeline.stages, LOW_STAGES),
+                'deals closing soon with low stage'
+            ),
+            (
+                pipeline.created < today - np.timedelta64(STALE_DAYS, 'D'),
+                f'deals in pipeline for over {STALE_DAYS} days'
+            ),
+        )
+        risk_factors = [
+            f"{int(mask.sum())} {description}"
+            for mask, description in risk_buckets
+            if mask.any()
+        ]
+
+        return {
+            'deals_count': deals_count,
+            'forecast_value': str(pipeline.total_value),
+            'weighted_value': f"{weighted_value:.2f}",
+            'confidence_level': round(float(confidence_level), 2),
+            'risk_factors': risk_factors,
+        }
+
+    def simulate(self, pipeline, iterations=None, seed=None):
+        """
+        Monte Carlo revenue distribution for a pipeline
+
+        Each deal closes independently with its probability. Deals with the
+        same probability are grouped into value bins so one binomial draw
+        per bin replaces one Bernoulli draw per deal; with fewer deals than
+        MAX_BINS_PER_PROBABILITY per probability every deal is its own bin.
+
+        Args:
+            pipeline: PipelineArrays from load_pipeline
+            iterations: Number of simulated outcomes, capped at max_iterations
+            seed: Seed for reproducible results
+
+        Returns:
+            Dictionary with iterations, mean and the P10/P50/P90 revenue
+        """
+        iterations = min(iterations or self.iterations, self.max_iterations)
+        counts, probabilities, mean_values = self._bin_pipeline(pipeline)
+        rng = np.random.default_rng(seed)
+
+        revenue = np.zeros(iterations)
+        if len(counts):
+            batch = max(1, SIMULATION_BATCH_CELLS // len(counts))
+            for start in range(0, iterations, batch):
+                size = min(batch, iterations - start)
+                wins = rng.binomial(counts, probabilities, size=(size, len(counts)))
+                revenue[start:start + size] = wins @ mean_values
+
+        p10, p50, p90 = np.percentile(revenue, [10, 50, 90])
+        return {
+            'iterations': iterations,
+            'mean': f"{revenue.mean():.2f}",
+            'p10': f"{p10:.2f}",
+            'p50': f"{p50:.2f}",
+            'p90': f"{p90:.2f}",
+        }
+
+    def _bin_pipeline(self, pipeline):
+        """Group deals into (count, probability, mean value) bins"""
+        counts, probabilities, mean_values = [], [], []
+        for probability in np.unique(pipeline.probabilities):
+            if probability <= 0:
+                continue  # Never closes, adds nothing to any outcome
+            level = np.sort(pipeline.values[pipeline.probabilities == probability])
+            for chunk in np.array_split(level, min(len(level), MAX_BINS_PER_PROBABILITY)):
+                counts.append(len(chunk))
+                probabilities.append(min(probability, 1.0))
+                mean_values.append(chunk.mean())
+        return (
+            np.array(counts, dtype=np.int64),
+            np.array(probabilities, dtype=np.float64),
+            np.array(mean_values, dtype=np.float64),
+        )
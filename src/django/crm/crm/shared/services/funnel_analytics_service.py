@@ -0,0 +1,162 @@
+"""
+Funnel Analytics Service - KISS Implementation
+Stage-to-stage conversion from DealStageHistory in one windowed pass
+"""
+
+from collections import Counter, defaultdict
+from datetime import datetime, time, timedelta
+from statistics import median
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Window
+from django.db.models.functions import Lag, Lead
+from django.utils import timezone
+
+CACHE_PREFIX = 'deal_funnel'
+FUNNEL_STAGES = ('lead', 'prospect', 'qualified', 'proposal', 'negotiation', 'closed_won')
+LOST_STAGE = 'closed_lost'
+
+
+class FunnelAnalyticsService:
+    """
+    Simple Funnel Analytics Service - Following KISS principle
+    Counts how deals enter, advance through and drop out of each stage
+    """
+
+    def __init__(self, closed_period_timeout=None):
+        """Initialize with the cache timeout for periods that have ended"""
+        self.closed_period_timeout = (
+            closed_period_timeout if closed_period_timeout is not None
+            else getattr(settings, 'FUNNEL_CLOSED_PERIOD_CACHE_TIMEOUT', 86400)
+        )
+
+    def get_funnel(self, start_date, end_date, owner_ids=None):
+        """
+        Get funnel analytics for stage changes between two dates
+
+        Periods that ended before today no longer change, so they are
+        cached; the current period is always computed.
+
+        Args:
+            start_date: First day of the window
+            end_date: Last day of the window (inclusive)
+            owner_ids: Deal owners to include, None for everyone
+
+        Returns:
+            Dictionary with per-stage funnel rows and the transition counts
+        """
+        owner_ids = sorted(set(owner_ids)) if owner_ids is not None else None
+        if end_date >= timezone.localdate():
+            return self.compute_funnel(start_date, end_date, owner_ids)
+
+        owners = ','.join(map(str, owner_ids)) if owner_ids is not None else 'all'
+        cache_key = f"{CACHE_PREFIX}:{start_date.isoformat()}:{end_date.isoformat()}:{owners}"
+        funnel = cache.get(cache_key)
+        if funnel is None:
+            funnel = self.compute_funnel(start_date, end_date, owner_ids)
+            cache.set(cache_key, funnel, self.closed_period_timeout)
+        return funnel
+
+    def compute_funnel(self, start_date, end_date, owner_ids=None):
+        """Compute funnel analytics without the cache"""
+        from crm.apps.deals.models import Deal
+
+        window_start, window_end = self._window_bounds(start_date, end_date)
+        entered = defaultdict(set)
+        still_in_stage = defaultdict(set)
+        exits = defaultdict(Counter)
+        durations = defaultdict(list)
+        transitions = Counter()
+
+        for deal_id, old_stage, new_stage, changed_at, previous_at, next_at, created_at in self._history_rows(
+            window_start, window_end, owner_ids
+        ):
+            if not window_start <= changed_at < window_end:
+                continue  # Outside the window; only fetched for its LAG/LEAD neighbours
+
+            transitions[(old_stage, new_stage)] += 1
+            entered[new_stage].add(deal_id)
+            if next_at is None:
+                still_in_stage[new_stage].add(deal_id)
+
+            # Time in the stage being left: since the previous change, or since creation
+            durations[old_stage].append((changed_at - (previous_at or created_at)).total_seconds() / 86400)
+            exits[old_stage][self._direction(old_stage, new_stage)] += 1
+
+        stage_names = dict(Deal.STAGE_CHOICES)
+        stages = []
+        for stage in (*FUNNEL_STAGES, LOST_STAGE):
+            exited = sum(exits[stage].values())
+            stages.append({
+                'stage': stage,
+                'display': str(stage_names.get(stage, stage)),
+                'entered': len(entered[stage]),
+                'exited': exited,
+                'advanced': exits[stage]['advanced'],
+                'lost': exits[stage]['lost'],
+                'regressed': exits[stage]['regressed'],
+                'still_in_stage': len(still_in_stage[stage]),
+                'conversion_rate': round(exits[stage]['advanced'] / exited * 100, 2) if exited else 0,
+                'drop_off_rate': round(exits[stage]['lost'] / exited * 100, 2) if exited else 0,
+                'median_days_in_stage': round(median(durations[stage]), 1) if durations[stage] else None,
+            })
+
+        return {
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'owner_ids': owner_ids,
+            'stages': stages,
+            'transitions': [
+                {'from_stage': old_stage, 'to_stage': new_stage, 'count': count}
+                for (old_stage, new_stage), count in transitions.most_common()
+            ],
+        }
+
+    def _history_rows(self, window_start, window_end, owner_ids):
+        """
+        Stage changes of every deal that changed stage in the window
+
+        LAG/LEAD run over each deal's full history, so the neighbours of
+        the first and last change in the window are still found.
+        """
+        from crm.apps.deals.models import DealStageHistory
+
+        changed_in_window = DealStageHistory.objects.filter(
+            changed_at__gte=window_start, changed_at__lt=window_end
+        )
+        if owner_ids is not None:
+            changed_in_window = changed_in_window.filter(deal__owner_id__in=owner_ids)
+
+        by_deal = {'partition_by': [F('deal_id')], 'order_by': [F('changed_at').asc(), F('id').asc()]}
+        return (
+            DealStageHistory.objects.filter(deal_id__in=changed_in_window.values('deal_id'))
+            .annotate(
+                previous_at=Window(Lag('changed_at'), **by_deal),
+                next_at=Window(Lead('changed_at'), **by_deal),
+            )
+            .order_by()
+            .values_list(
+                'deal_id', 'old_stage', 'new_stage', 'changed_at', 'previous_at', 'next_at', 'deal__created_at'
+            )
+            .iterator(chunk_size=2000)
+        )
+
+    def _window_bounds(self, start_date, end_date):
+        """Aware datetimes for the start of start_date and the end of end_date"""
+        bounds = (
+            datetime.combine(start_date, time.min),
+            datetime.combine(end_date + timedelta(days=1), time.min),
+        )
+        if settings.USE_TZ:
+            bounds = tuple(timezone.make_aware(bound) for bound in bounds)
+        return bounds
+
+    def _direction(self, old_stage, new_stage):
+        """Classify a stage change as advanced, lost or regressed"""
+        if new_stage == LOST_STAGE:
+            return 'lost'
+        if old_stage in FUNNEL_STAGES and new_stage in FUNNEL_STAGES:
+            if FUNNEL_STAGES.index(new_stage) > FUNNEL_STAGES.index(old_stage):
+                return 'advanced'
+        return 'regressed'
@@ -0,0 +1,243 @@
+"""
+Pipeline Analytics Service - KISS Implementation
+Grouped pipeline rollups cached per owner
+"""
+
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q, Sum
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+
+from ..deal_column_store import get_deal_column_store
+
+CACHE_PREFIX = 'pipeline_stats'
+ALL_OWNERS = 'all'
+CLOSED_STAGES = ('closed_won', 'closed_lost')
+MONTHS = 6
+TOP_STAGES = 5
+
+
+def pipeline_cache_key(scope):
+    """Cache key for one owner's rollup, or ALL_OWNERS for the unscoped one"""
+    return f"{CACHE_PREFIX}:{scope}"
+
+
+def invalidate_pipeline_statistics(*owner_ids):
+    """
+    Drop cached rollups affected by a deal write
+
+    Args:
+        owner_ids: Owners whose deals changed; the unscoped rollup is always dropped
+    """
+    keys = [pipeline_cache_key(owner_id) for owner_id in owner_ids if owner_id is not None]
+    keys.append(pipeline_cache_key(ALL_OWNERS))
+    cache.delete_many(keys)
+
+
+def _money(value):
+    """Format a database Decimal or a column store float for the response"""
+    if value is None:
+        return str(Decimal('0'))
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def _month_starts(today, months):
+    """First day of the current and previous months, newest first"""
+    year, month = today.year, today.month
+    starts = []
+    for _ in range(months):
+        starts.append(today.replace(year=year, month=month, day=1))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return starts
+
+
+class PipelineAnalyticsService:
+    """
+    Simple Pipeline Analytics Service - Following KISS principle
+    Computes pipeline_statistics in four grouped queries instead of one per stage/month
+    """
+
+    def __init__(self, cache_timeout=None):
+        """Initialize with the rollup cache timeout in seconds"""
+        self.cache_timeout = (
+            cache_timeout if cache_timeout is not None
+            else getattr(settings, 'PIPELINE_STATISTICS_CACHE_TIMEOUT', 300)
+        )
+
+    def get_pipeline_statistics(self, queryset, scope):
+        """
+        Get the pipeline rollup for a permission-scoped deal queryset
+
+        Args:
+            queryset: Deals visible to the caller
+            scope: Owner id the queryset is limited to, or ALL_OWNERS
+
+        Returns:
+            Dictionary in the pipeline_statistics response shape
+        """
+        cache_key = pipeline_cache_key(scope)
+        statistics = cache.get(cache_key)
+        if statistics is None:
+            statistics = self.compute_pipeline_statistics(queryset, scope)
+            cache.set(cache_key, statistics, self.cache_timeout)
+        return statistics
+
+    def compute_pipeline_statistics(self, queryset, scope=None):
+        """
+        Compute the pipeline rollup without the cache
+
+        With the deal column store enabled and a known scope, totals, stage
+        and month breakdowns come from memory; stage conversions need the
+        stage history and always query the database.
+        """
+        from crm.apps.deals.models import Deal
+
+        store = get_deal_column_store() if scope is not None else None
+        if store is not None:
+            columns = store.select(None if scope == ALL_OWNERS else scope)
+            totals = self._get_totals_from_store(store, columns)
+            stage_rows = store.stage_totals(columns)
+            month_rows = store.monthly_totals(columns, _month_starts(timezone.localdate(), MONTHS)[-1])
+        else:
+            totals = self._get_totals(queryset)
+            stage_rows = self._get_stage_rows(queryset)
+            month_rows = self._get_month_rows(queryset)
+        deals_by_stage = self._get_deals_by_stage(stage_rows, Deal.STAGE_CHOICES)
+
+        won_deals, lost_deals = totals['won_deals'], totals['lost_deals']
+        total_closed = won_deals + lost_deals
+        win_rate = (won_deals / total_closed * 100) if total_closed > 0 else 0
+
+        avg_sales_cycle = 0
+        if totals['cycle_deals']:
+            avg_sales_cycle = totals['cycle_total'].days // totals['cycle_deals']
+
+        return {
+            'total_deals': totals['total_deals'],
+            'total_value': _money(totals['total_value']),
+            'average_deal_size': _money(totals['average_deal_size']),
+            'win_rate': round(win_rate, 2),
+            'average_sales_cycle': avg_sales_cycle,
+            'deals_by_stage': deals_by_stage,
+            'deals_by_month': self._get_deals_by_month(month_rows),
+            'top_performing_stages': self._get_stage_conversions(queryset, deals_by_stage)[:TOP_STAGES],
+        }
+
+    def _get_totals(self, queryset):
+        """Totals, win/loss counts and sales cycle in one aggregate query"""
+        closed_with_date = Q(stage__in=CLOSED_STAGES, closed_date__isnull=False)
+        # Whole days between the UTC dates, as the per-deal loop used to compute
+        cycle = TruncDate('closed_date', tzinfo=dt_timezone.utc) - TruncDate('created_at', tzinfo=dt_timezone.utc)
+        return queryset.aggregate(
+            total_deals=Count('id'),
+            total_value=Sum('value'),
+            average_deal_size=Avg('value'),
+            won_deals=Count('id', filter=Q(stage='closed_won')),
+            lost_deals=Count('id', filter=Q(stage='closed_lost')),
+            cycle_deals=Count('id', filter=closed_with_date),
+            cycle_total=Sum(cycle, filter=closed_with_date),
+        )
+
+    def _get_totals_from_store(self, store, columns):
+        """The _get_totals figures computed from column store arrays"""
+        won = store.stage_mask(columns, ('closed_won',))
+        lost = store.stage_mask(columns, ('closed_lost',))
+        with_date = (won | lost) & ~np.isnat(columns.closed_utc_date)
+        cycle_days = (columns.closed_utc_date[with_date] - columns.created_utc_date[with_date]).astype(np.int64)
+        return {
+            'total_deals': len(columns),
+            'total_value': float(columns.value.sum()),
+            'average_deal_size': float(columns.value.mean()) if len(columns) else None,
+            'won_deals': int(won.sum()),
+            'lost_deals': int(lost.sum()),
+            'cycle_deals': int(with_date.sum()),
+            'cycle_total': timedelta(days=int(cycle_days.sum())),
+        }
+
+    def _get_stage_rows(self, queryset):
+        """Count and value per stage in one GROUP BY query"""
+        return {
+            row['stage']: {'count': row['count'], 'total_value': row['total_value']}
+            for row in queryset.order_by().values('stage').annotate(count=Count('id'), total_value=Sum('value'))
+        }
+
+    def _get_deals_by_stage(self, stage_rows, stage_choices):
+        """Every stage with its count and value, zero for stages without deals"""
+        deals_by_stage = {}
+        for stage_name, stage_display in stage_choices:
+            row = stage_rows.get(stage_name, {})
+            deals_by_stage[stage_name] = {
+                'display': str(stage_display),
+                'count': row.get('count', 0),
+                'value': _money(row.get('total_value'))
+            }
+        return deals_by_stage
+
+    def _get_month_rows(self, queryset):
+        """Count and value per calendar month of creation for the last MONTHS months"""
+        since = datetime.combine(_month_starts(timezone.localdate(), MONTHS)[-1], time.min)
+        if settings.USE_TZ:
+            since = timezone.make_aware(since)
+
+        rows = (
+            queryset.filter(created_at__gte=since)
+            .annotate(month=TruncMonth('created_at'))
+            .order_by()
+            .values('month')
+            .annotate(count=Count('id'), value=Sum('value'))
+        )
+        return {row['month'].strftime('%Y-%m'): row for row in rows}
+
+    def _get_deals_by_month(self, month_rows):
+        """Every one of the last MONTHS months, zero for months without deals"""
+        deals_by_month = {}
+        for month_start in _month_starts(timezone.localdate(), MONTHS):
+            month_str = month_start.strftime('%Y-%m')
+            row = month_rows.get(month_str, {})
+            deals_by_month[month_str] = {
+                'count': row.get('count', 0),
+                'value': _money(row.get('value'))
+            }
+        return deals_by_month
+
+    def _get_stage_conversions(self, queryset, deals_by_stage):
+        """
+        Share of deals that reached each open stage and were later won
+
+        A deal reached a stage if it is in it now or its stage history shows
+        it leaving it. All stages are counted in one aggregate query.
+        """
+        open_stages = [stage for stage in deals_by_stage if stage not in CLOSED_STAGES]
+        aggregates = {}
+        for stage in open_stages:
+            aggregates[f'{stage}_total'] = Count(
+                'id', filter=Q(stage=stage) | Q(stage_history__old_stage=stage), distinct=True
+            )
+            aggregates[f'{stage}_won'] = Count(
+                'id', filter=Q(stage='closed_won', stage_history__old_stage=stage), distinct=True
+            )
+        counts = queryset.order_by().aggregate(**aggregates) if aggregates else {}
+
+        conversions = []
+        for stage in open_stages:
+            total_deals = counts[f'{stage}_total']
+            won_deals = counts[f'{stage}_won']
+            conversion_rate = (won_deals / total_deals) * 100 if total_deals > 0 else 0
+            conversions.append({
+                'stage': stage,
+                'display': deals_by_stage[stage]['display'],
+                'conversion_rate': round(conversion_rate, 2),
+                'total_deals': total_deals,
+                'won_deals': won_deals
+            })
+
+        # Sort by conversion rate
+        conversions.sort(key=lambda x: x['conversion_rate'], reverse=True)
+        return conversions
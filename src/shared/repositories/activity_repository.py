@@ -4,7 +4,7 @@ Following SOLID principles and enterprise best practices
 """
 
 from typing import List, Optional, Dict, Any
-from django.db.models import Q, Count, Sum
+from django.db.models import Q, Sum
 from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta
@@ -12,6 +12,7 @@ import logging
 
 from .base import BaseRepository
 from crm.apps.activities.models import Activity
+from crm.shared.services.activity_statistics_service import ALL_OWNERS, ActivityStatisticsService
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,8 @@ class ActivityRepository(BaseRepository[Activity]):
     Following Repository Pattern and SOLID principles
     """
 
+    keyset_ordering = ('scheduled_at', 'id')
+
     def __init__(self, cache_timeout: int = 300):
         """Initialize activity repository"""
         super().__init__(Activity, cache_timeout)
@@ -37,14 +40,14 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of activities owned by specified user
         """
-        cache_key = self.get_cache_key(f"owner_{owner_id}_{hash(str(kwargs))}")
+        cache_key = self.get_scoped_cache_key(f"owner_{owner_id}_{sorted(kwargs.items())}", owner_id)
 
         cached_activities = cache.get(cache_key)
-        if cached_activities:
+        if cached_activities is not None:
             return cached_activities
 
         activities = list(Activity.objects.filter(owner_id=owner_id, **kwargs))
-        cache.set(cache_key, activities, self.cache_timeout)
+        cache.set(cache_key, activities, self._timeout_for(activities))
         return activities
 
     def get_by_contact(self, contact_id: int, **kwargs) -> List[Activity]:
@@ -58,14 +61,14 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of activities for specified contact
         """
-        cache_key = self.get_cache_key(f"contact_{contact_id}_{hash(str(kwargs))}")
+        cache_key = self.get_scoped_cache_key(f"contact_{contact_id}_{sorted(kwargs.items())}")
 
         cached_activities = cache.get(cache_key)
-        if cached_activities:
+        if cached_activities is not None:
             return cached_activities
 
         activities = list(Activity.objects.filter(contact_id=contact_id, **kwargs))
-        cache.set(cache_key, activities, self.cache_timeout)
+        cache.set(cache_key, activities, self._timeout_for(activities))
         return activities
 
     def get_by_deal(self, deal_id: int, **kwargs) -> List[Activity]:
@@ -79,14 +82,14 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of activities for specified deal
         """
-        cache_key = self.get_cache_key(f"deal_{deal_id}_{hash(str(kwargs))}")
+        cache_key = self.get_scoped_cache_key(f"deal_{deal_id}_{sorted(kwargs.items())}")
 
         cached_activities = cache.get(cache_key)
-        if cached_activities:
+        if cached_activities is not None:
             return cached_activities
 
         activities = list(Activity.objects.filter(deal_id=deal_id, **kwargs))
-        cache.set(cache_key, activities, self.cache_timeout)
+        cache.set(cache_key, activities, self._timeout_for(activities))
         return activities
 
     def get_by_type(self, activity_type: str, owner_id: Optional[int] = None) -> List[Activity]:
@@ -100,10 +103,10 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of activities of specified type
         """
-        cache_key = self.get_cache_key(f"type_{activity_type}_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"type_{activity_type}_{owner_id}", owner_id)
 
         cached_activities = cache.get(cache_key)
-        if cached_activities:
+        if cached_activities is not None:
             return cached_activities
 
         queryset = Activity.objects.filter(type=activity_type)
@@ -111,7 +114,7 @@ class ActivityRepository(BaseRepository[Activity]):
             queryset = queryset.filter(owner_id=owner_id)
 
         activities = list(queryset)
-        cache.set(cache_key, activities, self.cache_timeout)
+        cache.set(cache_key, activities, self._timeout_for(activities))
         return activities
 
     def get_upcoming_activities(self, owner_id: Optional[int] = None, days: Optional[int] = None) -> List[Activity]:
@@ -125,12 +128,6 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of upcoming activities
         """
-        cache_key = self.get_cache_key(f"upcoming_{owner_id}_{days}")
-
-        cached_activities = cache.get(cache_key)
-        if cached_activities:
-            return cached_activities
-
         queryset = Activity.objects.filter(
             scheduled_at__gte=timezone.now(),
             is_completed=False,
@@ -144,9 +141,9 @@ class ActivityRepository(BaseRepository[Activity]):
             cutoff_date = timezone.now() + timedelta(days=days)
             queryset = queryset.filter(scheduled_at__lte=cutoff_date)
 
-        activities = list(queryset.order_by('scheduled_at'))
-        cache.set(cache_key, activities, self.cache_timeout)
-        return activities
+        return self.get_cached_id_list(
+            f"upcoming_{owner_id}_{days}", queryset.order_by('scheduled_at'), owner_id
+        )
 
     def get_overdue_activities(self, owner_id: Optional[int] = None) -> List[Activity]:
         """
@@ -158,10 +155,10 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of overdue activities
         """
-        cache_key = self.get_cache_key(f"overdue_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"overdue_{owner_id}", owner_id)
 
         cached_activities = cache.get(cache_key)
-        if cached_activities:
+        if cached_activities is not None:
             return cached_activities
 
         queryset = Activity.objects.filter(
@@ -174,7 +171,7 @@ class ActivityRepository(BaseRepository[Activity]):
             queryset = queryset.filter(owner_id=owner_id)
 
         activities = list(queryset.order_by('scheduled_at'))
-        cache.set(cache_key, activities, self.cache_timeout)
+        cache.set(cache_key, activities, self._timeout_for(activities))
         return activities
 
     def get_due_soon_activities(self, hours: int = 24, owner_id: Optional[int] = None) -> List[Activity]:
@@ -188,10 +185,10 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of activities due soon
         """
-        cache_key = self.get_cache_key(f"due_soon_{hours}_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"due_soon_{hours}_{owner_id}", owner_id)
 
         cached_activities = cache.get(cache_key)
-        if cached_activities:
+        if cached_activities is not None:
             return cached_activities
 
         cutoff_time = timezone.now() + timedelta(hours=hours)
@@ -206,7 +203,7 @@ class ActivityRepository(BaseRepository[Activity]):
             queryset = queryset.filter(owner_id=owner_id)
 
         activities = list(queryset.order_by('scheduled_at'))
-        cache.set(cache_key, activities, self.cache_timeout)
+        cache.set(cache_key, activities, self._timeout_for(activities))
         return activities
 
     def get_completed_activities(self, owner_id: Optional[int] = None, days: Optional[int] = None) -> List[Activity]:
@@ -220,10 +217,10 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of completed activities
         """
-        cache_key = self.get_cache_key(f"completed_{owner_id}_{days}")
+        cache_key = self.get_scoped_cache_key(f"completed_{owner_id}_{days}", owner_id)
 
         cached_activities = cache.get(cache_key)
-        if cached_activities:
+        if cached_activities is not None:
             return cached_activities
 
         queryset = Activity.objects.filter(is_completed=True)
@@ -235,7 +232,7 @@ class ActivityRepository(BaseRepository[Activity]):
             queryset = queryset.filter(completed_at__gte=cutoff_date)
 
         activities = list(queryset.order_by('-completed_at'))
-        cache.set(cache_key, activities, self.cache_timeout)
+        cache.set(cache_key, activities, self._timeout_for(activities))
         return activities
 
     def get_activities_by_priority(self, priority: str, owner_id: Optional[int] = None) -> List[Activity]:
@@ -249,10 +246,10 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of activities with specified priority
         """
-        cache_key = self.get_cache_key(f"priority_{priority}_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"priority_{priority}_{owner_id}", owner_id)
 
         cached_activities = cache.get(cache_key)
-        if cached_activities:
+        if cached_activities is not None:
             return cached_activities
 
         queryset = Activity.objects.filter(priority=priority, is_completed=False, is_cancelled=False)
@@ -260,7 +257,7 @@ class ActivityRepository(BaseRepository[Activity]):
             queryset = queryset.filter(owner_id=owner_id)
 
         activities = list(queryset.order_by('scheduled_at'))
-        cache.set(cache_key, activities, self.cache_timeout)
+        cache.set(cache_key, activities, self._timeout_for(activities))
         return activities
 
     def get_activities_for_date_range(self, start_date, end_date, owner_id: Optional[int] = None) -> List[Activity]:
@@ -275,10 +272,10 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of activities in date range
         """
-        cache_key = self.get_cache_key(f"range_{start_date}_{end_date}_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"range_{start_date}_{end_date}_{owner_id}", owner_id)
 
         cached_activities = cache.get(cache_key)
-        if cached_activities:
+        if cached_activities is not None:
             return cached_activities
 
         queryset = Activity.objects.filter(
@@ -290,7 +287,7 @@ class ActivityRepository(BaseRepository[Activity]):
             queryset = queryset.filter(owner_id=owner_id)
 
         activities = list(queryset.order_by('scheduled_at'))
-        cache.set(cache_key, activities, self.cache_timeout)
+        cache.set(cache_key, activities, self._timeout_for(activities))
         return activities
 
     def search_activities(self, query: str, owner_id: Optional[int] = None) -> List[Activity]:
@@ -304,10 +301,10 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of matching activities
         """
-        cache_key = self.get_cache_key(f"search_{query.lower()}_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"search_{query.lower()}_{owner_id}", owner_id)
 
         cached_activities = cache.get(cache_key)
-        if cached_activities:
+        if cached_activities is not None:
             return cached_activities
 
         filters = Q(
@@ -325,7 +322,8 @@ class ActivityRepository(BaseRepository[Activity]):
             Activity.objects.select_related('contact', 'deal')
             .filter(filters)
         )
-        cache.set(cache_key, activities, self.cache_timeout // 2)  # Shorter cache for search
+        # Shorter cache for search
+        cache.set(cache_key, activities, min(self._timeout_for(activities), self.cache_timeout // 2))
         return activities
 
     def get_activities_needing_reminders(self) -> List[Activity]:
@@ -335,10 +333,10 @@ class ActivityRepository(BaseRepository[Activity]):
         Returns:
             List of activities needing reminders
         """
-        cache_key = self.get_cache_key("need_reminders")
+        cache_key = self.get_scoped_cache_key("need_reminders")
 
         cached_activities = cache.get(cache_key)
-        if cached_activities:
+        if cached_activities is not None:
             return cached_activities
 
         activities = list(Activity.objects.filter(
@@ -355,83 +353,42 @@ class ActivityRepository(BaseRepository[Activity]):
         """
         Get comprehensive activity statistics
 
+        Shares the per-owner aggregates behind the activity statistics
+        endpoint, which Activity writes invalidate.
+
         Args:
             owner_id: Optional owner ID
 
         Returns:
             Dictionary with activity statistics
         """
-        cache_key = self.get_cache_key(f"statistics_{owner_id}")
-
-        cached_stats = cache.get(cache_key)
-        if cached_stats:
-            return cached_stats
-
+        service = ActivityStatisticsService()
         queryset = Activity.objects.all()
         if owner_id:
             queryset = queryset.filter(owner_id=owner_id)
-
-        # Basic counts
-        total_activities = queryset.count()
-        completed_activities = queryset.filter(is_completed=True).count()
-        cancelled_activities = queryset.filter(is_cancelled=True).count()
-        upcoming_activities = queryset.filter(
-            scheduled_at__gte=timezone.now(),
-            is_completed=False,
-            is_cancelled=False
-        ).count()
-        overdue_activities = queryset.filter(
-            scheduled_at__lt=timezone.now(),
-            is_completed=False,
-            is_cancelled=False
-        ).count()
-
-        # Type distribution
-        type_stats = list(
-            queryset.values('type')
-            .annotate(count=Count('id'))
-            .order_by('type')
-        )
-
-        # Priority distribution
-        priority_stats = list(
-            queryset.filter(is_completed=False, is_cancelled=False)
-            .values('priority')
-            .annotate(count=Count('id'))
-            .order_by('priority')
-        )
-
-        # Recent activities (last 7 days)
-        seven_days_ago = timezone.now() - timedelta(days=7)
-        recent_activities = queryset.filter(created_at__gte=seven_days_ago).count()
-
-        # Activities completed this week
-        week_start = timezone.now() - timedelta(days=timezone.now().weekday())
-        completed_this_week = queryset.filter(
-            is_completed=True,
-            completed_at__gte=week_start
-        ).count()
-
-        # Completion rate
-        completion_rate = (completed_activities / total_activities * 100) if total_activities > 0 else 0
-
-        statistics = {
-            'total_activities': total_activities,
-            'completed_activities': completed_activities,
-            'cancelled_activities': cancelled_activities,
-            'upcoming_activities': upcoming_activities,
-            'overdue_activities': overdue_activities,
-            'completion_rate': round(completion_rate, 2),
-            'recent_activities': recent_activities,
-            'completed_this_week': completed_this_week,
-            'type_distribution': type_stats,
-            'priority_distribution': priority_stats,
-            'last_updated': timezone.now(),
+        stats = service.get_statistics(queryset, owner_id or ALL_OWNERS)
+
+        return {
+            'total_activities': stats['total'],
+            'completed_activities': stats['completed'],
+            'cancelled_activities': stats['cancelled'],
+            'upcoming_activities': stats['upcoming'],
+            'overdue_activities': stats['overdue'],
+            'completion_rate': service.completion_rate(stats),
+            'recent_activities': stats['created_last_7_days'],
+            'completed_this_week': stats['completed_this_week'],
+            'type_distribution': [
+                {'type': activity_type, 'count': count}
+                for activity_type, count in sorted(service.by_type(stats).items())
+            ],
+            'priority_distribution': [
+                {'priority': priority, 'count': count}
+                for priority, count in sorted(service.by_priority(stats, open_only=True).items())
+                if count
+            ],
+            'last_updated': stats['computed_at'],
         }
 
-        cache.set(cache_key, statistics, self.cache_timeout)
-        return statistics
-
     def complete_activity(self, activity_id: int, notes: Optional[str] = None) -> bool:
         """
         Mark activity as completed
@@ -448,10 +405,7 @@ class ActivityRepository(BaseRepository[Activity]):
             activity.mark_completed(notes)
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{activity_id}")
-            if hasattr(activity, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{activity.uuid}")
-            self._invalidate_cache_pattern("statistics")
+            self._invalidate_entity_cache(activity)
 
             logger.info(f"Completed activity {activity_id}")
             return True
@@ -474,10 +428,7 @@ class ActivityRepository(BaseRepository[Activity]):
             activity.mark_cancelled()
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{activity_id}")
-            if hasattr(activity, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{activity.uuid}")
-            self._invalidate_cache_pattern("statistics")
+            self._invalidate_entity_cache(activity)
 
             logger.info(f"Cancelled activity {activity_id}")
             return True
@@ -501,10 +452,7 @@ class ActivityRepository(BaseRepository[Activity]):
             activity.reschedule(new_time)
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{activity_id}")
-            if hasattr(activity, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{activity.uuid}")
-            self._invalidate_cache_pattern("statistics")
+            self._invalidate_entity_cache(activity)
 
             logger.info(f"Rescheduled activity {activity_id} to {new_time}")
             return True
@@ -527,7 +475,7 @@ class ActivityRepository(BaseRepository[Activity]):
             activity.send_reminder()
 
             # Invalidate cache
-            self._invalidate_cache_pattern("need_reminders")
+            self._invalidate_entity_cache(activity)
 
             logger.info(f"Marked reminder as sent for activity {activity_id}")
             return True
@@ -542,25 +490,6 @@ class ActivityRepository(BaseRepository[Activity]):
         Args:
             activity: Activity instance
         """
-        cache_keys_to_clear = [
-            f"id_{activity.id}",
-            f"owner_{activity.owner_id}",
-            f"type_{activity.type}",
-            f"priority_{activity.priority}",
-            "statistics",
-            "need_reminders",
-        ]
-
-        if hasattr(activity, 'uuid'):
-            cache_keys_to_clear.append(f"uuid_{activity.uuid}")
-
-        if activity.contact_id:
-            cache_keys_to_clear.append(f"contact_{activity.contact_id}")
-        if activity.deal_id:
-            cache_keys_to_clear.append(f"deal_{activity.deal_id}")
-
-        for key_suffix in cache_keys_to_clear:
-            cache_key = self.get_cache_key(key_suffix)
-            cache.delete(cache_key)
+        self._invalidate_entity_cache(activity)
 
         logger.debug(f"Cleared cache for activity {activity.title}")
\ No newline at end of file
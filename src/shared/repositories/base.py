@@ -4,16 +4,27 @@ Following SOLID principles and enterprise best practices
 """
 
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List, Optional, Dict, Any
+from typing import TypeVar, Generic, List, Optional, Dict, Any, Iterable, Iterator, Callable, Sequence, Tuple
+from django.conf import settings
 from django.db import models
 from django.core.paginator import Paginator
 from django.core.cache import cache
+import copy
 import logging
 
+from .cache_generations import CacheGenerations, ALL_SCOPE, MODEL_SCOPE, owner_scope
+from .local_cache import get_local_cache
+from .simple_cache import NEGATIVE_RESULT, DEFAULT_NEGATIVE_TIMEOUT, is_negative_result
+from .stampede import get_or_compute
+from crm.shared.pagination import paginate_keyset, iter_keyset_chunks
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=models.Model)
 
+# Returned by _get_cached_point on a miss, to tell it apart from a cached "not found"
+CACHE_MISS = object()
+
 
 class BaseRepository(Generic[T], ABC):
     """
@@ -21,21 +32,156 @@ class BaseRepository(Generic[T], ABC):
     Following SOLID principles for clean data access layer
     """
 
-    def __init__(self, model: type[T], cache_timeout: int = 300):
+    # Indexed ordering used by keyset pagination; must end with a unique column
+    keyset_ordering = ('-created_at', '-id')
+
+    def __init__(self, model: type[T], cache_timeout: int = 300,
+                 negative_cache_timeout: Optional[int] = None):
         """
         Initialize repository with model class and cache timeout
 
         Args:
             model: Django model class
             cache_timeout: Cache timeout in seconds
+            negative_cache_timeout: Cache timeout for "not found" and empty
+                results in seconds (defaults to the shorter of cache_timeout
+                and DEFAULT_NEGATIVE_TIMEOUT)
         """
         self.model = model
         self.cache_timeout = cache_timeout
+        self.negative_cache_timeout = (
+            negative_cache_timeout if negative_cache_timeout is not None
+            else min(cache_timeout, DEFAULT_NEGATIVE_TIMEOUT)
+        )
         self.cache_prefix = f"{model._meta.model_name}_"
+        self.generations = CacheGenerations(self.cache_prefix, cache)
+        self.local_cache = get_local_cache()
 
     def get_cache_key(self, key: str) -> str:
-        """Generate cache key with prefix"""
-        return f"{self.cache_prefix}{key}"
+        """
+        Generate cache key with prefix and the current model generation
+
+        Used for point lookups (id, uuid, email) which are deleted explicitly
+        on write; everything else should use get_scoped_cache_key.
+        """
+        generation = self.generations.get(MODEL_SCOPE)
+        return f"{self.cache_prefix}v{generation}_{key}"
+
+    def get_cache_keys(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Generate several point lookup cache keys with a single generation read
+
+        Args:
+            keys: Key suffixes
+
+        Returns:
+            Mapping of key suffix to versioned cache key
+        """
+        generation = self.generations.get(MODEL_SCOPE)
+        return {key: f"{self.cache_prefix}v{generation}_{key}" for key in keys}
+
+    def get_scoped_cache_key(self, key: str, owner_id: Optional[int] = None) -> str:
+        """
+        Generate cache key for derived data (lists, searches, statistics)
+
+        The key embeds the model generation and the owner scope (or the
+        ``all`` scope when no owner is given) with its generation, so keys of
+        different owners never collide and any write touching that owner
+        makes every such key unreachable at once.
+
+        Args:
+            key: Key suffix
+            owner_id: Optional owner ID the cached data is restricted to
+
+        Returns:
+            Versioned cache key
+        """
+        scope = owner_scope(owner_id)
+        generations = self.generations.get_many([MODEL_SCOPE, scope])
+        return f"{self.cache_prefix}v{generations[MODEL_SCOPE]}.{scope}.{generations[scope]}_{key}"
+
+    def get_or_compute(self, key: str, compute_func: Callable[[], Any],
+                       owner_id: Optional[int] = None, timeout: Optional[int] = None,
+                       serve_stale: bool = True) -> Any:
+        """
+        Get derived data with stampede protection
+
+        Intended for expensive aggregates: only one worker recomputes an
+        expired key while the others keep serving the last value of the
+        same generation, and hot keys are refreshed early before they expire.
+        After a write bumps the generation nothing stale is served; waiters
+        block briefly for the recomputed value instead.
+
+        Args:
+            key: Key suffix
+            compute_func: Callable producing the value
+            owner_id: Optional owner ID the data is restricted to
+            timeout: Freshness lifetime (defaults to cache_timeout)
+            serve_stale: Whether to serve the last value while recomputing
+
+        Returns:
+            Cached or freshly computed value
+        """
+        cache_key = self.get_scoped_cache_key(key, owner_id)
+        # Derived from the versioned key so a write never serves pre-write data
+        stale_key = f"{cache_key}_stale" if serve_stale else None
+        return get_or_compute(cache_key, compute_func, timeout or self.cache_timeout, stale_key, cache)
+
+    def _timeout_for(self, value: Any) -> int:
+        """Cache timeout for a value; empty results use the shorter negative timeout"""
+        if value is None or (isinstance(value, (list, tuple, dict, set)) and not value):
+            return self.negative_cache_timeout
+        return self.cache_timeout
+
+    def _get_cached_point(self, key: str) -> Tuple[str, Any]:
+        """
+        Look up a point lookup key in both cache tiers
+
+        Args:
+            key: Key suffix
+
+        Returns:
+            Tuple of the versioned cache key and the cached entity, None for a
+            cached "not found", or CACHE_MISS
+        """
+        cached_entity = self._get_local(key)
+        if cached_entity is not None:
+            return None, cached_entity
+
+        cache_key = self.get_cache_key(key)
+        cached_entity = cache.get(cache_key)
+        if cached_entity is None:
+            return cache_key, CACHE_MISS
+        if is_negative_result(cached_entity):
+            return cache_key, None
+
+        self._set_local(key, cached_entity)
+        return cache_key, cached_entity
+
+    def _set_cached_point(self, key: str, cache_key: str, entity: Optional[T]) -> None:
+        """
+        Store a point lookup result, caching None as a negative entry
+
+        Negative entries only live in the shared cache, with the negative
+        timeout; they are deleted with the other point keys when an entity
+        matching them is created.
+        """
+        if entity is None:
+            cache.set(cache_key, NEGATIVE_RESULT, self.negative_cache_timeout)
+            return
+        cache.set(cache_key, entity, self.cache_timeout)
+        self._set_local(key, entity)
+
+    def _get_local(self, key: str) -> Optional[T]:
+        """Get a point lookup from the in-process L1 cache, if enabled"""
+        if self.local_cache is None:
+            return None
+        return self.local_cache.get(f"{self.cache_prefix}{key}")
+
+    def _set_local(self, key: str, entity: T) -> None:
+        """Store a point lookup in the in-process L1 cache, if enabled"""
+        if self.local_cache is not None:
+            self.local_cache.set(f"{self.cache_prefix}{key}", entity)
 
     def get_by_id(self, id: int, use_cache: bool = True) -> Optional[T]:
         """
@@ -48,22 +194,23 @@ class BaseRepository(Generic[T], ABC):
         Returns:
             Entity instance or None
         """
-        cache_key = self.get_cache_key(f"id_{id}")
+        key = f"id_{id}"
 
         if use_cache:
-            cached_entity = cache.get(cache_key)
-            if cached_entity:
+            cache_key, cached_entity = self._get_cached_point(key)
+            if cached_entity is not CACHE_MISS:
                 logger.debug(f"Cache hit for {self.model.__name__} ID {id}")
                 return cached_entity
 
         try:
             entity = self.model.objects.get(id=id)
-            if use_cache:
-                cache.set(cache_key, entity, self.cache_timeout)
-            return entity
         except self.model.DoesNotExist:
             logger.debug(f"{self.model.__name__} with ID {id} not found")
-            return None
+            entity = None
+
+        if use_cache:
+            self._set_cached_point(key, cache_key, entity)
+        return entity
 
     def get_by_uuid(self, uuid: str, use_cache: bool = True) -> Optional[T]:
         """
@@ -76,22 +223,157 @@ class BaseRepository(Generic[T], ABC):
         Returns:
             Entity instance or None
         """
-        cache_key = self.get_cache_key(f"uuid_{uuid}")
+        key = f"uuid_{uuid}"
 
         if use_cache:
-            cached_entity = cache.get(cache_key)
-            if cached_entity:
+            cache_key, cached_entity = self._get_cached_point(key)
+            if cached_entity is not CACHE_MISS:
                 logger.debug(f"Cache hit for {self.model.__name__} UUID {uuid}")
                 return cached_entity
 
         try:
             entity = self.model.objects.get(uuid=uuid)
-            if use_cache:
-                cache.set(cache_key, entity, self.cache_timeout)
-            return entity
         except (self.model.DoesNotExist, AttributeError):
             logger.debug(f"{self.model.__name__} with UUID {uuid} not found")
-            return None
+            entity = None
+
+        if use_cache:
+            self._set_cached_point(key, cache_key, entity)
+        return entity
+
+    def get_many_by_ids(self, ids: Iterable[int], use_cache: bool = True) -> List[T]:
+        """
+        Get several entities by ID in a constant number of round trips
+
+        Cached entities are resolved with one cache.get_many, the misses are
+        loaded with one id__in query and written back with cache.set_many;
+        IDs that do not exist are cached as negative entries.
+
+        Args:
+            ids: Entity IDs
+            use_cache: Whether to use cache
+
+        Returns:
+            Entities in the requested order; missing IDs are skipped
+        """
+        return self._get_many_by_ids(ids, "id_{}", self.model.objects, use_cache)
+
+    def _get_many_by_ids(self, ids: Iterable[int], key_format: str,
+                         manager: models.Manager, use_cache: bool) -> List[T]:
+        """
+        Shared multi-get implementation
+
+        Args:
+            ids: Entity IDs
+            key_format: Point lookup key suffix with one ``{}`` for the ID
+            manager: Manager used to load cache misses
+            use_cache: Whether to use cache
+
+        Returns:
+            Entities in the requested order; missing IDs are skipped
+        """
+        ids = list(dict.fromkeys(ids))
+        found = {}
+        known_missing = set()
+
+        if use_cache:
+            for id in ids:
+                entity = self._get_local(key_format.format(id))
+                if entity is not None:
+                    found[id] = entity
+
+            cache_keys = self.get_cache_keys(key_format.format(id) for id in ids if id not in found)
+            if cache_keys:
+                cached = cache.get_many(list(cache_keys.values()))
+                for id in ids:
+                    key = key_format.format(id)
+                    entity = cached.get(cache_keys.get(key))
+                    if is_negative_result(entity):
+                        known_missing.add(id)
+                    elif entity is not None:
+                        found[id] = entity
+                        self._set_local(key, entity)
+
+        missing = [id for id in ids if id not in found and id not in known_missing]
+        if missing:
+            loaded = {entity.id: entity for entity in manager.filter(id__in=missing)}
+            found.update(loaded)
+            if use_cache:
+                self._cache_entities(loaded.values(), key_format)
+                self._cache_negative([key_format.format(id) for id in missing if id not in loaded])
+
+        logger.debug(
+            f"Loaded {len(found)} of {len(ids)} {self.model.__name__} entities "
+            f"({len(missing)} from database)"
+        )
+        return [found[id] for id in ids if id in found]
+
+    def _cache_entities(self, entities: Iterable[T], key_format: str) -> None:
+        """
+        Write entities to the per-ID cache with a single set_many
+
+        Args:
+            entities: Entity instances
+            key_format: Point lookup key suffix with one ``{}`` for the ID
+        """
+        entities = {key_format.format(entity.id): entity for entity in entities}
+        if not entities:
+            return
+
+        cache_keys = self.get_cache_keys(entities)
+        cache.set_many(
+            {cache_keys[key]: entity for key, entity in entities.items()},
+            self.cache_timeout
+        )
+        for key, entity in entities.items():
+            self._set_local(key, entity)
+
+    def _cache_negative(self, keys: List[str]) -> None:
+        """Cache "not found" for several point lookup keys with a single set_many"""
+        if not keys:
+            return
+
+        cache_keys = self.get_cache_keys(keys)
+        cache.set_many(
+            {cache_key: NEGATIVE_RESULT for cache_key in cache_keys.values()},
+            self.negative_cache_timeout
+        )
+
+    def _get_id_key_format(self) -> str:
+        """Point lookup key suffix used by get_many_by_ids with default arguments"""
+        return "id_{}"
+
+    def get_cached_id_list(self, key: str, queryset: models.QuerySet,
+                           owner_id: Optional[int] = None,
+                           timeout: Optional[int] = None) -> List[T]:
+        """
+        Evaluate a list query, caching only the ordered primary keys
+
+        The entities themselves live once in the per-ID cache and are
+        hydrated with a batched multi-get, so lists stay small in the cache,
+        rows are not duplicated across keys and per-entity invalidation
+        applies to every list containing the entity.
+
+        Args:
+            key: Key suffix
+            queryset: Ordered queryset producing the list
+            owner_id: Optional owner ID the list is restricted to
+            timeout: Cache timeout (defaults to cache_timeout)
+
+        Returns:
+            List of entities in queryset order
+        """
+        cache_key = self.get_scoped_cache_key(key, owner_id)
+
+        ids = cache.get(cache_key)
+        if ids is not None:
+            return self.get_many_by_ids(ids)
+
+        entities = list(queryset)
+        ids = [entity.id for entity in entities]
+        cache.set(cache_key, ids, self.negative_cache_timeout if not ids else timeout or self.cache_timeout)
+        self._cache_entities(entities, self._get_id_key_format())
+        return entities
 
     def get_all(self, use_cache: bool = False) -> List[T]:
         """
@@ -103,19 +385,72 @@ class BaseRepository(Generic[T], ABC):
         Returns:
             List of entities
         """
-        cache_key = self.get_cache_key("all")
+        cache_key = self.get_scoped_cache_key("all")
 
         if use_cache:
             cached_entities = cache.get(cache_key)
-            if cached_entities:
+            if cached_entities is not None:
                 logger.debug(f"Cache hit for all {self.model.__name__} entities")
                 return cached_entities
 
         entities = list(self.model.objects.all())
         if use_cache:
-            cache.set(cache_key, entities, self.cache_timeout)
+            cache.set(cache_key, entities, self._timeout_for(entities))
         return entities
 
+    def iter_all(self, chunk_size: Optional[int] = None, fields: Optional[Sequence[str]] = None,
+                 keyset: bool = False) -> Iterator[Any]:
+        """
+        Stream every entity in constant memory
+
+        Use instead of get_all for full-table consumers (exports, reports,
+        metrics); nothing is cached.
+
+        Args:
+            chunk_size: Rows fetched per round trip
+            fields: Optional values() projection
+            keyset: Use keyset chunks instead of a server-side cursor
+
+        Returns:
+            Iterator of entities, or of dicts when fields are given
+        """
+        return self.iter_filtered(chunk_size=chunk_size, fields=fields, keyset=keyset)
+
+    def iter_filtered(self, chunk_size: Optional[int] = None, fields: Optional[Sequence[str]] = None,
+                      keyset: bool = False, **kwargs) -> Iterator[Any]:
+        """
+        Stream filtered entities in constant memory
+
+        By default rows come from a server-side cursor (QuerySet.iterator),
+        which keeps a transaction open while the caller consumes them. With
+        keyset=True the rows are fetched in independent queries seeking past
+        the last id instead, which suits slow consumers and connection poolers
+        that do not support server-side cursors.
+
+        Args:
+            chunk_size: Rows fetched per round trip (defaults to
+                REPOSITORY_ITER_CHUNK_SIZE)
+            fields: Optional values() projection; ``id`` is added in keyset mode
+            keyset: Use keyset chunks instead of a server-side cursor
+            **kwargs: Filter criteria
+
+        Returns:
+            Iterator of entities, or of dicts when fields are given
+        """
+        chunk_size = chunk_size or getattr(settings, 'REPOSITORY_ITER_CHUNK_SIZE', 2000)
+        queryset = self.filter(**kwargs)
+        if fields:
+            if keyset and 'id' not in fields:
+                fields = ['id', *fields]
+            queryset = queryset.values(*fields)
+
+        logger.debug(f"Streaming {self.model.__name__} entities in chunks of {chunk_size}")
+        if keyset:
+            for chunk in iter_keyset_chunks(queryset, chunk_size):
+                yield from chunk
+        else:
+            yield from queryset.iterator(chunk_size=chunk_size)
+
     def filter(self, **kwargs) -> models.QuerySet[T]:
         """
         Filter entities with given criteria
@@ -139,8 +474,7 @@ class BaseRepository(Generic[T], ABC):
             Created entity
         """
         entity = self.model.objects.create(**kwargs)
-        self._invalidate_cache_pattern(f"id_{entity.id}")
-        self._invalidate_cache_pattern("all")
+        self._invalidate_entity_cache(entity)
         logger.info(f"Created {self.model.__name__} with ID {entity.id}")
         return entity
 
@@ -157,15 +491,14 @@ class BaseRepository(Generic[T], ABC):
         """
         try:
             entity = self.model.objects.get(id=id)
+            # Keep the pre-update state so keys for the old email/owner go too
+            previous = copy.copy(entity)
             for key, value in kwargs.items():
                 setattr(entity, key, value)
             entity.save()
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{id}")
-            if hasattr(entity, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{entity.uuid}")
-            self._invalidate_cache_pattern("all")
+            self._invalidate_entity_cache(previous, entity)
 
             logger.info(f"Updated {self.model.__name__} with ID {id}")
             return entity
@@ -188,10 +521,7 @@ class BaseRepository(Generic[T], ABC):
             entity.delete()
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{id}")
-            if hasattr(entity, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{entity.uuid}")
-            self._invalidate_cache_pattern("all")
+            self._invalidate_entity_cache(entity)
 
             logger.info(f"Deleted {self.model.__name__} with ID {id}")
             return True
@@ -214,7 +544,7 @@ class BaseRepository(Generic[T], ABC):
         ])
 
         # Invalidate cache
-        self._invalidate_cache_pattern("all")
+        self._invalidate_entity_cache(*created_entities)
 
         logger.info(f"Bulk created {len(created_entities)} {self.model.__name__} entities")
         return created_entities
@@ -233,11 +563,10 @@ class BaseRepository(Generic[T], ABC):
         updated_count = self.model.objects.bulk_update(entities, fields)
 
         # Invalidate cache
-        self._invalidate_cache_pattern("all")
-        for entity in entities:
-            self._invalidate_cache_pattern(f"id_{entity.id}")
-            if hasattr(entity, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{entity.uuid}")
+        if 'owner' in fields or 'owner_id' in fields:
+            # Previous owners are unknown here, so drop every derived key
+            self._invalidate_cache_pattern("owner")
+        self._invalidate_entity_cache(*entities)
 
         logger.info(f"Bulk updated {updated_count} {self.model.__name__} entities")
         return updated_count
@@ -266,19 +595,49 @@ class BaseRepository(Generic[T], ABC):
         """
         return self.model.objects.filter(**kwargs).count()
 
-    def get_paginated(self, page: int = 1, per_page: int = 20, **kwargs) -> Dict[str, Any]:
+    def get_paginated(self, page: int = 1, per_page: int = 20, cursor: Optional[str] = None,
+                      keyset: bool = False, include_count: bool = True, **kwargs) -> Dict[str, Any]:
         """
         Get paginated results
 
+        Page-number pagination issues COUNT(*) and OFFSET, which gets slower
+        the deeper the page. Passing a cursor (or keyset=True for the first
+        page) switches to keyset pagination over keyset_ordering, where every
+        page costs the same; the count is then only run if include_count.
+
         Args:
-            page: Page number
+            page: Page number (page-number mode)
             per_page: Items per page
+            cursor: Opaque cursor from a previous keyset page
+            keyset: Use keyset pagination without a cursor (first page)
+            include_count: Whether keyset mode should count the total
             **kwargs: Filter criteria
 
         Returns:
             Dictionary with pagination info and results
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         queryset = self.filter(**kwargs)
+
+        if cursor or keyset:
+            result = paginate_keyset(
+                queryset, self.keyset_ordering, per_page,
+                cursor=cursor, include_count=include_count
+            )
+            return {
+                'results': result.results,
+                'pagination': {
+                    'per_page': per_page,
+                    'total_items': result.count,
+                    'next_cursor': result.next_cursor,
+                    'previous_cursor': result.previous_cursor,
+                    'has_next': result.has_next,
+                    'has_previous': result.has_previous,
+                }
+            }
+
         paginator = Paginator(queryset, per_page)
 
         try:
@@ -298,20 +657,67 @@ class BaseRepository(Generic[T], ABC):
             }
         }
 
+    def _get_entity_cache_keys(self, entity: T) -> List[str]:
+        """
+        Get point lookup key suffixes that may hold the given entity
+
+        Args:
+            entity: Entity instance
+
+        Returns:
+            List of key suffixes for get_cache_key
+        """
+        keys = [f"id_{entity.id}"]
+        if hasattr(entity, 'uuid'):
+            keys.append(f"uuid_{entity.uuid}")
+        return keys
+
+    def _get_entity_cache_scopes(self, entity: T) -> List[str]:
+        """Get generation scopes whose derived keys may include the given entity"""
+        return [ALL_SCOPE, owner_scope(getattr(entity, 'owner_id', None))]
+
+    def _invalidate_entity_cache(self, *entities: T):
+        """
+        Invalidate cache after a write to one or more entities
+
+        Point lookup keys are deleted directly from both cache tiers, which
+        also drops negative entries cached for a newly created entity; derived
+        keys (owner lists, searches, statistics) are invalidated by bumping the
+        owner and ``all`` generations, one atomic increment per scope.
+
+        Args:
+            *entities: Written entity instances
+        """
+        keys = set()
+        scopes = set()
+        for entity in entities:
+            keys.update(self._get_entity_cache_keys(entity))
+            scopes.update(self._get_entity_cache_scopes(entity))
+
+        if keys:
+            cache.delete_many(list(self.get_cache_keys(keys).values()))
+            if self.local_cache is not None:
+                self.local_cache.delete_many(f"{self.cache_prefix}{key}" for key in keys)
+        self.generations.bump_many(scopes)
+
     def _invalidate_cache_pattern(self, pattern: str):
         """
         Invalidate cache keys matching pattern
 
+        Generation counters cannot address a sub-pattern, so this advances the
+        model generation and thereby invalidates every key of this repository.
+        Prefer _invalidate_entity_cache for ordinary writes.
+
         Args:
-            pattern: Cache key pattern
+            pattern: Cache key pattern (kept for logging)
         """
-        cache_key = self.get_cache_key(pattern)
-        cache.delete(cache_key)
+        self.generations.bump(MODEL_SCOPE)
+        if self.local_cache is not None:
+            self.local_cache.clear(self.cache_prefix)
+        logger.debug(f"Invalidated {self.model.__name__} cache for pattern '{pattern}'")
 
     def clear_cache(self):
         """Clear all cache for this repository"""
-        # This is a simplified implementation
-        # In production, you might want to use cache.delete_many with pattern matching
         self._invalidate_cache_pattern("all")
         logger.info(f"Cleared cache for {self.model.__name__} repository")
 
@@ -321,20 +727,27 @@ class SoftDeleteRepository(BaseRepository[T]):
     Base repository for models with soft delete functionality
     """
 
-    def __init__(self, model: type[T], cache_timeout: int = 300):
-        super().__init__(model, cache_timeout)
+    def __init__(self, model: type[T], cache_timeout: int = 300,
+                 negative_cache_timeout: Optional[int] = None):
+        super().__init__(model, cache_timeout, negative_cache_timeout)
         self.include_deleted = False
 
+    def _get_entity_cache_keys(self, entity: T) -> List[str]:
+        """Include the soft-delete aware ID keys"""
+        keys = super()._get_entity_cache_keys(entity)
+        keys.extend(f"id_{entity.id}_deleted_{flag}" for flag in (True, False))
+        return keys
+
     def get_by_id(self, id: int, use_cache: bool = True, include_deleted: bool = None) -> Optional[T]:
         """Get entity by ID with soft delete support"""
         if include_deleted is None:
             include_deleted = self.include_deleted
 
-        cache_key = self.get_cache_key(f"id_{id}_deleted_{include_deleted}")
+        key = f"id_{id}_deleted_{include_deleted}"
 
         if use_cache:
-            cached_entity = cache.get(cache_key)
-            if cached_entity:
+            cache_key, cached_entity = self._get_cached_point(key)
+            if cached_entity is not CACHE_MISS:
                 return cached_entity
 
         try:
@@ -342,12 +755,25 @@ class SoftDeleteRepository(BaseRepository[T]):
                 entity = self.model.objects_with_deleted.get(id=id)
             else:
                 entity = self.model.objects.get(id=id)
-
-            if use_cache:
-                cache.set(cache_key, entity, self.cache_timeout)
-            return entity
         except self.model.DoesNotExist:
-            return None
+            entity = None
+
+        if use_cache:
+            self._set_cached_point(key, cache_key, entity)
+        return entity
+
+    def _get_id_key_format(self) -> str:
+        """Point lookup key suffix used by get_many_by_ids with default arguments"""
+        return f"id_{{}}_deleted_{self.include_deleted}"
+
+    def get_many_by_ids(self, ids: Iterable[int], use_cache: bool = True,
+                        include_deleted: bool = None) -> List[T]:
+        """Get several entities by ID with soft delete support"""
+        if include_deleted is None:
+            include_deleted = self.include_deleted
+
+        manager = self.model.objects_with_deleted if include_deleted else self.model.objects
+        return self._get_many_by_ids(ids, f"id_{{}}_deleted_{include_deleted}", manager, use_cache)
 
     def soft_delete(self, id: int) -> bool:
         """
@@ -368,10 +794,7 @@ class SoftDeleteRepository(BaseRepository[T]):
                 entity.save()
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{id}")
-            if hasattr(entity, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{entity.uuid}")
-            self._invalidate_cache_pattern("all")
+            self._invalidate_entity_cache(entity)
 
             logger.info(f"Soft deleted {self.model.__name__} with ID {id}")
             return True
@@ -398,10 +821,7 @@ class SoftDeleteRepository(BaseRepository[T]):
                 entity.save()
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{id}")
-            if hasattr(entity, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{entity.uuid}")
-            self._invalidate_cache_pattern("all")
+            self._invalidate_entity_cache(entity)
 
             logger.info(f"Restored {self.model.__name__} with ID {id}")
             return True
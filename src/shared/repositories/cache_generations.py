@@ -0,0 +1,105 @@
+"""
+Cache Generation Counters Implementation
+Namespace versioning so a single atomic increment invalidates a whole family of cache keys
+"""
+
+from django.core.cache import cache
+from typing import Dict, Iterable, Optional
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY_PREFIX = "gen_"
+ALL_SCOPE = "all"
+MODEL_SCOPE = "model"
+
+
+def owner_scope(owner_id: Optional[int]) -> str:
+    """Return the generation scope name for an owner (``all`` when unscoped)"""
+    return f"owner_{owner_id}" if owner_id else ALL_SCOPE
+
+
+class CacheGenerations:
+    """
+    Generation counters for one cache namespace.
+
+    Every cache key embeds the current generation of the scopes it depends on;
+    bumping a scope's counter makes all of its keys unreachable without
+    SCAN/KEYS. Orphaned entries simply expire with their TTL.
+    """
+
+    def __init__(self, namespace: str, backend=None):
+        self.namespace = namespace
+        self.backend = backend if backend is not None else cache
+
+    def _make_key(self, scope: str) -> str:
+        """Generate the cache key holding a scope's counter"""
+        return f"{GENERATION_KEY_PREFIX}{self.namespace}{scope}"
+
+    @staticmethod
+    def _seed() -> int:
+        """
+        Initial value for a missing counter.
+
+        Seeding from the clock rather than 0 means a counter that was evicted
+        never comes back at a generation whose keys may still be cached.
+        """
+        return int(time.time() * 1000)
+
+    def get(self, scope: str) -> int:
+        """Get the current generation of a scope"""
+        return self.get_many([scope])[scope]
+
+    def get_many(self, scopes: Iterable[str]) -> Dict[str, int]:
+        """
+        Get the current generations of several scopes in one round trip
+
+        Args:
+            scopes: Scope names
+
+        Returns:
+            Mapping of scope name to generation
+        """
+        keys = {scope: self._make_key(scope) for scope in scopes}
+        found = self.backend.get_many(list(keys.values()))
+
+        generations = {}
+        for scope, key in keys.items():
+            value = found.get(key)
+            if value is None:
+                seed = self._seed()
+                # add() only succeeds for the first process; everyone else
+                # must adopt the winner's value
+                if self.backend.add(key, seed, None):
+                    value = seed
+                else:
+                    value = self.backend.get(key, seed)
+            generations[scope] = value
+        return generations
+
+    def bump(self, scope: str) -> int:
+        """
+        Atomically advance a scope's generation
+
+        Args:
+            scope: Scope name
+
+        Returns:
+            New generation
+        """
+        key = self._make_key(scope)
+        try:
+            return self.backend.incr(key)
+        except ValueError:
+            # Counter missing (never read or evicted): start a fresh one
+            if self.backend.add(key, self._seed(), None):
+                return self.backend.get(key)
+            return self.backend.incr(key)
+
+    def bump_many(self, scopes: Iterable[str]) -> None:
+        """Advance the generation of each given scope"""
+        scopes = set(scopes)
+        for scope in scopes:
+            self.bump(scope)
+        logger.debug(f"Bumped cache generations for {self.namespace}: {sorted(scopes)}")
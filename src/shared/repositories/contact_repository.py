@@ -10,7 +10,7 @@ from django.utils import timezone
 from datetime import timedelta
 import logging
 
-from .base import SoftDeleteRepository
+from .base import SoftDeleteRepository, CACHE_MISS
 from crm.apps.contacts.models import Contact
 
 logger = logging.getLogger(__name__)
@@ -26,6 +26,13 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         """Initialize contact repository"""
         super().__init__(Contact, cache_timeout)
 
+    def _get_entity_cache_keys(self, contact: Contact) -> List[str]:
+        """Include the email lookup key"""
+        keys = super()._get_entity_cache_keys(contact)
+        if contact.email:
+            keys.append(f"email_{contact.email.lower()}")
+        return keys
+
     def get_by_email(self, email: str, use_cache: bool = True) -> Optional[Contact]:
         """
         Get contact by email (case-insensitive)
@@ -37,22 +44,23 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         Returns:
             Contact instance or None
         """
-        cache_key = self.get_cache_key(f"email_{email.lower()}")
+        key = f"email_{email.lower()}"
 
         if use_cache:
-            cached_contact = cache.get(cache_key)
-            if cached_contact:
+            cache_key, cached_contact = self._get_cached_point(key)
+            if cached_contact is not CACHE_MISS:
                 logger.debug(f"Cache hit for contact email {email}")
                 return cached_contact
 
         try:
             contact = Contact.objects.get(email__iexact=email)
-            if use_cache:
-                cache.set(cache_key, contact, self.cache_timeout)
-            return contact
         except Contact.DoesNotExist:
             logger.debug(f"Contact with email {email} not found")
-            return None
+            contact = None
+
+        if use_cache:
+            self._set_cached_point(key, cache_key, contact)
+        return contact
 
     def get_by_owner(self, owner_id: int, **kwargs) -> List[Contact]:
         """
@@ -65,15 +73,11 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         Returns:
             List of contacts owned by specified user
         """
-        cache_key = self.get_cache_key(f"owner_{owner_id}_{hash(str(kwargs))}")
-
-        cached_contacts = cache.get(cache_key)
-        if cached_contacts:
-            return cached_contacts
-
-        contacts = list(Contact.objects.filter(owner_id=owner_id, **kwargs))
-        cache.set(cache_key, contacts, self.cache_timeout)
-        return contacts
+        return self.get_cached_id_list(
+            f"owner_{owner_id}_{sorted(kwargs.items())}",
+            Contact.objects.filter(owner_id=owner_id, **kwargs),
+            owner_id
+        )
 
     def search_contacts(self, query: str, owner_id: Optional[int] = None) -> List[Contact]:
         """
@@ -86,10 +90,10 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         Returns:
             List of matching contacts
         """
-        cache_key = self.get_cache_key(f"search_{query.lower()}_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"search_{query.lower()}_{owner_id}", owner_id)
 
         cached_contacts = cache.get(cache_key)
-        if cached_contacts:
+        if cached_contacts is not None:
             return cached_contacts
 
         filters = Q(
@@ -103,7 +107,8 @@ class ContactRepository(SoftDeleteRepository[Contact]):
             filters &= Q(owner_id=owner_id)
 
         contacts = list(Contact.objects.filter(filters))
-        cache.set(cache_key, contacts, self.cache_timeout // 2)  # Shorter cache for search
+        # Shorter cache for search
+        cache.set(cache_key, contacts, min(self._timeout_for(contacts), self.cache_timeout // 2))
         return contacts
 
     def get_contacts_by_company(self, company: str, **kwargs) -> List[Contact]:
@@ -117,15 +122,10 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         Returns:
             List of contacts from specified company
         """
-        cache_key = self.get_cache_key(f"company_{company}_{hash(str(kwargs))}")
-
-        cached_contacts = cache.get(cache_key)
-        if cached_contacts:
-            return cached_contacts
-
-        contacts = list(Contact.objects.filter(company__iexact=company, **kwargs))
-        cache.set(cache_key, contacts, self.cache_timeout)
-        return contacts
+        return self.get_cached_id_list(
+            f"company_{company}_{sorted(kwargs.items())}",
+            Contact.objects.filter(company__iexact=company, **kwargs)
+        )
 
     def get_contacts_with_tags(self, tags: List[str], owner_id: Optional[int] = None) -> List[Contact]:
         """
@@ -138,12 +138,6 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         Returns:
             List of contacts with specified tags
         """
-        cache_key = self.get_cache_key(f"tags_{sorted(tags)}_{owner_id}")
-
-        cached_contacts = cache.get(cache_key)
-        if cached_contacts:
-            return cached_contacts
-
         queryset = Contact.objects.all()
         for tag in tags:
             queryset = queryset.filter(tags__contains=[tag])
@@ -151,9 +145,7 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         if owner_id:
             queryset = queryset.filter(owner_id=owner_id)
 
-        contacts = list(queryset)
-        cache.set(cache_key, contacts, self.cache_timeout)
-        return contacts
+        return self.get_cached_id_list(f"tags_{sorted(tags)}_{owner_id}", queryset, owner_id)
 
     def get_recent_contacts(self, days: int = 30, owner_id: Optional[int] = None) -> List[Contact]:
         """
@@ -166,21 +158,15 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         Returns:
             List of recent contacts
         """
-        cache_key = self.get_cache_key(f"recent_{days}_{owner_id}")
-
-        cached_contacts = cache.get(cache_key)
-        if cached_contacts:
-            return cached_contacts
-
         cutoff_date = timezone.now() - timedelta(days=days)
         queryset = Contact.objects.filter(created_at__gte=cutoff_date)
 
         if owner_id:
             queryset = queryset.filter(owner_id=owner_id)
 
-        contacts = list(queryset.order_by('-created_at'))
-        cache.set(cache_key, contacts, self.cache_timeout)
-        return contacts
+        return self.get_cached_id_list(
+            f"recent_{days}_{owner_id}", queryset.order_by('-created_at'), owner_id
+        )
 
     def get_contacts_by_lead_source(self, lead_source: str, **kwargs) -> List[Contact]:
         """
@@ -193,15 +179,10 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         Returns:
             List of contacts from specified lead source
         """
-        cache_key = self.get_cache_key(f"lead_source_{lead_source}_{hash(str(kwargs))}")
-
-        cached_contacts = cache.get(cache_key)
-        if cached_contacts:
-            return cached_contacts
-
-        contacts = list(Contact.objects.filter(lead_source=lead_source, **kwargs))
-        cache.set(cache_key, contacts, self.cache_timeout)
-        return contacts
+        return self.get_cached_id_list(
+            f"lead_source_{lead_source}_{sorted(kwargs.items())}",
+            Contact.objects.filter(lead_source=lead_source, **kwargs)
+        )
 
     def get_active_contacts(self, owner_id: Optional[int] = None) -> List[Contact]:
         """
@@ -213,19 +194,11 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         Returns:
             List of active contacts
         """
-        cache_key = self.get_cache_key(f"active_{owner_id}")
-
-        cached_contacts = cache.get(cache_key)
-        if cached_contacts:
-            return cached_contacts
-
         queryset = Contact.objects.filter(is_active=True)
         if owner_id:
             queryset = queryset.filter(owner_id=owner_id)
 
-        contacts = list(queryset)
-        cache.set(cache_key, contacts, self.cache_timeout)
-        return contacts
+        return self.get_cached_id_list(f"active_{owner_id}", queryset, owner_id)
 
     def get_contact_statistics(self, owner_id: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -237,12 +210,14 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         Returns:
             Dictionary with contact statistics
         """
-        cache_key = self.get_cache_key(f"statistics_{owner_id}")
-
-        cached_stats = cache.get(cache_key)
-        if cached_stats:
-            return cached_stats
+        return self.get_or_compute(
+            f"statistics_{owner_id}",
+            lambda: self._compute_contact_statistics(owner_id),
+            owner_id=owner_id,
+        )
 
+    def _compute_contact_statistics(self, owner_id: Optional[int] = None) -> Dict[str, Any]:
+        """Run the aggregate queries behind get_contact_statistics"""
         queryset = Contact.objects.all()
         if owner_id:
             queryset = queryset.filter(owner_id=owner_id)
@@ -273,10 +248,10 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         thirty_days_ago = timezone.now() - timedelta(days=30)
         recent_contacts = queryset.filter(created_at__gte=thirty_days_ago).count()
 
-        # Average deals per contact
+        # Average deals per contact, counted in the database
         avg_deals_per_contact = 0
         if total_contacts > 0:
-            total_deals = sum(contact.get_deals_count() for contact in queryset)
+            total_deals = queryset.aggregate(total=Count('deals', filter=Q(deals__is_archived=False)))['total']
             avg_deals_per_contact = total_deals / total_contacts
 
         statistics = {
@@ -290,7 +265,6 @@ class ContactRepository(SoftDeleteRepository[Contact]):
             'last_updated': timezone.now(),
         }
 
-        cache.set(cache_key, statistics, self.cache_timeout)
         return statistics
 
     def bulk_create_contacts(self, contacts_data: List[Dict[str, Any]]) -> List[Contact]:
@@ -305,11 +279,6 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         """
         contacts = self.bulk_create(contacts_data)
 
-        # Invalidate cache
-        self._invalidate_cache_pattern("statistics")
-        self._invalidate_cache_pattern("active")
-        self._invalidate_cache_pattern("recent")
-
         logger.info(f"Bulk created {len(contacts)} contacts")
         return contacts
 
@@ -331,10 +300,7 @@ class ContactRepository(SoftDeleteRepository[Contact]):
             contact.save()
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{contact_id}")
-            if hasattr(contact, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{contact.uuid}")
-            self._invalidate_cache_pattern("statistics")
+            self._invalidate_entity_cache(contact)
 
             logger.info(f"Updated tags for contact ID {contact_id}: {old_tags} -> {tags}")
             return True
@@ -349,20 +315,6 @@ class ContactRepository(SoftDeleteRepository[Contact]):
         Args:
             contact: Contact instance
         """
-        cache_keys_to_clear = [
-            f"id_{contact.id}",
-            f"email_{contact.email.lower()}",
-            f"owner_{contact.owner_id}",
-            f"company_{contact.company}",
-            "active",
-            "statistics",
-        ]
-
-        if hasattr(contact, 'uuid'):
-            cache_keys_to_clear.append(f"uuid_{contact.uuid}")
-
-        for key_suffix in cache_keys_to_clear:
-            cache_key = self.get_cache_key(key_suffix)
-            cache.delete(cache_key)
+        self._invalidate_entity_cache(contact)
 
         logger.debug(f"Cleared cache for contact {contact.email}")
\ No newline at end of file
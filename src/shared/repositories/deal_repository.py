@@ -5,16 +5,22 @@ Following SOLID principles and enterprise best practices
 
 from typing import List, Optional, Dict, Any
 from django.db.models import Q, Count, Sum, Avg
+from django.db.models.functions import TruncDate
 from django.core.cache import cache
 from django.utils import timezone
-from datetime import timedelta
+from datetime import timedelta, timezone as dt_timezone
 import logging
 
+import numpy as np
+
 from .base import BaseRepository
 from crm.apps.deals.models import Deal
+from crm.shared.deal_column_store import get_deal_column_store
 
 logger = logging.getLogger(__name__)
 
+CLOSED_STAGES = ['closed_won', 'closed_lost']
+
 
 class DealRepository(BaseRepository[Deal]):
     """
@@ -37,14 +43,14 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             List of deals owned by specified user
         """
-        cache_key = self.get_cache_key(f"owner_{owner_id}_{hash(str(kwargs))}")
+        cache_key = self.get_scoped_cache_key(f"owner_{owner_id}_{sorted(kwargs.items())}", owner_id)
 
         cached_deals = cache.get(cache_key)
-        if cached_deals:
+        if cached_deals is not None:
             return cached_deals
 
         deals = list(Deal.objects.filter(owner_id=owner_id, **kwargs))
-        cache.set(cache_key, deals, self.cache_timeout)
+        cache.set(cache_key, deals, self._timeout_for(deals))
         return deals
 
     def get_by_contact(self, contact_id: int, **kwargs) -> List[Deal]:
@@ -58,14 +64,14 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             List of deals for specified contact
         """
-        cache_key = self.get_cache_key(f"contact_{contact_id}_{hash(str(kwargs))}")
+        cache_key = self.get_scoped_cache_key(f"contact_{contact_id}_{sorted(kwargs.items())}")
 
         cached_deals = cache.get(cache_key)
-        if cached_deals:
+        if cached_deals is not None:
             return cached_deals
 
         deals = list(Deal.objects.filter(contact_id=contact_id, **kwargs))
-        cache.set(cache_key, deals, self.cache_timeout)
+        cache.set(cache_key, deals, self._timeout_for(deals))
         return deals
 
     def get_by_stage(self, stage: str, owner_id: Optional[int] = None) -> List[Deal]:
@@ -79,10 +85,10 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             List of deals in specified stage
         """
-        cache_key = self.get_cache_key(f"stage_{stage}_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"stage_{stage}_{owner_id}", owner_id)
 
         cached_deals = cache.get(cache_key)
-        if cached_deals:
+        if cached_deals is not None:
             return cached_deals
 
         queryset = Deal.objects.filter(stage=stage)
@@ -90,7 +96,7 @@ class DealRepository(BaseRepository[Deal]):
             queryset = queryset.filter(owner_id=owner_id)
 
         deals = list(queryset)
-        cache.set(cache_key, deals, self.cache_timeout)
+        cache.set(cache_key, deals, self._timeout_for(deals))
         return deals
 
     def get_open_deals(self, owner_id: Optional[int] = None) -> List[Deal]:
@@ -103,19 +109,11 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             List of open deals
         """
-        cache_key = self.get_cache_key(f"open_{owner_id}")
-
-        cached_deals = cache.get(cache_key)
-        if cached_deals:
-            return cached_deals
-
-        queryset = Deal.objects.exclude(stage__in=['closed_won', 'closed_lost'])
+        queryset = Deal.objects.exclude(stage__in=CLOSED_STAGES)
         if owner_id:
             queryset = queryset.filter(owner_id=owner_id)
 
-        deals = list(queryset.order_by('-created_at'))
-        cache.set(cache_key, deals, self.cache_timeout)
-        return deals
+        return self.get_cached_id_list(f"open_{owner_id}", queryset.order_by('-created_at'), owner_id)
 
     def get_won_deals(self, owner_id: Optional[int] = None, days: Optional[int] = None) -> List[Deal]:
         """
@@ -128,10 +126,10 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             List of won deals
         """
-        cache_key = self.get_cache_key(f"won_{owner_id}_{days}")
+        cache_key = self.get_scoped_cache_key(f"won_{owner_id}_{days}", owner_id)
 
         cached_deals = cache.get(cache_key)
-        if cached_deals:
+        if cached_deals is not None:
             return cached_deals
 
         queryset = Deal.objects.filter(stage='closed_won')
@@ -143,7 +141,7 @@ class DealRepository(BaseRepository[Deal]):
             queryset = queryset.filter(closed_date__gte=cutoff_date)
 
         deals = list(queryset.order_by('-closed_date'))
-        cache.set(cache_key, deals, self.cache_timeout)
+        cache.set(cache_key, deals, self._timeout_for(deals))
         return deals
 
     def get_lost_deals(self, owner_id: Optional[int] = None, days: Optional[int] = None) -> List[Deal]:
@@ -157,10 +155,10 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             List of lost deals
         """
-        cache_key = self.get_cache_key(f"lost_{owner_id}_{days}")
+        cache_key = self.get_scoped_cache_key(f"lost_{owner_id}_{days}", owner_id)
 
         cached_deals = cache.get(cache_key)
-        if cached_deals:
+        if cached_deals is not None:
             return cached_deals
 
         queryset = Deal.objects.filter(stage='closed_lost')
@@ -172,7 +170,7 @@ class DealRepository(BaseRepository[Deal]):
             queryset = queryset.filter(closed_date__gte=cutoff_date)
 
         deals = list(queryset.order_by('-closed_date'))
-        cache.set(cache_key, deals, self.cache_timeout)
+        cache.set(cache_key, deals, self._timeout_for(deals))
         return deals
 
     def get_closing_soon(self, days: int = 30, owner_id: Optional[int] = None) -> List[Deal]:
@@ -186,10 +184,10 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             List of deals closing soon
         """
-        cache_key = self.get_cache_key(f"closing_soon_{days}_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"closing_soon_{days}_{owner_id}", owner_id)
 
         cached_deals = cache.get(cache_key)
-        if cached_deals:
+        if cached_deals is not None:
             return cached_deals
 
         cutoff_date = timezone.now() + timedelta(days=days)
@@ -202,7 +200,7 @@ class DealRepository(BaseRepository[Deal]):
             queryset = queryset.filter(owner_id=owner_id)
 
         deals = list(queryset.order_by('expected_close_date'))
-        cache.set(cache_key, deals, self.cache_timeout)
+        cache.set(cache_key, deals, self._timeout_for(deals))
         return deals
 
     def get_overdue_deals(self, owner_id: Optional[int] = None) -> List[Deal]:
@@ -215,10 +213,10 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             List of overdue deals
         """
-        cache_key = self.get_cache_key(f"overdue_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"overdue_{owner_id}", owner_id)
 
         cached_deals = cache.get(cache_key)
-        if cached_deals:
+        if cached_deals is not None:
             return cached_deals
 
         queryset = Deal.objects.filter(
@@ -230,7 +228,7 @@ class DealRepository(BaseRepository[Deal]):
             queryset = queryset.filter(owner_id=owner_id)
 
         deals = list(queryset.order_by('expected_close_date'))
-        cache.set(cache_key, deals, self.cache_timeout)
+        cache.set(cache_key, deals, self._timeout_for(deals))
         return deals
 
     def get_deals_by_value_range(self, min_value: float, max_value: float, owner_id: Optional[int] = None) -> List[Deal]:
@@ -245,10 +243,10 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             List of deals within value range
         """
-        cache_key = self.get_cache_key(f"value_{min_value}_{max_value}_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"value_{min_value}_{max_value}_{owner_id}", owner_id)
 
         cached_deals = cache.get(cache_key)
-        if cached_deals:
+        if cached_deals is not None:
             return cached_deals
 
         queryset = Deal.objects.filter(value__gte=min_value, value__lte=max_value)
@@ -256,7 +254,7 @@ class DealRepository(BaseRepository[Deal]):
             queryset = queryset.filter(owner_id=owner_id)
 
         deals = list(queryset.order_by('-value'))
-        cache.set(cache_key, deals, self.cache_timeout)
+        cache.set(cache_key, deals, self._timeout_for(deals))
         return deals
 
     def search_deals(self, query: str, owner_id: Optional[int] = None) -> List[Deal]:
@@ -270,10 +268,10 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             List of matching deals
         """
-        cache_key = self.get_cache_key(f"search_{query.lower()}_{owner_id}")
+        cache_key = self.get_scoped_cache_key(f"search_{query.lower()}_{owner_id}", owner_id)
 
         cached_deals = cache.get(cache_key)
-        if cached_deals:
+        if cached_deals is not None:
             return cached_deals
 
         filters = Q(
@@ -288,7 +286,8 @@ class DealRepository(BaseRepository[Deal]):
             filters &= Q(owner_id=owner_id)
 
         deals = list(Deal.objects.select_related('contact').filter(filters))
-        cache.set(cache_key, deals, self.cache_timeout // 2)  # Shorter cache for search
+        # Shorter cache for search
+        cache.set(cache_key, deals, min(self._timeout_for(deals), self.cache_timeout // 2))
         return deals
 
     def get_deal_statistics(self, owner_id: Optional[int] = None) -> Dict[str, Any]:
@@ -301,25 +300,47 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             Dictionary with deal statistics
         """
-        cache_key = self.get_cache_key(f"statistics_{owner_id}")
+        return self.get_or_compute(
+            f"statistics_{owner_id}",
+            lambda: self._compute_deal_statistics(owner_id),
+            owner_id=owner_id,
+        )
+
+    def _compute_deal_statistics(self, owner_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run the aggregate queries behind get_deal_statistics
 
-        cached_stats = cache.get(cache_key)
-        if cached_stats:
-            return cached_stats
+        Every counter comes from one conditional aggregation pass over the
+        owner's deals; only the stage distribution and the top deals, which
+        have their own result shapes, need a query each.
+        """
+        store = get_deal_column_store()
+        if store is not None:
+            return self._compute_deal_statistics_from_store(store, owner_id)
 
         queryset = Deal.objects.all()
         if owner_id:
             queryset = queryset.filter(owner_id=owner_id)
 
-        # Basic counts
-        total_deals = queryset.count()
-        open_deals = queryset.exclude(stage__in=['closed_won', 'closed_lost']).count()
-        won_deals = queryset.filter(stage='closed_won').count()
-        lost_deals = queryset.filter(stage='closed_lost').count()
-
-        # Value calculations
-        total_pipeline_value = queryset.aggregate(Sum('value'))['value__sum'] or 0
-        won_deals_value = queryset.filter(stage='closed_won').aggregate(Sum('value'))['value__sum'] or 0
+        thirty_days_ago = timezone.now() - timedelta(days=30)
+        won = Q(stage='closed_won')
+
+        totals = queryset.aggregate(
+            total_deals=Count('id'),
+            open_deals=Count('id', filter=~Q(stage__in=CLOSED_STAGES)),
+            won_deals=Count('id', filter=won),
+            lost_deals=Count('id', filter=Q(stage='closed_lost')),
+            total_pipeline_value=Sum('value'),
+            won_deals_value=Sum('value', filter=won),
+            average_deal_size=Avg('value'),
+            recent_deals=Count('id', filter=Q(created_at__gte=thirty_days_ago)),
+            # Whole days between the UTC dates, as the per-deal loop used to compute
+            average_time_to_close=Avg(
+                TruncDate('closed_date', tzinfo=dt_timezone.utc)
+                - TruncDate('created_at', tzinfo=dt_timezone.utc),
+                filter=Q(stage__in=CLOSED_STAGES, closed_date__isnull=False)
+            ),
+        )
 
         # Stage distribution
         stage_stats = list(
@@ -328,51 +349,72 @@ class DealRepository(BaseRepository[Deal]):
             .order_by('stage')
         )
 
-        # Recent deals (last 30 days)
-        thirty_days_ago = timezone.now() - timedelta(days=30)
-        recent_deals = queryset.filter(created_at__gte=thirty_days_ago).count()
-
-        # Average deal size
-        avg_deal_size = queryset.aggregate(Avg('value'))['value__avg'] or 0
-
-        # Conversion rates
-        conversion_rate = (won_deals / total_deals * 100) if total_deals > 0 else 0
-
-        # Average time to close (for closed deals)
-        closed_deals = queryset.filter(stage__in=['closed_won', 'closed_lost'], closed_date__isnull=False)
-        avg_time_to_close = 0
-        if closed_deals.exists():
-            total_days = sum(
-                (deal.closed_date.date() - deal.created_at.date()).days
-                for deal in closed_deals
-            )
-            avg_time_to_close = total_days / closed_deals.count()
-
         # Top deals by value
         top_deals = list(
             queryset.order_by('-value')[:5]
             .values('id', 'title', 'value', 'stage')
         )
 
+        total_deals = totals['total_deals']
+        won_deals = totals['won_deals']
+        conversion_rate = (won_deals / total_deals * 100) if total_deals > 0 else 0
+        time_to_close = totals['average_time_to_close']
+        avg_time_to_close = time_to_close.total_seconds() / 86400 if time_to_close else 0
+
         statistics = {
             'total_deals': total_deals,
-            'open_deals': open_deals,
+            'open_deals': totals['open_deals'],
             'won_deals': won_deals,
-            'lost_deals': lost_deals,
-            'total_pipeline_value': float(total_pipeline_value),
-            'won_deals_value': float(won_deals_value),
+            'lost_deals': totals['lost_deals'],
+            'total_pipeline_value': float(totals['total_pipeline_value'] or 0),
+            'won_deals_value': float(totals['won_deals_value'] or 0),
             'conversion_rate': round(conversion_rate, 2),
-            'average_deal_size': float(avg_deal_size),
+            'average_deal_size': float(totals['average_deal_size'] or 0),
             'average_time_to_close_days': round(avg_time_to_close, 1),
-            'recent_deals': recent_deals,
+            'recent_deals': totals['recent_deals'],
             'stage_distribution': stage_stats,
             'top_deals': top_deals,
             'last_updated': timezone.now(),
         }
 
-        cache.set(cache_key, statistics, self.cache_timeout)
         return statistics
 
+    def _compute_deal_statistics_from_store(self, store, owner_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Answer get_deal_statistics from the in-process column store
+
+        Only the titles of the five top deals are read from the database.
+        """
+        columns = store.select(owner_id or None)
+        totals = store.deal_statistics(owner_id or None)
+
+        top_ids = columns.ids[np.argsort(-columns.value, kind='stable')[:5]].tolist()
+        top_deals = Deal.objects.in_bulk(top_ids)
+        total_deals = totals['total_deals']
+        conversion_rate = (totals['won_deals'] / total_deals * 100) if total_deals > 0 else 0
+
+        return {
+            'total_deals': total_deals,
+            'open_deals': totals['open_deals'],
+            'won_deals': totals['won_deals'],
+            'lost_deals': totals['lost_deals'],
+            'total_pipeline_value': totals['total_pipeline_value'],
+            'won_deals_value': totals['won_deals_value'],
+            'conversion_rate': round(conversion_rate, 2),
+            'average_deal_size': totals['average_deal_size'],
+            'average_time_to_close_days': round(totals['average_time_to_close_days'], 1),
+            'recent_deals': totals['recent_deals'],
+            'stage_distribution': [
+                {'stage': stage, 'count': row['count'], 'total_value': row['total_value']}
+                for stage, row in sorted(store.stage_totals(columns).items())
+            ],
+            'top_deals': [
+                {'id': deal.id, 'title': deal.title, 'value': deal.value, 'stage': deal.stage}
+                for deal in (top_deals[deal_id] for deal_id in top_ids if deal_id in top_deals)
+            ],
+            'last_updated': timezone.now(),
+        }
+
     def get_pipeline_value_by_stage(self, owner_id: Optional[int] = None) -> Dict[str, float]:
         """
         Get pipeline value breakdown by stage
@@ -383,10 +425,17 @@ class DealRepository(BaseRepository[Deal]):
         Returns:
             Dictionary with pipeline values by stage
         """
-        cache_key = self.get_cache_key(f"pipeline_value_{owner_id}")
+        store = get_deal_column_store()
+        if store is not None:
+            # Already in memory; the shared cache would only add a round trip
+            return {
+                stage: row['total_value']
+                for stage, row in sorted(store.stage_totals(store.select(owner_id or None)).items())
+            }
 
+        cache_key = self.get_scoped_cache_key(f"pipeline_value_{owner_id}", owner_id)
         cached_values = cache.get(cache_key)
-        if cached_values:
+        if cached_values is not None:
             return cached_values
 
         queryset = Deal.objects.all()
@@ -404,7 +453,7 @@ class DealRepository(BaseRepository[Deal]):
             for item in stage_values
         }
 
-        cache.set(cache_key, pipeline_values, self.cache_timeout)
+        cache.set(cache_key, pipeline_values, self._timeout_for(pipeline_values))
         return pipeline_values
 
     def update_deal_stage(self, deal_id: int, new_stage: str, changed_by_user_id: Optional[int] = None) -> bool:
@@ -433,11 +482,7 @@ class DealRepository(BaseRepository[Deal]):
             deal.save()
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{deal_id}")
-            if hasattr(deal, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{deal.uuid}")
-            self._invalidate_cache_pattern("statistics")
-            self._invalidate_cache_pattern("pipeline_value")
+            self._invalidate_entity_cache(deal)
 
             logger.info(f"Updated deal {deal_id} stage: {old_stage} -> {new_stage}")
             return True
@@ -461,11 +506,7 @@ class DealRepository(BaseRepository[Deal]):
             deal.close_as_won(final_value)
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{deal_id}")
-            if hasattr(deal, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{deal.uuid}")
-            self._invalidate_cache_pattern("statistics")
-            self._invalidate_cache_pattern("pipeline_value")
+            self._invalidate_entity_cache(deal)
 
             logger.info(f"Closed deal {deal_id} as won")
             return True
@@ -489,11 +530,7 @@ class DealRepository(BaseRepository[Deal]):
             deal.close_as_lost(loss_reason)
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{deal_id}")
-            if hasattr(deal, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{deal.uuid}")
-            self._invalidate_cache_pattern("statistics")
-            self._invalidate_cache_pattern("pipeline_value")
+            self._invalidate_entity_cache(deal)
 
             logger.info(f"Closed deal {deal_id} as lost: {loss_reason}")
             return True
@@ -508,20 +545,6 @@ class DealRepository(BaseRepository[Deal]):
         Args:
             deal: Deal instance
         """
-        cache_keys_to_clear = [
-            f"id_{deal.id}",
-            f"owner_{deal.owner_id}",
-            f"contact_{deal.contact_id}",
-            f"stage_{deal.stage}",
-            "statistics",
-            "pipeline_value",
-        ]
-
-        if hasattr(deal, 'uuid'):
-            cache_keys_to_clear.append(f"uuid_{deal.uuid}")
-
-        for key_suffix in cache_keys_to_clear:
-            cache_key = self.get_cache_key(key_suffix)
-            cache.delete(cache_key)
+        self._invalidate_entity_cache(deal)
 
         logger.debug(f"Cleared cache for deal {deal.title}")
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+In-Process LRU Cache Implementation
+Optional L1 tier in front of the shared Django cache for repository point lookups
+"""
+
+from collections import OrderedDict
+from django.conf import settings
+from typing import Any, Iterable, Optional
+import copy
+import pickle
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+LOCAL_CACHE_ALIAS = 'repository_l1'
+
+
+class LocalLRUCache:
+    """
+    Bounded, size-aware LRU cache living in the worker process.
+
+    Entries expire after a short TTL because writes made by other processes
+    cannot reach this cache; writes made by this process invalidate it
+    directly. Hits, misses and evictions are exported to MetricsCollector.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 8 * 1024 * 1024,
+                 timeout: float = 5, alias: str = LOCAL_CACHE_ALIAS):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.alias = alias
+        self.current_bytes = 0
+        self._entries = OrderedDict()  # key -> (value, size, expires_at)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache
+
+        Returns a shallow copy so callers mutating attributes of a model
+        instance do not leak changes into the shared entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            _record_metric('record_cache_miss', self.alias)
+            return None
+
+        _record_metric('record_cache_hit', self.alias)
+        return copy.copy(entry[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """Set value in cache, evicting least recently used entries as needed"""
+        if value is None:
+            return
+
+        try:
+            size = len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            logger.debug(f"Not caching unpicklable value for {key} locally: {e}")
+            return
+        if size > self.max_bytes:
+            return
+
+        evicted = 0
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic() + self.timeout)
+            self.current_bytes += size
+            while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                evicted += 1
+
+        for _ in range(evicted):
+            _record_metric('record_cache_eviction', self.alias)
+
+    def delete(self, key: str) -> None:
+        """Delete value from cache"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete several values from cache"""
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._remove(key)
+
+    def clear(self, prefix: Optional[str] = None) -> None:
+        """Remove every entry, or only those whose key starts with prefix"""
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+                self.current_bytes = 0
+                return
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry; caller must hold the lock"""
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+
+_local_cache = None
+_local_cache_lock = threading.Lock()
+
+
+def get_local_cache() -> Optional[LocalLRUCache]:
+    """
+    Get the process-wide L1 cache
+
+    Returns:
+        LocalLRUCache instance, or None when REPOSITORY_L1_CACHE_ENABLED is off
+    """
+    global _local_cache
+
+    if not getattr(settings, 'REPOSITORY_L1_CACHE_ENABLED', False):
+        return None
+
+    if _local_cache is None:
+        with _local_cache_lock:
+            if _local_cache is None:
+                _local_cache = LocalLRUCache(
+                    max_entries=getattr(settings, 'REPOSITORY_L1_CACHE_MAX_ENTRIES', 1000),
+                    max_bytes=getattr(settings, 'REPOSITORY_L1_CACHE_MAX_BYTES', 8 * 1024 * 1024),
+                    timeout=getattr(settings, 'REPOSITORY_L1_CACHE_TIMEOUT', 5),
+                )
+    return _local_cache
+
+
+_metrics_collector = None  # resolved on first use; False when monitoring is unavailable
+
+
+def _record_metric(method_name: str, cache_alias: str) -> None:
+    """Forward a cache event to the process MetricsCollector if monitoring is installed"""
+    global _metrics_collector
+
+    if _metrics_collector is None:
+        try:
+            from crm.apps.monitoring.metrics import get_metrics_collector
+            _metrics_collector = get_metrics_collector()
+        except ImportError:
+            _metrics_collector = False
+
+    if _metrics_collector:
+        getattr(_metrics_collector, method_name)(cache_alias)
@@ -7,8 +7,20 @@ from django.core.cache import cache
 from typing import Any, Optional
 import logging
 
+from .cache_generations import CacheGenerations, MODEL_SCOPE
+
 logger = logging.getLogger(__name__)
 
+# Stored in place of "not found" results; a plain string survives pickling
+# through any cache backend unchanged
+NEGATIVE_RESULT = '__negative_cache_result__'
+DEFAULT_NEGATIVE_TIMEOUT = 30
+
+
+def is_negative_result(value: Any) -> bool:
+    """Check whether a cached value is the negative-result sentinel"""
+    return isinstance(value, str) and value == NEGATIVE_RESULT
+
 
 class SimpleCache:
     """
@@ -16,26 +28,44 @@ class SimpleCache:
     Focused on single responsibility: caching
     """
 
-    def __init__(self, prefix: str, timeout: int = 300):
+    def __init__(self, prefix: str, timeout: int = 300, negative_timeout: Optional[int] = None):
         self.prefix = prefix
         self.timeout = timeout
+        self.negative_timeout = (
+            negative_timeout if negative_timeout is not None
+            else min(timeout, DEFAULT_NEGATIVE_TIMEOUT)
+        )
+        self._generations = CacheGenerations(prefix, cache)
 
     def _make_key(self, key: str) -> str:
-        """Generate cache key with prefix"""
-        return f"{self.prefix}{key}"
+        """Generate cache key with prefix and current generation"""
+        generation = self._generations.get(MODEL_SCOPE)
+        return f"{self.prefix}v{generation}_{key}"
 
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache"""
+    def get(self, key: str, default: Any = None) -> Optional[Any]:
+        """
+        Get value from cache
+
+        Returns default on a miss and None on a cached negative result, so
+        callers passing a marker default can tell the two apart.
+        """
         cache_key = self._make_key(key)
         value = cache.get(cache_key)
-        if value:
-            logger.debug(f"Cache hit: {cache_key}")
+        if value is None:
+            return default
+
+        logger.debug(f"Cache hit: {cache_key}")
+        if is_negative_result(value):
+            return None
         return value
 
     def set(self, key: str, value: Any) -> None:
-        """Set value in cache"""
+        """Set value in cache; None is stored as a negative result with a shorter timeout"""
         cache_key = self._make_key(key)
-        cache.set(cache_key, value, self.timeout)
+        if value is None:
+            cache.set(cache_key, NEGATIVE_RESULT, self.negative_timeout)
+        else:
+            cache.set(cache_key, value, self.timeout)
         return value  # Return value for KISS simplicity
 
     def delete(self, key: str) -> None:
@@ -44,9 +74,14 @@ class SimpleCache:
         cache.delete(cache_key)
 
     def clear_pattern(self, pattern: str) -> None:
-        """Clear cache keys matching pattern"""
-        cache_key = self._make_key(pattern)
-        cache.delete(cache_key)
+        """
+        Clear cache keys matching pattern
+
+        Bumps the prefix generation, so every key of this cache is dropped
+        with one atomic increment instead of a key scan.
+        """
+        self._generations.bump(MODEL_SCOPE)
+        logger.debug(f"Cache cleared: {self.prefix}* (pattern {pattern})")
 
 
 class CachedRepositoryMixin:
@@ -59,13 +94,15 @@ class CachedRepositoryMixin:
         super().__init__(*args, **kwargs)
         self.cache = SimpleCache(
             prefix=f"{self.model._meta.model_name}_",
-            timeout=getattr(self, 'cache_timeout', 300)
+            timeout=getattr(self, 'cache_timeout', 300),
+            negative_timeout=getattr(self, 'negative_cache_timeout', None)
         )
 
     def _get_cached_or_fetch(self, cache_key: str, fetch_func, *args, **kwargs):
-        """Generic cached or fetch pattern"""
-        cached = self.cache.get(cache_key)
-        if cached:
+        """Generic cached or fetch pattern; empty and None results are cached too"""
+        missing = object()
+        cached = self.cache.get(cache_key, missing)
+        if cached is not missing:
             return cached
 
         result = fetch_func(*args, **kwargs)
@@ -0,0 +1,102 @@
+"""
+Cache Stampede Protection Implementation
+Single-flight recomputation, probabilistic early refresh and stale-while-revalidate
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from typing import Any, Callable, Optional
+import math
+import random
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def get_or_compute(cache_key: str, compute_func: Callable[[], Any], timeout: int,
+                   stale_key: Optional[str] = None, backend=None) -> Any:
+    """
+    Get a cached value, recomputing it with stampede protection
+
+    Values are stored in an envelope recording when they expire and how long
+    they took to compute. Readers refresh early with a probability that grows
+    as expiry approaches (XFetch), weighted by the compute cost, so expensive
+    keys are usually refreshed before they disappear. Only the worker holding
+    the recompute lock runs compute_func; the others serve the current or the
+    last known (stale) value, or wait briefly for the winner.
+
+    Args:
+        cache_key: Cache key for the fresh value
+        compute_func: Callable producing the value on a miss
+        timeout: Freshness lifetime in seconds
+        stale_key: Optional key keeping the last value for
+            stale-while-revalidate; it outlives the fresh value's timeout
+        backend: Cache backend (defaults to the Django cache)
+
+    Returns:
+        Cached or freshly computed value
+    """
+    backend = backend if backend is not None else cache
+    beta = getattr(settings, 'REPOSITORY_CACHE_XFETCH_BETA', 1.0)
+    lock_key = f"lock_{cache_key}"
+
+    envelope = backend.get(cache_key)
+    if envelope is not None:
+        # XFetch: log(random()) is negative, so this pulls "now" forward
+        early = time.time() - envelope['delta'] * beta * math.log(random.random() or 1e-12)
+        if early < envelope['expiry']:
+            return envelope['value']
+        if not _acquire(backend, lock_key):
+            return envelope['value']
+        logger.debug(f"Early refresh of {cache_key}")
+        return _recompute(backend, cache_key, stale_key, lock_key, compute_func, timeout)
+
+    if _acquire(backend, lock_key):
+        return _recompute(backend, cache_key, stale_key, lock_key, compute_func, timeout)
+
+    # Another worker is recomputing: serve the last known value if we have one
+    if stale_key:
+        stale = backend.get(stale_key)
+        if stale is not None:
+            logger.debug(f"Serving stale value for {cache_key} while it is recomputed")
+            return stale['value']
+
+    wait_seconds = getattr(settings, 'REPOSITORY_CACHE_LOCK_WAIT', 2.0)
+    deadline = time.monotonic() + wait_seconds
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        envelope = backend.get(cache_key)
+        if envelope is not None:
+            return envelope['value']
+
+    # The lock holder is too slow or died; compute without caching contention
+    logger.warning(f"Timed out waiting for recompute of {cache_key}")
+    return compute_func()
+
+
+def _acquire(backend, lock_key: str) -> bool:
+    """Try to take the single-flight lock for a key"""
+    return backend.add(lock_key, 1, getattr(settings, 'REPOSITORY_CACHE_LOCK_TIMEOUT', 30))
+
+
+def _recompute(backend, cache_key: str, stale_key: Optional[str], lock_key: str,
+               compute_func: Callable[[], Any], timeout: int) -> Any:
+    """Run compute_func under the lock and store the result"""
+    try:
+        started = time.time()
+        value = compute_func()
+        finished = time.time()
+
+        envelope = {
+            'value': value,
+            'delta': finished - started,
+            'expiry': finished + timeout,
+        }
+        backend.set(cache_key, envelope, timeout)
+        if stale_key:
+            stale_factor = getattr(settings, 'REPOSITORY_CACHE_STALE_FACTOR', 10)
+            backend.set(stale_key, envelope, timeout * stale_factor)
+        return value
+    finally:
+        backend.delete(lock_key)
@@ -10,7 +10,7 @@ from django.core.cache import cache
 from django.utils import timezone
 import logging
 
-from .base import BaseRepository
+from .base import BaseRepository, CACHE_MISS
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -26,6 +26,13 @@ class UserRepository(BaseRepository[User]):
         """Initialize user repository"""
         super().__init__(User, cache_timeout)
 
+    def _get_entity_cache_keys(self, user: User) -> List[str]:
+        """Include the email lookup key"""
+        keys = super()._get_entity_cache_keys(user)
+        if user.email:
+            keys.append(f"email_{user.email.lower()}")
+        return keys
+
     def get_by_email(self, email: str, use_cache: bool = True) -> Optional[User]:
         """
         Get user by email (case-insensitive)
@@ -37,22 +44,23 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User instance or None
         """
-        cache_key = self.get_cache_key(f"email_{email.lower()}")
+        key = f"email_{email.lower()}"
 
         if use_cache:
-            cached_user = cache.get(cache_key)
-            if cached_user:
+            cache_key, cached_user = self._get_cached_point(key)
+            if cached_user is not CACHE_MISS:
                 logger.debug(f"Cache hit for user email {email}")
                 return cached_user
 
         try:
             user = User.objects.get(email__iexact=email)
-            if use_cache:
-                cache.set(cache_key, user, self.cache_timeout)
-            return user
         except User.DoesNotExist:
             logger.debug(f"User with email {email} not found")
-            return None
+            user = None
+
+        if use_cache:
+            self._set_cached_point(key, cache_key, user)
+        return user
 
     def get_active_users(self, use_cache: bool = False) -> List[User]:
         """
@@ -64,16 +72,16 @@ class UserRepository(BaseRepository[User]):
         Returns:
             List of active users
         """
-        cache_key = self.get_cache_key("active_users")
+        cache_key = self.get_scoped_cache_key("active_users")
 
         if use_cache:
             cached_users = cache.get(cache_key)
-            if cached_users:
+            if cached_users is not None:
                 return cached_users
 
         users = list(User.objects.filter(is_active=True))
         if use_cache:
-            cache.set(cache_key, users, self.cache_timeout)
+            cache.set(cache_key, users, self._timeout_for(users))
         return users
 
     def get_users_by_role(self, role: str) -> List[User]:
@@ -86,13 +94,13 @@ class UserRepository(BaseRepository[User]):
         Returns:
             List of users with specified role
         """
-        cache_key = self.get_cache_key(f"role_{role}")
+        cache_key = self.get_scoped_cache_key(f"role_{role}")
         cached_users = cache.get(cache_key)
-        if cached_users:
+        if cached_users is not None:
             return cached_users
 
         users = list(User.objects.filter(role=role, is_active=True))
-        cache.set(cache_key, users, self.cache_timeout)
+        cache.set(cache_key, users, self._timeout_for(users))
         return users
 
     def search_users(self, query: str) -> List[User]:
@@ -105,10 +113,10 @@ class UserRepository(BaseRepository[User]):
         Returns:
             List of matching users
         """
-        cache_key = self.get_cache_key(f"search_{query.lower()}")
+        cache_key = self.get_scoped_cache_key(f"search_{query.lower()}")
 
         cached_users = cache.get(cache_key)
-        if cached_users:
+        if cached_users is not None:
             return cached_users
 
         users = list(User.objects.filter(
@@ -118,7 +126,8 @@ class UserRepository(BaseRepository[User]):
             Q(company__icontains=query)
         ).filter(is_active=True))
 
-        cache.set(cache_key, users, self.cache_timeout // 2)  # Shorter cache for search
+        # Shorter cache for search
+        cache.set(cache_key, users, min(self._timeout_for(users), self.cache_timeout // 2))
         return users
 
     def create_user(self, email: str, password: str, **kwargs) -> User:
@@ -140,9 +149,7 @@ class UserRepository(BaseRepository[User]):
         )
 
         # Invalidate cache
-        self._invalidate_cache_pattern("active_users")
-        self._invalidate_cache_pattern(f"role_{user.role}")
-        self._invalidate_cache_pattern(f"email_{email.lower()}")
+        self._invalidate_entity_cache(user)
 
         logger.info(f"Created user with email {email}")
         return user
@@ -166,9 +173,7 @@ class UserRepository(BaseRepository[User]):
         )
 
         # Invalidate cache
-        self._invalidate_cache_pattern("active_users")
-        self._invalidate_cache_pattern("role_admin")
-        self._invalidate_cache_pattern(f"email_{email.lower()}")
+        self._invalidate_entity_cache(superuser)
 
         logger.info(f"Created superuser with email {email}")
         return superuser
@@ -190,10 +195,7 @@ class UserRepository(BaseRepository[User]):
             user.save()
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{user_id}")
-            if hasattr(user, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{user.uuid}")
-            self._invalidate_cache_pattern(f"email_{user.email.lower()}")
+            self._invalidate_entity_cache(user)
 
             logger.info(f"Updated password for user ID {user_id}")
             return True
@@ -217,12 +219,7 @@ class UserRepository(BaseRepository[User]):
             user.save()
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{user_id}")
-            if hasattr(user, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{user.uuid}")
-            self._invalidate_cache_pattern(f"email_{user.email.lower()}")
-            self._invalidate_cache_pattern("active_users")
-            self._invalidate_cache_pattern(f"role_{user.role}")
+            self._invalidate_entity_cache(user)
 
             logger.info(f"Deactivated user ID {user_id}")
             return True
@@ -246,12 +243,7 @@ class UserRepository(BaseRepository[User]):
             user.save()
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{user_id}")
-            if hasattr(user, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{user.uuid}")
-            self._invalidate_cache_pattern(f"email_{user.email.lower()}")
-            self._invalidate_cache_pattern("active_users")
-            self._invalidate_cache_pattern(f"role_{user.role}")
+            self._invalidate_entity_cache(user)
 
             logger.info(f"Activated user ID {user_id}")
             return True
@@ -275,9 +267,7 @@ class UserRepository(BaseRepository[User]):
             user.save(update_fields=['last_login'])
 
             # Invalidate cache
-            self._invalidate_cache_pattern(f"id_{user_id}")
-            if hasattr(user, 'uuid'):
-                self._invalidate_cache_pattern(f"uuid_{user.uuid}")
+            self._invalidate_entity_cache(user)
 
             logger.debug(f"Updated last login for user ID {user_id}")
             return True
@@ -296,17 +286,17 @@ class UserRepository(BaseRepository[User]):
         Returns:
             List of users created in date range
         """
-        cache_key = self.get_cache_key(f"created_{start_date}_{end_date}")
+        cache_key = self.get_scoped_cache_key(f"created_{start_date}_{end_date}")
 
         cached_users = cache.get(cache_key)
-        if cached_users:
+        if cached_users is not None:
             return cached_users
 
         users = list(User.objects.filter(
             date_joined__range=[start_date, end_date]
         ).order_by('-date_joined'))
 
-        cache.set(cache_key, users, self.cache_timeout)
+        cache.set(cache_key, users, self._timeout_for(users))
         return users
 
     def get_user_statistics(self) -> Dict[str, Any]:
@@ -316,12 +306,10 @@ class UserRepository(BaseRepository[User]):
         Returns:
             Dictionary with user statistics
         """
-        cache_key = self.get_cache_key("statistics")
-
-        cached_stats = cache.get(cache_key)
-        if cached_stats:
-            return cached_stats
+        return self.get_or_compute("statistics", self._compute_user_statistics)
 
+    def _compute_user_statistics(self) -> Dict[str, Any]:
+        """Run the aggregate queries behind get_user_statistics"""
         total_users = User.objects.count()
         active_users = User.objects.filter(is_active=True).count()
         admin_users = User.objects.filter(role='admin', is_active=True).count()
@@ -349,7 +337,6 @@ class UserRepository(BaseRepository[User]):
             'last_updated': timezone.now(),
         }
 
-        cache.set(cache_key, statistics, self.cache_timeout)
         return statistics
 
     def bulk_create_users(self, users_data: List[Dict[str, Any]]) -> List[User]:
@@ -369,8 +356,7 @@ class UserRepository(BaseRepository[User]):
             users.append(user)
 
         # Invalidate cache
-        self._invalidate_cache_pattern("active_users")
-        self._invalidate_cache_pattern("statistics")
+        self._invalidate_entity_cache(*users)
 
         logger.info(f"Bulk created {len(users)} users")
         return users
@@ -382,19 +368,6 @@ class UserRepository(BaseRepository[User]):
         Args:
             user: User instance
         """
-        cache_keys_to_clear = [
-            f"id_{user.id}",
-            f"email_{user.email.lower()}",
-            "active_users",
-            f"role_{user.role}",
-            "statistics",
-        ]
-
-        if hasattr(user, 'uuid'):
-            cache_keys_to_clear.append(f"uuid_{user.uuid}")
-
-        for key_suffix in cache_keys_to_clear:
-            cache_key = self.get_cache_key(key_suffix)
-            cache.delete(cache_key)
+        self._invalidate_entity_cache(user)
 
         logger.debug(f"Cleared cache for user {user.email}")
\ No newline at end of file
@@ -338,11 +338,27 @@ class ActivityService(BaseService[Activity]):
         if not activity:
             raise NotFoundError(f"Activity with ID {activity_id} not found")
 
+        user = User.objects.get(id=user_id) if user_id else None
+        self._complete_loaded_activity(activity, user, notes)
+
+        return self.repository.get_by_id(activity_id)
+
+    def _complete_loaded_activity(self, activity: Activity, user: Optional[User], notes: Optional[str] = None) -> None:
+        """
+        Complete an already loaded activity on behalf of an already loaded user
+
+        Args:
+            activity: Activity to complete
+            user: User completing the activity, or None to skip the permission check
+            notes: Optional completion notes
+
+        Raises:
+            ValidationError: If activity cannot be completed
+            PermissionError: If user doesn't have permission
+        """
         # Check permissions
-        if user_id:
-            user = User.objects.get(id=user_id)
-            if activity.owner_id != user_id and not user.is_admin():
-                raise PermissionError("You can only complete your own activities")
+        if user and activity.owner_id != user.id and not user.is_admin():
+            raise PermissionError("You can only complete your own activities")
 
         # Validate that activity can be completed
         if activity.is_completed:
@@ -350,12 +366,10 @@ class ActivityService(BaseService[Activity]):
         elif activity.is_cancelled:
             raise ValidationError("Cannot complete a cancelled activity")
 
-        success = self.repository.complete_activity(activity_id, notes)
+        success = self.repository.complete_activity(activity.id, notes)
         if not success:
             raise ValidationError("Failed to complete activity")
 
-        return self.repository.get_by_id(activity_id)
-
     def cancel_activity(self, activity_id: int, user_id: int = None) -> Activity:
         """
         Cancel an activity with business logic
@@ -591,10 +605,22 @@ class ActivityService(BaseService[Activity]):
             'errors': []
         }
 
+        # Resolve activities with one multi-get instead of per item
+        activities = {activity.id: activity for activity in self.repository.get_many_by_ids(activity_ids)}
+        user = None
+
         for activity_id in activity_ids:
             try:
-                completed_activity = self.complete_activity(activity_id, user_id=user_id)
-                results['completed'].append(completed_activity.id)
+                activity = activities.get(activity_id)
+                if not activity:
+                    raise NotFoundError(f"Activity with ID {activity_id} not found")
+
+                # An unknown user fails each item rather than the whole call
+                if user_id and user is None:
+                    user = User.objects.get(id=user_id)
+
+                self._complete_loaded_activity(activity, user)
+                results['completed'].append(activity_id)
             except Exception as e:
                 results['failed'].append(activity_id)
                 results['errors'].append(str(e))
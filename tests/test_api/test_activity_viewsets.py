@@ -6,7 +6,7 @@ Following SOLID principles and comprehensive test coverage
 
 import pytest
 from datetime import datetime, timedelta
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.utils import timezone
@@ -944,6 +944,33 @@ class ActivityViewSetCustomActionsTests(ActivityViewSetTestCase):
         self.assertIn('completion_rate', data)
         self.assertIn('activities_by_type', data)
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_activity_statistics_cached_until_activity_write(self):
+        """Test statistics come from two grouped queries and are cached until an activity changes"""
+        from django.core.cache import cache
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        cache.clear()
+        stats_url = reverse('activity-statistics')
+        with CaptureQueriesContext(connection) as queries:
+            data = self.client.get(stats_url).json()
+        aggregate_queries = [query for query in queries if '"activities"' in query['sql']]
+        self.assertEqual(len(aggregate_queries), 2)
+        self.assertEqual(data['activities_by_type']['call']['count'], 1)
+        self.assertEqual(data['activities_by_priority']['medium']['count'], 1)
+        self.assertEqual(data['activities_by_type']['email']['count'], 0)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(stats_url)
+        self.assertFalse([query for query in queries if '"activities"' in query['sql']])
+
+        self.activity.is_completed = True
+        self.activity.save()
+        data = self.client.get(stats_url).json()
+        self.assertEqual(data['completed_activities'], 1)
+        self.assertEqual(data['completion_rate'], 100.0)
+
 
 class ActivityViewSetIntegrationTests(ActivityViewSetTestCase):
     """Integration tests for Activity ViewSet"""
@@ -8,7 +8,7 @@ import pytest
 from decimal import Decimal
 from datetime import date, timedelta, datetime
 from unittest.mock import patch, MagicMock
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.utils import timezone
@@ -167,6 +167,65 @@ class DealViewSetListTests(DealViewSetTestCase):
         self.assertIn('previous', data)
         self.assertEqual(len(data['results']), 20)  # Default page size
 
+    def test_list_deals_with_cursor_pagination(self):
+        """Test keyset pagination walks every deal once, newest first, without a count"""
+        for i in range(25):
+            Deal.objects.create(
+                owner=self.user,
+                contact=self.contact,
+                title=f'Deal {i}',
+                value=Decimal(f'{(i+1)*1000}.00'),
+                stage='prospect',
+                expected_close_date=date.today() + timedelta(days=30)
+            )
+
+        response = self.client.get(self.list_url, {'pagination': 'cursor', 'page_size': 10})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertNotIn('count', data)
+        self.assertIsNone(data['previous'])
+
+        seen = [deal['id'] for deal in data['results']]
+        while data['next']:
+            data = self.client.get(data['next']).json()
+            seen.extend(deal['id'] for deal in data['results'])
+
+        expected = list(
+            Deal.objects.filter(owner=self.user).order_by('-created_at', '-id').values_list('id', flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+        response = self.client.get(self.list_url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_deals_query_count_is_constant(self):
+        """Test the list query profile loads contacts without per-row queries"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        def list_query_count():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.list_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries)
+
+        for i in range(3):
+            Deal.objects.create(
+                owner=self.user, contact=self.contact, title=f'Deal {i}',
+                value=Decimal('1000.00'), expected_close_date=date.today() + timedelta(days=30)
+            )
+        baseline = list_query_count()
+
+        for i in range(10):
+            contact = Contact.objects.create(
+                first_name='Extra', last_name=str(i), email=f'extra{i}@example.com', owner=self.user
+            )
+            Deal.objects.create(
+                owner=self.user, contact=contact, title=f'Extra Deal {i}',
+                value=Decimal('1000.00'), expected_close_date=date.today() + timedelta(days=30)
+            )
+        self.assertEqual(list_query_count(), baseline)
+
     def test_list_deals_with_search(self):
         """Test list endpoint with search functionality"""
         # Create additional deals
@@ -824,6 +883,30 @@ class DealViewSetCustomActionsTests(DealViewSetTestCase):
         self.assertIn('win_rate', data)
         self.assertIn('deals_by_stage', data)
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_pipeline_statistics_cached_until_deal_write(self):
+        """Test the pipeline rollup is cached per owner and dropped on deal writes"""
+        from django.core.cache import cache
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        cache.clear()
+        stats_url = reverse('deal-pipeline-statistics')
+        first = self.client.get(stats_url).json()
+        self.assertEqual(len(first['deals_by_month']), 6)
+
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.client.get(stats_url).json()
+        self.assertEqual(cached, first)
+        self.assertFalse(any('deals' in query['sql'] for query in queries.captured_queries))
+
+        Deal.objects.create(
+            owner=self.user, contact=self.contact, title='Fresh Deal',
+            value=Decimal('500.00'), expected_close_date=date.today() + timedelta(days=30)
+        )
+        refreshed = self.client.get(stats_url).json()
+        self.assertEqual(refreshed['total_deals'], first['total_deals'] + 1)
+
     def test_deal_forecast_action(self):
         """Test deal forecast action"""
         forecast_url = reverse('deal-forecast')
@@ -836,6 +919,43 @@ class DealViewSetCustomActionsTests(DealViewSetTestCase):
         self.assertIn('deals_count', data)
         self.assertIn('weighted_value', data)
 
+    def test_deal_funnel_action(self):
+        """Test funnel analytics count stage changes in the window"""
+        self.deal.stage = 'proposal'
+        self.deal.save()
+        self.deal.stage = 'closed_lost'
+        self.deal.save()
+
+        funnel_url = reverse('deal-funnel')
+        response = self.client.get(funnel_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        stages = {row['stage']: row for row in response.json()['stages']}
+        self.assertEqual(stages['qualified']['advanced'], 1)
+        self.assertEqual(stages['proposal']['entered'], 1)
+        self.assertEqual(stages['proposal']['lost'], 1)
+        self.assertEqual(stages['proposal']['drop_off_rate'], 100.0)
+        self.assertEqual(stages['closed_lost']['still_in_stage'], 1)
+
+        response = self.client.get(funnel_url, {'start_date': '2024-02-01', 'end_date': '2024-01-01'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_deal_forecast_simulation_mode(self):
+        """Test simulation mode adds reproducible P10/P50/P90 revenue"""
+        forecast_url = reverse('deal-forecast')
+        params = {'period': 'current_year', 'mode': 'simulation', 'iterations': 500, 'seed': 7}
+        response = self.client.get(forecast_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        simulation = response.json()['simulation']
+        self.assertEqual(simulation['iterations'], 500)
+        self.assertLessEqual(Decimal(simulation['p10']), Decimal(simulation['p50']))
+        self.assertLessEqual(Decimal(simulation['p50']), Decimal(simulation['p90']))
+        self.assertEqual(self.client.get(forecast_url, params).json()['simulation'], simulation)
+
+        response = self.client.get(forecast_url, {'mode': 'guess'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_get_deal_activities_action(self):
         """Test get deal activities action"""
         from crm.apps.activities.models import Activity
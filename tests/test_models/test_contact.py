@@ -241,6 +241,41 @@ class ContactModelTest(TestCase):
         # Act & Assert
         self.assertIsNone(contact.get_latest_activity())
 
+    def test_contact_annotated_stats_avoid_per_row_queries(self):
+        """Test annotated contacts answer deal and activity lookups without queries"""
+        from decimal import Decimal
+        from datetime import timedelta
+        from crm.apps.deals.models import Deal
+        from crm.apps.activities.models import Activity
+
+        # Arrange
+        contact = Contact.objects.create(**self.contact_data)
+        for value in ('100.00', '250.50'):
+            Deal.objects.create(
+                title='Deal', value=Decimal(value), contact=contact, owner=self.user,
+                expected_close_date=timezone.now().date() + timedelta(days=30)
+            )
+        # Archived deals are hidden from the contact's deals, annotated or not
+        Deal.objects.create(
+            title='Archived deal', value=Decimal('999.00'), contact=contact, owner=self.user,
+            expected_close_date=timezone.now().date() + timedelta(days=30), is_archived=True
+        )
+        Activity.objects.create(
+            type='call', title='Intro call', contact=contact, owner=self.user,
+            scheduled_at=timezone.now() + timedelta(days=1)
+        )
+
+        # Act
+        annotated = Contact.objects.with_deal_stats().with_latest_activity().get(pk=contact.pk)
+
+        # Assert
+        with self.assertNumQueries(0):
+            self.assertEqual(annotated.get_deals_count(), 2)
+            self.assertEqual(annotated.get_total_deal_value(), Decimal('350.50'))
+            self.assertEqual(annotated.get_latest_activity().title, 'Intro call')
+        self.assertEqual(contact.get_deals_count(), 2)
+        self.assertEqual(contact.get_total_deal_value(), Decimal('350.50'))
+
     def test_contact_manager_methods(self):
         """Test custom manager methods"""
         # Arrange
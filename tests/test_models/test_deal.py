@@ -14,7 +14,7 @@ import uuid
 from decimal import Decimal
 
 from crm.apps.contacts.models import Contact
-from crm.apps.deals.models import Deal, DealStageHistory
+from crm.apps.deals.models import Deal, DealDailySnapshot, DealStageHistory
 
 User = get_user_model()
 
@@ -500,4 +500,90 @@ class DealStageHistoryModelTest(TestCase):
         # Assert
         histories = list(DealStageHistory.objects.all())
         self.assertEqual(histories[0], history2)
-        self.assertEqual(histories[1], history1)
\ No newline at end of file
+        self.assertEqual(histories[1], history1)
+
+class DealDailySnapshotModelTest(TestCase):
+    """Test DealDailySnapshot incremental maintenance and backfill"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            email='sales@example.com',
+            first_name='Sales',
+            last_name='User',
+            password='testpass123'
+        )
+
+        self.contact = Contact.objects.create(
+            first_name='John',
+            last_name='Client',
+            email='client@example.com',
+            owner=self.user
+        )
+
+    def _create_deal(self, value):
+        return Deal.objects.create(
+            title='Test Deal',
+            value=Decimal(value),
+            stage='prospect',
+            expected_close_date=timezone.now().date() + timezone.timedelta(days=30),
+            contact=self.contact,
+            owner=self.user
+        )
+
+    def _snapshot(self):
+        return {
+            (row.stage, row.currency): (row.deal_count, row.total_value)
+            for row in DealDailySnapshot.objects.as_of(timezone.localdate(), self.user.id)
+            if row.deal_count
+        }
+
+    def test_snapshot_follows_deal_writes(self):
+        """Test saves, stage changes and deletes move the deal between snapshot groups"""
+        # Arrange
+        deal = self._create_deal('1000.00')
+        other = self._create_deal('500.00')
+
+        # Act
+        deal.stage = 'qualified'
+        deal.save()
+        other.delete()
+
+        # Assert
+        self.assertEqual(self._snapshot(), {('qualified', 'USD'): (1, Decimal('1000.00'))})
+        row = DealDailySnapshot.objects.get(stage='qualified', date=timezone.localdate())
+        self.assertEqual(row.weighted_value, Decimal('250.00'))
+
+    def test_unarchiving_deal_restores_snapshot(self):
+        """Test an archived deal can be saved again and rejoins the snapshot"""
+        # Arrange
+        deal = self._create_deal('1000.00')
+        deal.is_archived = True
+        deal.save()
+        archived = self._snapshot()
+
+        # Act
+        deal.is_archived = False
+        deal.save()
+
+        # Assert
+        self.assertEqual(archived, {})
+        self.assertEqual(self._snapshot(), {('prospect', 'USD'): (1, Decimal('1000.00'))})
+
+    def test_backfill_matches_incremental_snapshot(self):
+        """Test the backfill command rebuilds the same state the incremental path keeps"""
+        from io import StringIO
+        from django.core.management import call_command
+
+        # Arrange
+        deal = self._create_deal('1000.00')
+        self._create_deal('2000.00')
+        deal.stage = 'qualified'
+        deal.save()
+        incremental = self._snapshot()
+
+        # Act
+        call_command('backfill_deal_snapshots', stdout=StringIO())
+
+        # Assert
+        self.assertEqual(self._snapshot(), incremental)
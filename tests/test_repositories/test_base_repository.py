@@ -57,7 +57,9 @@ class BaseRepositoryTest(TestCase):
         cache_key = self.repository.get_cache_key("test_key")
 
         # Assert
-        self.assertEqual(cache_key, "testmodel_test_key")
+        self.assertTrue(cache_key.startswith("testmodel_v"))
+        self.assertTrue(cache_key.endswith("_test_key"))
+        self.assertEqual(cache_key, self.repository.get_cache_key("test_key"))
 
     @patch('crm.shared.repositories.base.cache')
     def test_get_by_id_cache_hit(self, mock_cache):
@@ -71,7 +73,7 @@ class BaseRepositoryTest(TestCase):
 
         # Assert
         self.assertEqual(result, mock_entity)
-        mock_cache.get.assert_called_once_with('testmodel_id_1')
+        mock_cache.get.assert_called_once_with(self.repository.get_cache_key('id_1'))
 
     @patch('crm.shared.repositories.base.cache')
     @patch.object(TestModel.objects, 'get')
@@ -88,9 +90,9 @@ class BaseRepositoryTest(TestCase):
 
         # Assert
         self.assertEqual(result, mock_entity)
-        mock_cache.get.assert_called_once_with('testmodel_id_1')
+        mock_cache.get.assert_called_once_with(self.repository.get_cache_key('id_1'))
         mock_get.assert_called_once_with(id=1)
-        mock_cache.set.assert_called_once_with('testmodel_id_1', mock_entity, 300)
+        mock_cache.set.assert_called_once_with(self.repository.get_cache_key('id_1'), mock_entity, 300)
 
     @patch.object(TestModel.objects, 'get')
     def test_get_by_id_not_found(self, mock_get):
@@ -142,7 +144,7 @@ class BaseRepositoryTest(TestCase):
 
         # Assert
         self.assertEqual(result, mock_entities)
-        mock_cache.get.assert_called_once_with('testmodel_all')
+        mock_cache.get.assert_called_once_with(self.repository.get_scoped_cache_key('all'))
 
     @patch.object(TestModel.objects, 'all')
     def test_get_all_without_cache(self, mock_all):
@@ -344,23 +346,16 @@ class BaseRepositoryTest(TestCase):
                 self.assertTrue(result['pagination']['has_next'])
                 self.assertFalse(result['pagination']['has_previous'])
 
-    @patch('crm.shared.repositories.base.cache')
-    def test_invalidate_cache_pattern(self, mock_cache):
-        """Test cache invalidation"""
-        # Act
-        self.repository._invalidate_cache_pattern("test_pattern")
-
-        # Assert
-        mock_cache.delete.assert_called_once_with('testmodel_test_pattern')
-
-    @patch('crm.shared.repositories.base.cache')
-    def test_clear_cache(self, mock_cache):
+    def test_clear_cache(self):
         """Test clearing all cache"""
+        # Arrange
+        cache.set(self.repository.get_scoped_cache_key("all"), ['stale'], 300)
+
         # Act
         self.repository.clear_cache()
 
         # Assert
-        mock_cache.delete.assert_called_once_with('testmodel_all')
+        self.assertIsNone(cache.get(self.repository.get_scoped_cache_key("all")))
 
 
 class SoftDeleteRepositoryTest(TestCase):
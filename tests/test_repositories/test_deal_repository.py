@@ -5,9 +5,10 @@ Following enterprise-grade testing standards with comprehensive coverage
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.db.models import Count, Sum
 from django.utils import timezone
 from datetime import timedelta, date
 from decimal import Decimal
@@ -560,4 +561,67 @@ class DealRepositoryIntegrationTest(TestCase):
         self.assertEqual(stats['open_deals'], 2)
         self.assertEqual(stats['won_deals'], 1)
         self.assertEqual(stats['lost_deals'], 1)
-        self.assertEqual(stats['conversion_rate'], 25.0)  # 1 won out of 4 total
\ No newline at end of file
+        self.assertEqual(stats['conversion_rate'], 25.0)  # 1 won out of 4 total
+
+class DealColumnStoreTest(TestCase):
+    """Test the in-process deal column store against database aggregates"""
+
+    def setUp(self):
+        """Set up test data"""
+        from crm.shared.deal_column_store import DealColumnStore
+
+        self.user = User.objects.create_user(
+            email='store@example.com',
+            password='testpass123',
+            first_name='Store',
+            last_name='User'
+        )
+        self.contact = Contact.objects.create(
+            first_name='Jane',
+            last_name='Doe',
+            email='jane.doe@example.com',
+            owner=self.user
+        )
+        self.deals = [
+            Deal.objects.create(
+                title=f'Deal {i}',
+                value=Decimal(f'{(i + 1) * 1000}.00'),
+                stage=stage,
+                contact=self.contact,
+                owner=self.user,
+                expected_close_date=date.today() + timedelta(days=30)
+            )
+            for i, stage in enumerate(['prospect', 'prospect', 'proposal'])
+        ]
+        self.store = DealColumnStore(refresh_interval=0)
+
+    def _database_stage_totals(self):
+        rows = Deal.objects.filter(owner=self.user).values('stage').annotate(
+            count=Count('id'), total_value=Sum('value')
+        )
+        return {row['stage']: {'count': row['count'], 'total_value': float(row['total_value'])} for row in rows}
+
+    def test_stage_totals_match_database(self):
+        """Test stage totals from the columns equal the GROUP BY result"""
+        columns = self.store.select(self.user.id)
+        self.assertEqual(self.store.stage_totals(columns), self._database_stage_totals())
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_refresh_applies_writes_since_watermark(self):
+        """Test updates, archiving and deletes reach the columns on refresh"""
+        cache.clear()
+        self.store.columns()
+
+        self.deals[0].value = Decimal('9000.00')
+        self.deals[0].save()
+        self.deals[1].is_archived = True
+        self.deals[1].save()
+        Deal.objects.create(
+            title='Late Deal', value=Decimal('500.00'), stage='qualified',
+            contact=self.contact, owner=self.user,
+            expected_close_date=date.today() + timedelta(days=30)
+        )
+        self.assertEqual(self.store.stage_totals(self.store.select(self.user.id)), self._database_stage_totals())
+
+        self.deals[2].delete()
+        self.assertEqual(self.store.stage_totals(self.store.select(self.user.id)), self._database_stage_totals())
@@ -0,0 +1,148 @@
+"""
+Repository Cache Tests - Test-Driven Development Approach
+Testing the generation-versioned caching and streaming of shared.repositories.base
+"""
+
+from unittest.mock import Mock, patch
+from django.test import TestCase, override_settings
+from django.core.cache import cache
+
+from crm.apps.contacts.models import Contact
+from shared.repositories.base import BaseRepository
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class RepositoryCacheTest(TestCase):
+    """Test BaseRepository cache keys and invalidation against a real cache"""
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        self.repository = BaseRepository(Contact)
+
+    def tearDown(self):
+        """Clean up after tests"""
+        cache.clear()
+
+    def test_get_scoped_cache_key_generation(self):
+        """Test owner scoped keys differ per owner and from unscoped keys"""
+        # Act
+        owner_key = self.repository.get_scoped_cache_key("statistics", owner_id=1)
+        other_owner_key = self.repository.get_scoped_cache_key("statistics", owner_id=2)
+        all_key = self.repository.get_scoped_cache_key("statistics")
+
+        # Assert
+        self.assertEqual(len({owner_key, other_owner_key, all_key}), 3)
+        self.assertEqual(self.repository.get_scoped_cache_key("statistics", owner_id=1), owner_key)
+
+    @patch.object(Contact.objects, 'get')
+    def test_get_by_id_not_found_is_cached(self, mock_get):
+        """Test a missing ID is cached as a negative entry until the entity is created"""
+        # Arrange
+        mock_get.side_effect = Contact.DoesNotExist()
+
+        # Act
+        first = self.repository.get_by_id(999)
+        second = self.repository.get_by_id(999)
+
+        # Assert - the second lookup is served from the negative entry
+        self.assertIsNone(first)
+        self.assertIsNone(second)
+        mock_get.assert_called_once_with(id=999)
+
+        # Creating the entity drops the negative entry
+        created = Contact(id=999)
+        self.repository._invalidate_entity_cache(created)
+        mock_get.side_effect = None
+        mock_get.return_value = created
+        self.assertEqual(self.repository.get_by_id(999), created)
+
+    @patch.object(Contact.objects, 'filter')
+    def test_get_many_by_ids(self, mock_filter):
+        """Test multi-get uses cached entities, one query for misses, and keeps order"""
+        # Arrange
+        cached_entity = Contact(id=2)
+        loaded_entity = Contact(id=1)
+        cache.set(self.repository.get_cache_key('id_2'), cached_entity, 300)
+        mock_filter.return_value = [loaded_entity]
+
+        # Act
+        result = self.repository.get_many_by_ids([1, 2, 3])
+
+        # Assert
+        self.assertEqual([entity.id for entity in result], [1, 2])
+        mock_filter.assert_called_once_with(id__in=[1, 3])
+        self.assertIsNotNone(cache.get(self.repository.get_cache_key('id_1')))
+
+    @patch.object(Contact.objects, 'filter')
+    def test_get_cached_id_list(self, mock_filter):
+        """Test list queries cache only IDs and hydrate through the per-ID cache"""
+        # Arrange
+        entities = [Contact(id=3), Contact(id=1)]
+
+        # Act
+        first = self.repository.get_cached_id_list('recent', entities)
+        second = self.repository.get_cached_id_list('recent', [])
+
+        # Assert
+        self.assertEqual(cache.get(self.repository.get_scoped_cache_key('recent')), [3, 1])
+        self.assertEqual([entity.id for entity in first], [3, 1])
+        self.assertEqual([entity.id for entity in second], [3, 1])
+        mock_filter.assert_not_called()
+
+    def test_invalidate_cache_pattern(self):
+        """Test cache invalidation advances the model generation"""
+        # Arrange
+        point_key = self.repository.get_cache_key("id_1")
+        scoped_key = self.repository.get_scoped_cache_key("owner_1", owner_id=1)
+
+        # Act
+        self.repository._invalidate_cache_pattern("test_pattern")
+
+        # Assert
+        self.assertNotEqual(self.repository.get_cache_key("id_1"), point_key)
+        self.assertNotEqual(self.repository.get_scoped_cache_key("owner_1", owner_id=1), scoped_key)
+
+    def test_invalidate_entity_cache_bumps_owner_scope_only(self):
+        """Test an entity write invalidates its owner's keys but not other owners'"""
+        # Arrange
+        entity = Contact(id=1, owner_id=1)
+        point_key = self.repository.get_cache_key("id_1")
+        owner_key = self.repository.get_scoped_cache_key("owner_1", owner_id=1)
+        other_owner_key = self.repository.get_scoped_cache_key("owner_2", owner_id=2)
+        all_key = self.repository.get_scoped_cache_key("statistics")
+        cache.set(point_key, entity, 300)
+
+        # Act
+        self.repository._invalidate_entity_cache(entity)
+
+        # Assert
+        self.assertIsNone(cache.get(point_key))
+        self.assertNotEqual(self.repository.get_scoped_cache_key("owner_1", owner_id=1), owner_key)
+        self.assertNotEqual(self.repository.get_scoped_cache_key("statistics"), all_key)
+        self.assertEqual(self.repository.get_scoped_cache_key("owner_2", owner_id=2), other_owner_key)
+
+
+class RepositoryStreamingTest(TestCase):
+    """Test BaseRepository streaming reads"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.repository = BaseRepository(Contact)
+
+    def test_iter_filtered_streams_projection(self):
+        """Test iter_filtered uses a values() projection and a server-side cursor"""
+        # Arrange
+        mock_queryset = Mock()
+        rows = [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}]
+        mock_queryset.values.return_value.iterator.return_value = iter(rows)
+
+        with patch.object(self.repository, 'filter', return_value=mock_queryset) as mock_filter:
+            # Act
+            result = list(self.repository.iter_filtered(chunk_size=500, fields=['id', 'name'], is_active=True))
+
+        # Assert
+        self.assertEqual(result, rows)
+        mock_filter.assert_called_once_with(is_active=True)
+        mock_queryset.values.assert_called_once_with('id', 'name')
+        mock_queryset.values.return_value.iterator.assert_called_once_with(chunk_size=500)
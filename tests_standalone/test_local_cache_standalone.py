@@ -0,0 +1,120 @@
+"""
+Standalone Local LRU Cache Tests - No Django Dependencies
+Tests the in-process L1 cache used in front of the repository cache
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add the project to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+class TestLocalLRUCacheStandalone(unittest.TestCase):
+    """Test LocalLRUCache implementation without Django dependencies"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.metrics = Mock()
+        metrics_patch = patch('shared.repositories.local_cache._metrics_collector', self.metrics)
+        metrics_patch.start()
+        self.addCleanup(metrics_patch.stop)
+
+        from shared.repositories.local_cache import LocalLRUCache
+        self.cache = LocalLRUCache(max_entries=3, max_bytes=10_000, timeout=60)
+
+    def test_cache_set_and_get(self):
+        """Test basic set and get records a hit"""
+        # Act
+        self.cache.set('contact_id_1', {'id': 1})
+        result = self.cache.get('contact_id_1')
+
+        # Assert
+        self.assertEqual(result, {'id': 1})
+        self.metrics.record_cache_hit.assert_called_once_with('repository_l1')
+
+    def test_cache_get_returns_copy(self):
+        """Test mutating a returned value does not change the cached entry"""
+        # Arrange
+        self.cache.set('contact_id_1', {'id': 1})
+
+        # Act
+        self.cache.get('contact_id_1')['id'] = 2
+
+        # Assert
+        self.assertEqual(self.cache.get('contact_id_1'), {'id': 1})
+
+    def test_cache_miss_records_metric(self):
+        """Test a missing key returns None and records a miss"""
+        # Act
+        result = self.cache.get('contact_id_404')
+
+        # Assert
+        self.assertIsNone(result)
+        self.metrics.record_cache_miss.assert_called_once_with('repository_l1')
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test entry limit evicts the least recently used key"""
+        # Arrange
+        for i in range(3):
+            self.cache.set(f'key_{i}', i)
+        self.cache.get('key_0')  # key_1 is now the least recently used
+
+        # Act
+        self.cache.set('key_3', 3)
+
+        # Assert
+        self.assertIsNone(self.cache.get('key_1'))
+        self.assertEqual(self.cache.get('key_0'), 0)
+        self.metrics.record_cache_eviction.assert_called_once_with('repository_l1')
+
+    def test_cache_evicts_by_size(self):
+        """Test byte budget evicts entries and skips oversized values"""
+        # Arrange
+        from shared.repositories.local_cache import LocalLRUCache
+        cache = LocalLRUCache(max_entries=100, max_bytes=1_000, timeout=60)
+
+        # Act
+        cache.set('big', 'x' * 2_000)
+        cache.set('a', 'x' * 600)
+        cache.set('b', 'x' * 600)
+
+        # Assert
+        self.assertIsNone(cache.get('big'))
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('b'))
+        self.assertLessEqual(cache.current_bytes, 1_000)
+
+    def test_cache_entries_expire(self):
+        """Test entries expire after the TTL"""
+        # Arrange
+        self.cache.set('contact_id_1', {'id': 1})
+
+        # Act
+        with patch('shared.repositories.local_cache.time.monotonic', return_value=10 ** 9):
+            result = self.cache.get('contact_id_1')
+
+        # Assert
+        self.assertIsNone(result)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_cache_delete_many_and_clear_prefix(self):
+        """Test explicit invalidation paths"""
+        # Arrange
+        self.cache.set('contact_id_1', 1)
+        self.cache.set('contact_id_2', 2)
+        self.cache.set('deal_id_1', 3)
+
+        # Act
+        self.cache.delete_many(['contact_id_1'])
+        self.cache.clear('contact_')
+
+        # Assert
+        self.assertIsNone(self.cache.get('contact_id_2'))
+        self.assertEqual(self.cache.get('deal_id_1'), 3)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
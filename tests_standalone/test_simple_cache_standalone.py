@@ -37,6 +37,21 @@ class MockDjangoCache:
         self.data.pop(key, None)
         self.expirations.pop(key, None)
 
+    def get_many(self, keys):
+        return {key: self.get(key) for key in keys if self.get(key) is not None}
+
+    def add(self, key, value, timeout=None):
+        if self.get(key) is not None:
+            return False
+        self.set(key, value, timeout)
+        return True
+
+    def incr(self, key, delta=1):
+        if self.get(key) is None:
+            raise ValueError(f"Key '{key}' not found")
+        self.data[key] += delta
+        return self.data[key]
+
 
 class TestSimpleCacheStandalone(unittest.TestCase):
     """Test SimpleCache implementation without Django dependencies"""
@@ -66,7 +81,7 @@ class TestSimpleCacheStandalone(unittest.TestCase):
 
         # Assert
         self.assertEqual(retrieved_value, value)
-        self.assertEqual(self.mock_django_cache.data['test_test_key'], value)
+        self.assertEqual(self.mock_django_cache.data[self.cache._make_key('test_key')], value)
 
     def test_cache_key_prefixing(self):
         """Test that cache keys are properly prefixed"""
@@ -78,7 +93,8 @@ class TestSimpleCacheStandalone(unittest.TestCase):
         self.cache.set(key, value)
 
         # Assert - Check the actual cache key
-        expected_cache_key = 'test_user_data'
+        generation = self.cache._generations.get('model')
+        expected_cache_key = f'test_v{generation}_user_data'
         self.assertIn(expected_cache_key, self.mock_django_cache.data)
         self.assertEqual(self.mock_django_cache.data[expected_cache_key], value)
 
@@ -109,7 +125,7 @@ class TestSimpleCacheStandalone(unittest.TestCase):
 
         # Assert
         self.assertIsNone(result)
-        self.assertNotIn('test_delete_test', self.mock_django_cache.data)
+        self.assertNotIn(self.cache._make_key('delete_test'), self.mock_django_cache.data)
 
     def test_cache_clear_pattern(self):
         """Test clearing cache pattern"""
@@ -127,11 +143,38 @@ class TestSimpleCacheStandalone(unittest.TestCase):
         self.assertIsNotNone(self.cache.get(key2))
 
         # Act
-        self.cache.clear_pattern('user_123')
+        self.cache.clear_pattern('user_')
 
-        # Assert
+        # Assert - one generation bump drops every key of the cache
         self.assertIsNone(self.cache.get(key1))
-        self.assertIsNotNone(self.cache.get(key2))
+        self.assertIsNone(self.cache.get(key2))
+
+    def test_cache_clear_pattern_leaves_other_prefixes(self):
+        """Test clearing one cache does not touch caches with another prefix"""
+        # Arrange
+        other_cache = self.cache.__class__(prefix='other_', timeout=300)
+        self.cache.set('user_123', {'id': 123})
+        other_cache.set('user_123', {'id': 123})
+
+        # Act
+        self.cache.clear_pattern('user_')
+
+        # Assert
+        self.assertIsNone(self.cache.get('user_123'))
+        self.assertEqual(other_cache.get('user_123'), {'id': 123})
+
+    def test_cache_clear_pattern_recovers_evicted_generation(self):
+        """Test clearing still works after the generation counter was evicted"""
+        # Arrange
+        self.cache.set('user_123', {'id': 123})
+        self.mock_django_cache.data.pop('gen_test_model')
+
+        # Act
+        self.cache.clear_pattern('user_')
+        self.cache.set('user_123', {'id': 456})
+
+        # Assert
+        self.assertEqual(self.cache.get('user_123'), {'id': 456})
 
     def test_cache_timeout_configuration(self):
         """Test cache timeout configuration"""
@@ -158,6 +201,24 @@ class TestSimpleCacheStandalone(unittest.TestCase):
         # Assert
         self.assertIsNone(result)  # This is expected behavior
 
+    def test_cache_none_value_is_negative_entry(self):
+        """Test None is cached as a negative entry with the shorter timeout"""
+        # Arrange
+        marker = object()
+        cache_instance = self.cache.__class__(prefix='neg_', timeout=300, negative_timeout=10)
+
+        # Act
+        cache_instance.set('missing', None)
+
+        # Assert - a negative hit is None, a real miss returns the default
+        self.assertIsNone(cache_instance.get('missing', marker))
+        self.assertIs(cache_instance.get('never_set', marker), marker)
+        self.assertEqual(self.cache.negative_timeout, 30)
+
+        stored_key = cache_instance._make_key('missing')
+        remaining = self.mock_django_cache.expirations[stored_key] - time.time()
+        self.assertLessEqual(remaining, 10)
+
     def test_cache_with_complex_data_types(self):
         """Test caching complex data types"""
         # Arrange
@@ -374,6 +435,30 @@ class TestCachedRepositoryMixinStandalone(unittest.TestCase):
         cached_result = repository.cache.get(cache_key)
         self.assertEqual(cached_result, fresh_data)
 
+    def test_cached_or_fetch_pattern_caches_none(self):
+        """Test a None result is served from cache without fetching again"""
+        # Arrange
+        from shared.repositories.simple_cache import CachedRepositoryMixin
+
+        class TestRepository(CachedRepositoryMixin):
+            model = Mock()
+            model._meta = Mock()
+            model._meta.model_name = 'test'
+            negative_cache_timeout = 5
+
+        repository = TestRepository()
+        mock_fetch_func = Mock(return_value=None)
+
+        # Act
+        first = repository._get_cached_or_fetch('test_missing', mock_fetch_func, 1)
+        second = repository._get_cached_or_fetch('test_missing', mock_fetch_func, 1)
+
+        # Assert
+        self.assertIsNone(first)
+        self.assertIsNone(second)
+        mock_fetch_func.assert_called_once_with(1)
+        self.assertEqual(repository.cache.negative_timeout, 5)
+
 
 if __name__ == '__main__':
     # Run the tests
@@ -0,0 +1,117 @@
+"""
+Standalone Stampede Protection Tests - No Django Dependencies
+Tests single-flight recompute, early refresh and stale-while-revalidate
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add the project to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from test_simple_cache_standalone import MockDjangoCache
+
+
+class TestGetOrComputeStandalone(unittest.TestCase):
+    """Test get_or_compute without Django dependencies"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.backend = MockDjangoCache()
+        settings_patch = patch(
+            'shared.repositories.stampede.settings',
+            SimpleNamespace(REPOSITORY_CACHE_LOCK_WAIT=0.1)
+        )
+        settings_patch.start()
+        self.addCleanup(settings_patch.stop)
+
+        from shared.repositories.stampede import get_or_compute
+        self.get_or_compute = get_or_compute
+
+    def test_miss_computes_and_caches(self):
+        """Test a miss computes once and later reads are served from cache"""
+        # Arrange
+        compute = Mock(return_value={'total': 3})
+
+        # Act
+        first = self.get_or_compute('stats', compute, 300, backend=self.backend)
+        second = self.get_or_compute('stats', compute, 300, backend=self.backend)
+
+        # Assert
+        self.assertEqual(first, {'total': 3})
+        self.assertEqual(second, {'total': 3})
+        compute.assert_called_once()
+        self.assertNotIn('lock_stats', self.backend.data)
+
+    def test_zero_valued_result_is_a_hit(self):
+        """Test falsy results are cached like any other value"""
+        # Arrange
+        compute = Mock(return_value={})
+
+        # Act
+        self.get_or_compute('stats', compute, 300, backend=self.backend)
+        self.get_or_compute('stats', compute, 300, backend=self.backend)
+
+        # Assert
+        compute.assert_called_once()
+
+    def test_locked_miss_serves_stale_value(self):
+        """Test a worker that loses the lock serves the last known value"""
+        # Arrange
+        self.get_or_compute('stats_v1', Mock(return_value='old'), 300, 'stats_stale', self.backend)
+        self.backend.set('lock_stats_v2', 1)
+        compute = Mock(return_value='new')
+
+        # Act
+        result = self.get_or_compute('stats_v2', compute, 300, 'stats_stale', self.backend)
+
+        # Assert
+        self.assertEqual(result, 'old')
+        compute.assert_not_called()
+
+    def test_locked_miss_without_stale_value_falls_back_to_compute(self):
+        """Test waiting gives up and computes when the lock holder never finishes"""
+        # Arrange
+        self.backend.set('lock_stats', 1)
+        compute = Mock(return_value='fresh')
+
+        # Act
+        result = self.get_or_compute('stats', compute, 300, backend=self.backend)
+
+        # Assert
+        self.assertEqual(result, 'fresh')
+        compute.assert_called_once()
+
+    def test_expiring_entry_is_refreshed_early(self):
+        """Test XFetch refreshes an entry whose expiry has effectively been reached"""
+        # Arrange
+        self.backend.set('stats', {'value': 'old', 'delta': 1.0, 'expiry': 0})
+        compute = Mock(return_value='new')
+
+        # Act
+        result = self.get_or_compute('stats', compute, 300, backend=self.backend)
+
+        # Assert
+        self.assertEqual(result, 'new')
+        self.assertEqual(self.backend.get('stats')['value'], 'new')
+
+    def test_early_refresh_skipped_while_locked(self):
+        """Test only the lock holder refreshes; others keep the current value"""
+        # Arrange
+        self.backend.set('stats', {'value': 'old', 'delta': 1.0, 'expiry': 0})
+        self.backend.set('lock_stats', 1)
+        compute = Mock(return_value='new')
+
+        # Act
+        result = self.get_or_compute('stats', compute, 300, backend=self.backend)
+
+        # Assert
+        self.assertEqual(result, 'old')
+        compute.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)